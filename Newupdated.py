@@ -4,178 +4,808 @@
 # (LinkedIn & Naukri) - Responsive Design
 # ===============================================
 
-from flask import Flask, render_template_string, request, redirect, url_for, flash
-from playwright.sync_api import sync_playwright
-import time, os, csv, json, webbrowser, random, threading
+from flask import Flask, render_template_string, request, redirect, url_for, flash, session, jsonify, Response, stream_with_context, abort, send_from_directory
+import time, os, csv, json, webbrowser, random, threading, queue, re, hashlib, zlib, math, sys, zipfile, html, sqlite3, io, gzip, glob, shutil, atexit, cProfile, pstats, copy
+import abc
+import logging, logging.handlers
+from collections import OrderedDict, Counter, deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from contextlib import nullcontext
 from dotenv import load_dotenv
 from pathlib import Path
 from werkzeug.utils import secure_filename
+from markupsafe import Markup
 from urllib.parse import urlencode, quote, urlparse, parse_qs
+from html.parser import HTMLParser
 
 # ---------------- Configuration ----------------
 SETTINGS_FILE = "settings.json"
 UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx'}
 LOG_FILE = "applied_jobs_log.csv"
+PROFILES_DIR = "profiles"
+DEFAULT_PROFILE = "default"
+# "record" captures every browser session to HAR files, "replay" serves pages from them offline
+HAR_MODE = os.getenv("HAR_MODE", "").strip().lower()
+HAR_DIR = os.getenv("HAR_DIR", "hars")
+
+DEFAULT_SETTINGS = {
+    "LINKEDIN_EMAIL": "",
+    "LINKEDIN_PASSWORD": "",
+    "NAUKRI_EMAIL": "",
+    "NAUKRI_PASSWORD": "",
+    "RESUME_PATH": "",
+    "LOCATION": "India",
+    "KEYWORDS": "MIS Executive;Business Analyst",
+    "APPLY_TITLE_KEYWORDS": "MIS;Business Analyst",
+    "HEADLESS": False,
+    "CHROME_PATH": r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    "USE_CHROME_PROFILE": True,
+    "CHROME_PROFILE_PATH": "",
+    "USE_REMOTE_DEBUGGING": False,
+    "PREWARM_BROWSER": False,
+    "HTTP_FETCH": False,
+    "PREFETCH": False,
+    "PREFETCH_BUDGET": 12
+}
+
+# ---------------- Logging ----------------
+# JSON lines with rotation; the console gets the plain message
+LOG_DIR = os.getenv("LOG_DIR", "logs")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").strip().upper()
+LOG_CONSOLE_LEVEL = os.getenv("LOG_CONSOLE", "INFO").strip().upper()
+JSON_LOG_MAX_MB = float(os.getenv("JSON_LOG_MAX_MB", "10") or 10)
+JSON_LOG_BACKUPS = int(os.getenv("JSON_LOG_BACKUPS", "5") or 5)
+# Share of noisy per-card / per-job messages that are kept
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "0.1") or 0)
+
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to the writer thread with their message and traceback already rendered"""
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "msg": record.getMessage(),
+            "func": record.funcName,
+            "thread": record.threadName
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class StructuredLogger:
+    """``logging`` with searchable fields: ``log.info("✅ Done", platform="LinkedIn", count=3)``.
+
+    Fields become top-level keys of the JSON record (``platform``,
+    ``query``, ``stage``, ``duration_ms``, ``count``...). Callers only pay
+    for putting a record on a queue; formatting and writing happen on the
+    log writer thread, which is started by the first message. ``sample=True``
+    marks a message logged once per card or job: only ``LOG_SAMPLE_RATE`` of
+    those are kept, each tagged with the rate, and the rest are just counted
+    (see ``summary``).
+    """
+
+    def __init__(self, name):
+        self.logger = logging.getLogger(name)
+        self.dropped = Counter()
+
+    def log(self, level, msg, sample=False, exc_info=None, **fields):
+        if not logging_started:
+            setup_logging()
+        if not self.logger.isEnabledFor(level):
+            return
+        if sample:
+            if random.random() >= LOG_SAMPLE_RATE:
+                self.dropped[fields.get("stage", "")] += 1
+                return
+            fields["sampled"] = LOG_SAMPLE_RATE
+        # Point funcName/lineno at our caller's caller, past this wrapper
+        self.logger.log(level, msg, exc_info=exc_info, extra={"fields": fields}, stacklevel=3)
+
+    def debug(self, msg, **fields):
+        self.log(logging.DEBUG, msg, **fields)
+
+    def info(self, msg, **fields):
+        self.log(logging.INFO, msg, **fields)
+
+    def warning(self, msg, **fields):
+        self.log(logging.WARNING, msg, **fields)
+
+    def error(self, msg, **fields):
+        self.log(logging.ERROR, msg, **fields)
+
+    def exception(self, msg, **fields):
+        self.log(logging.ERROR, msg, exc_info=True, **fields)
+
+    def summary(self):
+        """Sampled-out messages per stage"""
+        dropped = dict(self.dropped)
+        return {"sample_rate": LOG_SAMPLE_RATE, "dropped": dropped, "dropped_total": sum(dropped.values())}
+
+log = StructuredLogger("job_dashboard")
+log_listener = None
+# Set once, so messages logged after stop_logging() at exit don't start a new writer
+logging_started = False
+logging_lock = threading.Lock()
+
+def setup_logging():
+    """Route the dashboard's log records through a queue to a background writer.
+
+    Runs on the first message rather than at import, so importing the
+    module creates no ``logs/`` directory and no thread.
+    """
+    global logging_started
+    with logging_lock:
+        if logging_started:
+            return
+        logging_started = True
+        _start_logging()
+
+def _start_logging():
+    global log_listener
+    handlers = []
+    try:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            os.path.join(LOG_DIR, "dashboard.jsonl"), maxBytes=int(JSON_LOG_MAX_MB * 2**20), backupCount=JSON_LOG_BACKUPS,
+            encoding="utf-8", delay=True)
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+    except OSError as e:
+        sys.stderr.write(f"Could not open log directory {LOG_DIR}: {e}\n")
+    if LOG_CONSOLE_LEVEL != "OFF":
+        console = logging.StreamHandler(sys.stdout)
+        console.setLevel(LOG_CONSOLE_LEVEL)
+        console.setFormatter(logging.Formatter("%(message)s"))
+        handlers.append(console)
+    
+    records = queue.SimpleQueue()
+    log.logger.setLevel(LOG_LEVEL)
+    log.logger.propagate = False
+    log.logger.addHandler(LogQueueHandler(records))
+    log_listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(stop_logging)
+
+def stop_logging():
+    """Write out what's still queued and stop the writer thread"""
+    global log_listener
+    listener, log_listener = log_listener, None
+    if listener is not None:
+        listener.stop()
 
 # ---------------- Settings Management ----------------
-def load_settings():
-    if os.path.exists(SETTINGS_FILE):
+def profile_dir(profile=DEFAULT_PROFILE):
+    return os.path.join(PROFILES_DIR, profile)
+
+def settings_path(profile=DEFAULT_PROFILE):
+    """The default profile keeps using the top-level settings.json"""
+    if profile == DEFAULT_PROFILE:
+        return SETTINGS_FILE
+    return os.path.join(profile_dir(profile), "settings.json")
+
+def load_settings(profile=DEFAULT_PROFILE):
+    path = settings_path(profile)
+    if os.path.exists(path):
         try:
-            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+            with open(path, "r", encoding="utf-8") as f:
                 return json.load(f)
         except Exception as e:
-            print(f"Error loading settings: {e}")
-    return {
-        "LINKEDIN_EMAIL": "",
-        "LINKEDIN_PASSWORD": "",
-        "NAUKRI_EMAIL": "",
-        "NAUKRI_PASSWORD": "",
-        "RESUME_PATH": "",
-        "LOCATION": "India",
-        "KEYWORDS": "MIS Executive;Business Analyst",
-        "APPLY_TITLE_KEYWORDS": "MIS;Business Analyst",
-        "HEADLESS": False,
-        "CHROME_PATH": r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-        "USE_CHROME_PROFILE": True,
-        "CHROME_PROFILE_PATH": "",
-        "USE_REMOTE_DEBUGGING": False
-    }
+            log.error(f"Error loading settings: {e}", stage="settings", profile=profile)
+    return dict(DEFAULT_SETTINGS)
 
-def save_settings(data: dict):
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
+def save_settings(data: dict, profile=DEFAULT_PROFILE):
+    path = settings_path(profile)
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
 
 # ---------------- Initialize ----------------
+# Only cheap work happens at import time; files and the browser are created on
+# first use so the dashboard can serve its first page immediately.
 load_dotenv()
-if not os.path.exists(UPLOAD_FOLDER):
-    os.makedirs(UPLOAD_FOLDER)
-
-def reload_settings():
-    """Reload settings from file"""
-    global LINKEDIN_EMAIL, LINKEDIN_PASSWORD, NAUKRI_EMAIL, NAUKRI_PASSWORD
-    global RESUME_PATH, LOCATION, KEYWORDS, APPLY_TITLE_KEYWORDS, HEADLESS
-    global USE_CHROME_PROFILE, CHROME_PROFILE_PATH, CHROME_PATH, USE_REMOTE_DEBUGGING
-    
-    settings = load_settings()
-    LINKEDIN_EMAIL = settings.get("LINKEDIN_EMAIL", "") or os.getenv("LINKEDIN_EMAIL", "")
-    LINKEDIN_PASSWORD = settings.get("LINKEDIN_PASSWORD", "") or os.getenv("LINKEDIN_PASSWORD", "")
-    NAUKRI_EMAIL = settings.get("NAUKRI_EMAIL", "") or os.getenv("NAUKRI_EMAIL", "")
-    NAUKRI_PASSWORD = settings.get("NAUKRI_PASSWORD", "") or os.getenv("NAUKRI_PASSWORD", "")
-    RESUME_PATH = settings.get("RESUME_PATH", "") or os.getenv("RESUME_PATH", "")
-    LOCATION = settings.get("LOCATION", "India")
-    KEYWORDS = settings.get("KEYWORDS", "MIS Executive;Business Analyst").split(";")
-    HEADLESS = settings.get("HEADLESS", False)
-    APPLY_TITLE_KEYWORDS = [k.strip().lower() for k in settings.get("APPLY_TITLE_KEYWORDS", "MIS;Business Analyst").split(";") if k.strip()]
-    CHROME_PATH = settings.get("CHROME_PATH", r"C:\Program Files\Google\Chrome\Application\chrome.exe")
-    USE_CHROME_PROFILE = settings.get("USE_CHROME_PROFILE", True)
-    CHROME_PROFILE_PATH = settings.get("CHROME_PROFILE_PATH", "")
-    USE_REMOTE_DEBUGGING = settings.get("USE_REMOTE_DEBUGGING", False)
-
-reload_settings()
-
-APPLY_TITLE_KEYWORDS = [k.strip().lower() for k in APPLY_TITLE_KEYWORDS if k.strip()]
-
-# Initialize log file
-if not Path(LOG_FILE).exists():
-    with open(LOG_FILE, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Platform", "Keyword", "Location", "Job_Title", "Job_URL", "Status", "Timestamp"])
+
+def ensure_log_file():
+    """Create the application log with its header row if it doesn't exist"""
+    if not Path(LOG_FILE).exists():
+        with open(LOG_FILE, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Platform", "Keyword", "Location", "Job_Title", "Job_URL", "Status", "Timestamp"])
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+# ---------------- User Profiles ----------------
+class Profile:
+    """A named user with its own settings, credentials, login state and results"""
+
+    def __init__(self, name):
+        self.name = name
+        self.watermarks = WatermarkStore(os.path.join(profile_dir(name), "watermarks.json"))
+        self.reload()
+
+    @property
+    def jobs(self):
+        """Results of this profile's latest search"""
+        return result_store.current(self.name)
+
+    @property
+    def state_path(self):
+        """Playwright storage state (cookies + local storage) saved after login"""
+        return os.path.join(profile_dir(self.name), "storage_state.json")
+
+    def reload(self):
+        """Reload settings from file"""
+        settings = load_settings(self.name)
+        # .env credentials belong to whoever runs the deployment, so only the
+        # default profile falls back to them
+        if self.name == DEFAULT_PROFILE:
+            env = os.getenv
+        else:
+            env = lambda key, default="": default
+
+        self.settings = settings
+        self.linkedin_email = settings.get("LINKEDIN_EMAIL", "") or env("LINKEDIN_EMAIL", "")
+        self.linkedin_password = settings.get("LINKEDIN_PASSWORD", "") or env("LINKEDIN_PASSWORD", "")
+        self.naukri_email = settings.get("NAUKRI_EMAIL", "") or env("NAUKRI_EMAIL", "")
+        self.naukri_password = settings.get("NAUKRI_PASSWORD", "") or env("NAUKRI_PASSWORD", "")
+        self.resume_path = settings.get("RESUME_PATH", "") or env("RESUME_PATH", "")
+        self.location = settings.get("LOCATION", "India")
+        self.keywords = [k.strip() for k in settings.get("KEYWORDS", "MIS Executive;Business Analyst").split(";") if k.strip()]
+        self.headless = settings.get("HEADLESS", False)
+        self.apply_title_keywords = [k.strip().lower() for k in settings.get("APPLY_TITLE_KEYWORDS", "MIS;Business Analyst").split(";") if k.strip()]
+        self.chrome_path = settings.get("CHROME_PATH", r"C:\Program Files\Google\Chrome\Application\chrome.exe")
+        self.use_chrome_profile = settings.get("USE_CHROME_PROFILE", True)
+        self.chrome_profile_path = settings.get("CHROME_PROFILE_PATH", "")
+        self.use_remote_debugging = settings.get("USE_REMOTE_DEBUGGING", False)
+        # Direct HTTP requests bypass the HAR recorder and router, so they're off in HAR mode
+        self.http_fetch = settings.get("HTTP_FETCH", False) and not HAR_MODE
+        self.prefetch = settings.get("PREFETCH", False)
+        try:
+            self.prefetch_budget = max(0, int(settings.get("PREFETCH_BUDGET", 12)))
+        except (TypeError, ValueError):
+            self.prefetch_budget = 12
+
+    @property
+    def linkedin_configured(self):
+        return bool(self.linkedin_email and self.linkedin_password)
+
+    @property
+    def naukri_configured(self):
+        return bool(self.naukri_email and self.naukri_password)
+
+profiles = {}
+profiles_lock = threading.Lock()
+
+def valid_profile_name(name):
+    return bool(name) and secure_filename(name) == name and len(name) <= 40
+
+def list_profiles():
+    names = {DEFAULT_PROFILE}
+    if os.path.isdir(PROFILES_DIR):
+        for entry in os.listdir(PROFILES_DIR):
+            if os.path.exists(settings_path(entry)):
+                names.add(entry)
+    return sorted(names, key=lambda n: (n != DEFAULT_PROFILE, n.lower()))
+
+def get_profile(name=DEFAULT_PROFILE):
+    """Get the cached Profile for ``name``, falling back to the default profile"""
+    if name != DEFAULT_PROFILE and not (valid_profile_name(name) and os.path.exists(settings_path(name))):
+        name = DEFAULT_PROFILE
+    with profiles_lock:
+        if name not in profiles:
+            profiles[name] = Profile(name)
+        return profiles[name]
+
+def create_profile(name):
+    if not valid_profile_name(name):
+        raise ValueError(f"Invalid profile name: {name!r}")
+    if not os.path.exists(settings_path(name)):
+        settings = dict(DEFAULT_SETTINGS)
+        # Browser-level options are shared, everything user-specific starts empty
+        for key in ("HEADLESS", "CHROME_PATH", "USE_REMOTE_DEBUGGING"):
+            settings[key] = load_settings(DEFAULT_PROFILE).get(key, settings[key])
+        settings["USE_CHROME_PROFILE"] = False
+        save_settings(settings, name)
+    return get_profile(name)
+
+def current_profile():
+    """Profile selected by ``?profile=`` or the browser session"""
+    name = request.values.get("profile") or session.get("profile") or DEFAULT_PROFILE
+    return get_profile(name)
+
 # ---------------- Flask Setup ----------------
 app = Flask(__name__)
 app.secret_key = os.urandom(24)
-jobs_cache = []
-
-# Thread-local browser session
-thread_local = threading.local()
-
-def get_browser_session():
-    """Get or create a thread-local browser session"""
-    if not hasattr(thread_local, 'browser_session') or thread_local.browser_session['page'] is None:
-        print("🔧 Creating new browser session for thread...")
-        pw, browser, context, page = setup_browser()
-        thread_local.browser_session = {
-            'pw': pw,
-            'browser': browser,
-            'context': context,
-            'page': page,
-            'logged_in': {'linkedin': False, 'naukri': False}
-        }
-    return thread_local.browser_session['page']
-
-def ensure_logged_in(platform='linkedin'):
-    """Ensure the specified platform is logged in"""
-    page = get_browser_session()
-    
-    if thread_local.browser_session['logged_in'].get(platform, False):
+
+# ---------------- Shared Browser ----------------
+# Classes of browser work, most urgent first
+PRIORITY_CLASSES = ("interactive", "prefetch", "scheduled", "enrichment")
+# Least share of recent browser time a background class gets while it has work waiting
+PRIORITY_MIN_SHARE = {"prefetch": 0.1, "scheduled": 0.15, "enrichment": 0.1}
+SCHEDULER_WINDOW = 120
+
+class TaskScheduler:
+    """The browser thread's work queue, ordered by priority class.
+
+    Interactive work goes first. Each background class is still guaranteed
+    its ``PRIORITY_MIN_SHARE`` of the browser time of the last
+    ``SCHEDULER_WINDOW`` seconds while it has work waiting, so a long crawl
+    can't be starved by a busy dashboard. Background tasks are kept about
+    one results page (or one wave of tabs) long, which bounds how long an
+    interactive search can wait; longer ones let it in at page boundaries
+    through ``BrowserHost.checkpoint``.
+    """
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.queues = {name: deque() for name in PRIORITY_CLASSES}
+        self.closed = False
+        self.history = deque()
+        self.waits = {name: deque(maxlen=200) for name in PRIORITY_CLASSES}
+        self.stats = {name: Counter() for name in PRIORITY_CLASSES}
+
+    def put(self, task, priority="interactive"):
+        if priority not in self.queues:
+            raise ValueError(f"Unknown priority class: {priority}")
+        with self.cond:
+            self.queues[priority].append((time.monotonic(), task))
+            self.stats[priority]['queued'] += 1
+            self.cond.notify()
+
+    def empty(self):
+        return not any(self.queues.values())
+
+    def close(self):
+        """Let the browser thread exit once the queued work is done"""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def reopen(self):
+        with self.cond:
+            self.closed = False
+
+    def get(self):
+        """Next ``(priority, task)``, waiting for one; None once closed and drained"""
+        with self.cond:
+            while self.empty():
+                if self.closed:
+                    return None
+                self.cond.wait()
+            return self._pop(self._pick())
+
+    def get_nowait(self, priority):
+        with self.cond:
+            return self._pop(priority) if self.queues[priority] else None
+
+    def promote(self, future, priority):
+        """Move the queued task of ``future`` up to ``priority``; False when it isn't waiting in a lower class"""
+        with self.cond:
+            for name in PRIORITY_CLASSES[PRIORITY_CLASSES.index(priority) + 1:]:
+                for entry in self.queues[name]:
+                    if entry[1][0] is future:
+                        self.queues[name].remove(entry)
+                        self.queues[priority].append(entry)
+                        self.stats[name]['promoted'] += 1
+                        self.cond.notify()
+                        return True
+        return False
+
+    def _pick(self):
+        shares = self.shares()
+        starved = [(minimum - shares.get(name, 0.0), name) for name, minimum in PRIORITY_MIN_SHARE.items()
+                   if self.queues[name] and shares and shares.get(name, 0.0) < minimum]
+        if starved:
+            return max(starved)[1]
+        return next(name for name in PRIORITY_CLASSES if self.queues[name])
+
+    def _pop(self, priority):
+        queued, task = self.queues[priority].popleft()
+        waited = time.monotonic() - queued
+        self.waits[priority].append(waited)
+        stats = self.stats[priority]
+        stats['started'] += 1
+        stats['wait_ms_total'] += int(waited * 1000)
+        stats['wait_ms_max'] = max(stats['wait_ms_max'], int(waited * 1000))
+        return priority, task
+
+    def finished(self, priority, seconds):
+        """Record ``seconds`` of browser time spent on a ``priority`` task"""
+        now = time.monotonic()
+        with self.cond:
+            self.history.append((now, priority, seconds))
+            while self.history and now - self.history[0][0] > SCHEDULER_WINDOW:
+                self.history.popleft()
+            self.stats[priority]['busy_ms'] += int(seconds * 1000)
+
+    def shares(self):
+        """Each class's share of the browser time in the window ({} when idle)"""
+        busy = Counter()
+        for finished, priority, seconds in self.history:
+            busy[priority] += seconds
+        total = sum(busy.values())
+        return {name: seconds / total for name, seconds in busy.items()} if total else {}
+
+    def summary(self):
+        with self.cond:
+            shares = self.shares()
+            classes = {}
+            for name in PRIORITY_CLASSES:
+                stats, waits = self.stats[name], sorted(self.waits[name])
+                classes[name] = {
+                    "waiting": len(self.queues[name]),
+                    "oldest_wait_s": round(time.monotonic() - self.queues[name][0][0], 2) if self.queues[name] else 0,
+                    "queued": stats['queued'],
+                    "started": stats['started'],
+                    "preempted": stats['preempted'],
+                    "promoted": stats['promoted'],
+                    "wait_avg_s": round(stats['wait_ms_total'] / stats['started'] / 1000, 3) if stats['started'] else 0,
+                    "wait_p95_s": round(waits[math.ceil(len(waits) * 0.95) - 1], 3) if waits else 0,
+                    "wait_max_s": round(stats['wait_ms_max'] / 1000, 3),
+                    "busy_s": round(stats['busy_ms'] / 1000, 1),
+                    "share": round(shares.get(name, 0.0), 3),
+                    "min_share": PRIORITY_MIN_SHARE.get(name, 0.0)
+                }
+        return {"window_s": SCHEDULER_WINDOW, "classes": classes}
+
+class BrowserHost:
+    """Owns the single Playwright driver and Chromium process.
+
+    Playwright's sync API only works on the thread that started it, so all
+    browser work is funnelled through one dedicated thread via ``call()``.
+    Every profile gets its own lightweight context on the shared browser,
+    which keeps cookies and storage isolated without another Chromium.
+    """
+
+    def __init__(self):
+        self.tasks = TaskScheduler()
+        self.thread = None
+        self.start_lock = threading.Lock()
+        self.pw = None
+        self.browser = None
+        self.sessions = {}
+        self.readiness = {'state': 'cold', 'detail': '', 'profiles': {}}
+        self.busy = False
+        # [priority, seconds spent in nested tasks, future] of each task running on the thread, innermost last
+        self.running = []
+        # Contexts to close once no task is paused at a checkpoint
+        self.pending_closes = set()
+        self.pending_restart = False
+
+    def start(self):
+        with self.start_lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.tasks.reopen()
+                self.thread = threading.Thread(target=self._run, name="browser-host", daemon=True)
+                self.thread.start()
+
+    def _run(self):
+        while True:
+            item = self.tasks.get()
+            if item is None:
+                break
+            self._execute(*item)
+        self._close_all()
+
+    def _execute(self, priority, task):
+        future, fn, args, kwargs = task
+        if not future.set_running_or_notify_cancel():
+            return
+        frame = [priority, 0.0, future]
+        self.running.append(frame)
+        self.busy = True
+        started = time.monotonic()
         try:
-            # Check if still logged in
-            if platform == 'linkedin':
-                page.goto("https://www.linkedin.com/feed/", timeout=10000)
-                if "feed" in page.url or "jobs" in page.url:
-                    print(f"✅ Already logged in to {platform.title()}")
-                    return page
-            elif platform == 'naukri':
-                page.goto("https://www.naukri.com/mnjuser/homepage", timeout=10000)
-                current_url = page.url.lower()
-                if "mnjuser" in current_url or "homepage" in current_url:
-                    print(f"✅ Already logged in to {platform.title()}")
-                    return page
-                if page.locator('text="Complete profile"').count() > 0 or page.locator('text="My home"').count() > 0:
-                    print(f"✅ Already logged in to {platform.title()}")
-                    return page
-            
-            thread_local.browser_session['logged_in'][platform] = False
-        except:
-            thread_local.browser_session['logged_in'][platform] = False
-    
-    # Login if not logged in
-    if platform == 'linkedin' and LINKEDIN_EMAIL and LINKEDIN_PASSWORD:
-        if login_linkedin(page, LINKEDIN_EMAIL, LINKEDIN_PASSWORD):
-            thread_local.browser_session['logged_in'][platform] = True
-            return page
-    elif platform == 'naukri' and NAUKRI_EMAIL and NAUKRI_PASSWORD:
-        if login_naukri(page, NAUKRI_EMAIL, NAUKRI_PASSWORD):
-            thread_local.browser_session['logged_in'][platform] = True
-            return page
-    
-    return None
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            elapsed = time.monotonic() - started
+            self.running.pop()
+            # Time spent on tasks let in at a checkpoint is theirs, not this one's
+            self.tasks.finished(frame[0], elapsed - frame[1])
+            if self.running:
+                self.running[-1][1] += elapsed
+            elif self.pending_restart:
+                self._restart()
+            elif self.pending_closes:
+                for name in list(self.pending_closes):
+                    self.close_session(name)
+            self.busy = bool(self.running)
+
+    def call(self, fn, *args, **kwargs):
+        """Run ``fn`` on the browser thread and wait for its result"""
+        return self.call_as("interactive", fn, *args, **kwargs)
+
+    def call_as(self, priority, fn, *args, **kwargs):
+        """``call`` for work of a given class in ``PRIORITY_CLASSES``"""
+        if threading.current_thread() is self.thread:
+            return fn(*args, **kwargs)
+        return self.submit(priority, fn, *args, **kwargs).result()
+
+    def submit(self, priority, fn, *args, **kwargs):
+        """Queue ``fn`` for the browser thread and return its Future"""
+        self.start()
+        future = Future()
+        self.tasks.put((future, fn, args, kwargs), priority)
+        return future
+
+    def wait_for(self, future, deadline):
+        """Result of a submitted task, waiting no longer than ``deadline``.
+
+        Time spent queued behind other work counts against the deadline: a
+        task still waiting when it runs out is cancelled and the deadline
+        marked partial (``DeadlineExceeded``). One that already started shares
+        the deadline, so it gets DEADLINE_GRACE seconds to return what it has.
+        """
+        try:
+            return future.result(timeout=deadline.remaining())
+        except FutureTimeout:
+            if not future.cancel():
+                try:
+                    return future.result(timeout=DEADLINE_GRACE)
+                except FutureTimeout:
+                    pass
+        deadline.mark_partial()
+        raise DeadlineExceeded("Search deadline reached while waiting for the browser")
+
+    def promote(self, future, priority):
+        """Run a submitted task as ``priority`` from now on, whether it's still queued or already running"""
+        if self.tasks.promote(future, priority):
+            return
+        rank = PRIORITY_CLASSES.index(priority)
+        for frame in list(self.running):
+            if frame[2] is future and PRIORITY_CLASSES.index(frame[0]) > rank:
+                # Checkpoints stop letting other work in ahead of it
+                frame[0] = priority
+
+    def checkpoint(self):
+        """Run waiting interactive work now if a background task is running.
+
+        Called by long browser tasks at page boundaries (between waves of
+        tabs), where nothing is half loaded, so a search from the dashboard
+        doesn't wait for a whole prefetch or enrichment batch.
+        """
+        if threading.current_thread() is not self.thread or not self.running:
+            return
+        current = self.running[-1][0]
+        if current == "interactive":
+            return
+        while True:
+            item = self.tasks.get_nowait("interactive")
+            if item is None:
+                return
+            self.tasks.stats[current]['preempted'] += 1
+            self._execute(*item)
+
+    def prewarm(self):
+        """Launch the browser and restore every profile's login in the background"""
+        self.readiness.update(state='warming', detail='Launching browser', started=time.time())
+        self.start()
+        future = Future()
+        self.tasks.put((future, self._prewarm, (), {}))
+        return future
+
+    def _prewarm(self):
+        try:
+            self.get_browser()
+            for name in list_profiles():
+                profile = get_profile(name)
+                adapters = [adapter for adapter in platform_adapters(profile) if adapter.needs_login]
+                if not adapters:
+                    continue
+                self.readiness['detail'] = f"Restoring login for '{name}'"
+                self.readiness['profiles'][name] = {
+                    adapter.key: ensure_logged_in(profile, adapter.key) is not None for adapter in adapters
+                }
+            self.readiness.update(state='ready', detail='', finished=time.time())
+            elapsed = self.readiness['finished'] - self.readiness['started']
+            log.info(f"✅ Browser prewarmed in {elapsed:.1f}s", stage="prewarm", duration_ms=int(elapsed * 1000))
+        except Exception as e:
+            self.readiness.update(state='error', detail=str(e), finished=time.time())
+            log.warning(f"⚠️ Browser prewarm failed: {e}", stage="prewarm")
+
+    def stop(self):
+        if self.thread is not None and self.thread.is_alive():
+            self.tasks.close()
+            self.thread.join(timeout=30)
+
+    def restart(self):
+        """Relaunch the browser with the default profile's current options, in turn with other browser work"""
+        if self.thread is None or not self.thread.is_alive():
+            return None
+        return self.submit("interactive", self._restart)
+
+    # -- everything below runs on the browser thread --
+
+    def get_browser(self):
+        if self.browser is None or not self.browser.is_connected():
+            self.pw, self.browser = setup_browser(get_profile(DEFAULT_PROFILE))
+            if self.readiness['state'] == 'cold':
+                self.readiness['state'] = 'ready'
+            browser_supervisor.start()
+        return self.browser
 
-def close_browser_session():
-    """Close the thread-local browser session"""
-    if hasattr(thread_local, 'browser_session'):
-        session = thread_local.browser_session
-        if session['context']:
+    def get_session(self, profile):
+        """Get or create the browser context for ``profile``"""
+        session = self.sessions.get(profile.name)
+        if session is None or session['page'] is None or session['page'].is_closed():
+            log.info(f"🔧 Creating browser context for profile '{profile.name}'...", stage="context", profile=profile.name)
+            context, page, restored = new_profile_context(self, profile)
+            for adapter in PLATFORMS.values():
+                adapter.attach(context)
+            session = {
+                'context': context,
+                'page': page,
+                'logged_in': {key: restored for key in PLATFORMS},
+                'navigations': 0,
+                'created': time.time()
+            }
+            track_navigations(session)
+            self.sessions[profile.name] = session
+        session['last_used'] = time.time()
+        return session
+
+    def owns_session(self, name):
+        """False for the user's own Chrome window reached over remote debugging"""
+        session = self.sessions.get(name)
+        return bool(session) and not (self.browser is not None and self.browser.contexts[:1] == [session['context']]
+                                      and get_profile(name).use_remote_debugging)
+
+    def save_state(self, profile):
+        session = self.sessions.get(profile.name)
+        if not session:
+            return
+        try:
+            os.makedirs(profile_dir(profile.name), exist_ok=True)
+            session['context'].storage_state(path=profile.state_path)
+        except Exception as e:
+            log.warning(f"⚠️ Could not save login state for '{profile.name}': {e}", stage="context", profile=profile.name)
+
+    def close_session(self, name):
+        if len(self.running) > 1:
+            # A task paused at a checkpoint may still hold this context's tabs
+            self.pending_closes.add(name)
+            log.info(f"⏸️ Closing the browser context for '{name}' once the paused task finishes", stage="context",
+                     profile=name)
+            return
+        self.pending_closes.discard(name)
+        session = self.sessions.pop(name, None)
+        if session and session['context']:
             try:
                 session['context'].close()
             except:
                 pass
-        if session['browser']:
+
+    def _close_all(self):
+        for name in list(self.sessions):
+            self.close_session(name)
+        if self.browser:
             try:
-                session['browser'].close()
+                self.browser.close()
             except:
                 pass
-        if session['pw']:
+        if self.pw:
             try:
-                session['pw'].stop()
+                self.pw.stop()
             except:
                 pass
-        thread_local.browser_session = None
+        self.browser = None
+        self.pw = None
+        self.readiness.update(state='cold', detail='', profiles={})
 
-# ---------------- Browser Setup ----------------
-def setup_browser(headless=None):
-    global CHROME_PATH, USE_CHROME_PROFILE, CHROME_PROFILE_PATH, USE_REMOTE_DEBUGGING
-    if headless is None:
-        headless = HEADLESS
+    def _restart(self):
+        if len(self.running) > 1:
+            # Let in at a checkpoint: the paused task still needs the browser
+            self.pending_restart = True
+            log.info("⏸️ Restarting the browser once the paused task finishes", stage="launch")
+            return
+        self.pending_restart = False
+        self._close_all()
+        log.info("🔄 Browser closed to apply the new browser settings", stage="launch")
+        if prewarm_enabled():
+            self.prewarm()
+
+browser_host = BrowserHost()
+
+def track_navigations(session):
+    """Count main-frame navigations in every page of a session's context"""
+    def count(frame):
+        if frame.parent_frame is None:
+            session['navigations'] += 1
+    def watch(page):
+        page.on("framenavigated", count)
+    for page in session['context'].pages:
+        watch(page)
+    session['context'].on("page", watch)
+
+def prewarm_enabled():
+    env = os.getenv("PREWARM_BROWSER", "")
+    if env:
+        return env.strip().lower() in ("1", "true", "yes")
+    return bool(load_settings(DEFAULT_PROFILE).get("PREWARM_BROWSER", False))
+
+def ensure_logged_in(profile, platform='linkedin', deadline=None):
+    """Ensure the specified platform is logged in (runs on the browser thread)"""
+    session = browser_host.get_session(profile)
+    page = session['page']
+    deadline = deadline or Deadline()
+    adapter = PLATFORMS[platform]
+    started = time.perf_counter()
+    if not adapter.needs_login:
+        return page
     
-    pw = sync_playwright().start()
+    if session['logged_in'].get(platform, False):
+        try:
+            # Check if still logged in
+            if adapter.is_logged_in(page, deadline):
+                log.info(f"✅ Already logged in to {adapter.name}", stage="login", platform=adapter.name, profile=profile.name,
+                         duration_ms=int((time.perf_counter() - started) * 1000))
+                return page
+            
+            session['logged_in'][platform] = False
+        except DeadlineExceeded:
+            return None
+        except:
+            # Out of time is not the same as logged out
+            if deadline.expired:
+                deadline.mark_partial()
+                return None
+            session['logged_in'][platform] = False
+    
+    # Login if not logged in
+    logged_in = adapter.configured(profile) and adapter.login(page, profile, deadline)
+    log.debug("Login attempt finished", stage="login", platform=adapter.name, profile=profile.name, ok=bool(logged_in),
+              duration_ms=int((time.perf_counter() - started) * 1000))
     
-    # Find Chrome path
-    chrome_path = CHROME_PATH
+    if logged_in:
+        session['logged_in'][platform] = True
+        browser_host.save_state(profile)
+        return page
+    return None
+
+# Options the shared browser is launched with (read from the default profile)
+BROWSER_SETTINGS = ("HEADLESS", "CHROME_PATH", "USE_REMOTE_DEBUGGING")
+
+def close_browser_session(profile_name=None):
+    """Close one profile's browser context, or the whole shared browser"""
+    if profile_name is None:
+        browser_host.stop()
+    elif browser_host.thread is not None and browser_host.thread.is_alive():
+        browser_host.call(browser_host.close_session, profile_name)
+
+# ---------------- Browser Setup ----------------
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Chrome ignores unknown switches; this one lets the supervisor find the
+# processes this dashboard started (and ones a crashed run left behind)
+BROWSER_MARKER = f"--job-dashboard-owner={os.getpid()}"
+
+LAUNCH_ARGS = [
+    BROWSER_MARKER,
+    '--disable-blink-features=AutomationControlled',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding'
+]
+
+def find_chrome(chrome_path):
     if not chrome_path or not os.path.exists(chrome_path):
         common_paths = [
             r"C:\Program Files\Google\Chrome\Application\chrome.exe",
@@ -185,303 +815,3904 @@ def setup_browser(headless=None):
         for path in common_paths:
             if os.path.exists(path):
                 chrome_path = path
-                print(f"✅ Found Chrome at: {chrome_path}")
+                log.info(f"✅ Found Chrome at: {chrome_path}", stage="launch")
                 break
+    return chrome_path if chrome_path and os.path.exists(chrome_path) else None
+
+def setup_browser(owner, headless=None):
+    """Start Playwright and the shared browser using ``owner``'s browser options"""
+    # Imported here so loading the dashboard doesn't pay for Playwright
+    from playwright.sync_api import sync_playwright
+    
+    if headless is None:
+        headless = owner.headless
+    
+    started = time.perf_counter()
+    pw = sync_playwright().start()
+    
+    # Try to connect to existing Chrome with remote debugging (never while recording or replaying)
+    if owner.use_remote_debugging and not HAR_MODE:
+        try:
+            log.info("🔍 Attempting to connect to existing Chrome instance (port 9222)...", stage="launch")
+            browser = pw.chromium.connect_over_cdp("http://localhost:9222")
+            log.info("✅ Connected to existing Chrome instance!", stage="launch", duration_ms=int((time.perf_counter() - started) * 1000))
+            return pw, browser
+        except Exception as e:
+            log.info(f"ℹ️ Could not connect to existing Chrome: {e}", stage="launch")
+            log.info("🚀 Launching new Chrome instance...", stage="launch")
+    
+    chrome_path = find_chrome(owner.chrome_path)
+    try:
+        if chrome_path:
+            log.info(f"🚀 Launching Chrome from: {chrome_path}", stage="launch")
+            browser = pw.chromium.launch(
+                headless=headless,
+                executable_path=chrome_path,
+                args=LAUNCH_ARGS
+            )
+        else:
+            log.warning("⚠️ Chrome not found, using Playwright's built-in Chromium", stage="launch")
+            browser = pw.chromium.launch(headless=headless, args=LAUNCH_ARGS)
+    except:
+        # A driver left running blocks the next start on this thread
+        pw.stop()
+        raise
+    log.info("✅ Browser launched", stage="launch", duration_ms=int((time.perf_counter() - started) * 1000))
+    return pw, browser
+
+def new_profile_context(host, profile):
+    """Create an isolated context for ``profile``, restoring saved login state.
+
+    Returns ``(context, page, restored)``.
+    """
+    browser = host.get_browser()
+    
+    # A real Chrome profile directory needs its own persistent browser
+    if profile.use_chrome_profile and profile.chrome_profile_path and os.path.exists(profile.chrome_profile_path):
+        log.info(f"👤 Using Chrome profile from: {profile.chrome_profile_path}", stage="context", profile=profile.name)
+        try:
+            context = host.pw.chromium.launch_persistent_context(
+                user_data_dir=profile.chrome_profile_path,
+                headless=get_profile(DEFAULT_PROFILE).headless,
+                executable_path=find_chrome(profile.chrome_path),
+                args=LAUNCH_ARGS,
+                viewport={'width': 1920, 'height': 1080},
+                user_agent=USER_AGENT,
+                **har_record_options(profile)
+            )
+            replay_har(context, profile)
+            page = context.pages[0] if context.pages else context.new_page()
+            log.info("✅ Chrome profile loaded successfully!", stage="context", profile=profile.name)
+            return context, page, True
+        except Exception as e:
+            log.warning(f"⚠️ Failed to load Chrome profile: {e}", stage="context", profile=profile.name)
     
-    # Launch arguments
-    launch_args = [
-        '--disable-blink-features=AutomationControlled',
-        '--no-sandbox',
-        '--disable-dev-shm-usage',
-        '--disable-background-timer-throttling',
-        '--disable-backgrounding-occluded-windows',
-        '--disable-renderer-backgrounding'
-    ]
+    # Reuse the open window when attached to the user's own Chrome
+    if profile.name == DEFAULT_PROFILE and profile.use_remote_debugging and browser.contexts:
+        context = browser.contexts[0]
+        page = context.pages[0] if context.pages else context.new_page()
+        log.info("✅ Connected to existing Chrome tab!", stage="context", profile=profile.name)
+        return context, page, True
     
-    # Try to connect to existing Chrome with remote debugging
-    if USE_REMOTE_DEBUGGING:
+    restored = os.path.exists(profile.state_path)
+    context = browser.new_context(
+        viewport={'width': 1920, 'height': 1080},
+        user_agent=USER_AGENT,
+        storage_state=profile.state_path if restored else None,
+        **har_record_options(profile)
+    )
+    replay_har(context, profile)
+    if restored:
+        log.info(f"🍪 Restored login state for profile '{profile.name}'", stage="context", profile=profile.name)
+    page = context.new_page()
+    return context, page, restored
+
+# ---------------- HAR Record / Replay ----------------
+def har_dir(profile):
+    return os.path.join(HAR_DIR, secure_filename(profile.name) or DEFAULT_PROFILE)
+
+def har_record_options(profile):
+    """``new_context()`` options that record this context to a new HAR when HAR_MODE=record.
+
+    Playwright writes the file when the context closes, so every context
+    (including recycled ones) gets its own timestamped archive.
+    """
+    if HAR_MODE != "record":
+        return {}
+    os.makedirs(har_dir(profile), exist_ok=True)
+    path = os.path.join(har_dir(profile), f"{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}.zip")
+    log.info(f"🎞️ Recording browser traffic for '{profile.name}' to {path}", stage="har", profile=profile.name)
+    return {"record_har_path": path, "record_har_mode": "minimal"}
+
+def replay_har(context, profile):
+    """Serve every request of ``context`` from the recorded HARs when HAR_MODE=replay.
+
+    Newer recordings win; anything no recording has is aborted, so a replayed
+    run never touches the network.
+    """
+    if HAR_MODE != "replay":
+        return
+    recordings = sorted(glob.glob(os.path.join(har_dir(profile), "*.zip")))
+    if not recordings:
+        raise FileNotFoundError(f"No HAR recordings for profile '{profile.name}' in {har_dir(profile)}; "
+                                f"run with HAR_MODE=record first")
+    # Routes registered later are tried first, so the oldest is the final abort
+    context.route_from_har(recordings[0], not_found="abort")
+    for path in recordings[1:]:
+        context.route_from_har(path, not_found="fallback")
+
+# ---------------- Browser Supervisor ----------------
+SUPERVISOR_INTERVAL = 30
+CONTEXT_RECYCLE_NAVIGATIONS = 200
+BROWSER_RSS_LIMIT_MB = int(os.getenv("BROWSER_RSS_LIMIT_MB", "1500"))
+SESSION_IDLE_TIMEOUT = 30 * 60
+# When Chromium's baseline stays over the limit, recycling can't help; these keep it from looping
+MEMORY_RECYCLE_MIN_AGE = 10 * 60
+MEMORY_RECYCLE_COOLDOWN = 5 * 60
+
+def find_browser_processes():
+    """``{pid: owner_pid}`` for every Chromium main process launched by a dashboard"""
+    prefix = BROWSER_MARKER.split("=")[0] + "="
+    found = {}
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        for proc in psutil.process_iter(["pid", "cmdline"]):
+            for arg in proc.info.get("cmdline") or []:
+                if arg.startswith(prefix):
+                    found[proc.info["pid"]] = int(arg[len(prefix):])
+    elif os.path.isdir("/proc"):
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/cmdline", "rb") as f:
+                    args = f.read().decode("utf-8", "replace").split("\0")
+            except OSError:
+                continue
+            for arg in args:
+                if arg.startswith(prefix):
+                    found[int(entry)] = int(arg[len(prefix):])
+    return found
+
+def process_tree(pid):
+    """``pid`` and all of its descendants"""
+    try:
+        import psutil
+        proc = psutil.Process(pid)
+        return [pid] + [child.pid for child in proc.children(recursive=True)]
+    except ImportError:
+        pass
+    except Exception:
+        return []
+    children = {}
+    for entry in os.listdir("/proc") if os.path.isdir("/proc") else []:
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat", "rb") as f:
+                    # The command name can contain spaces, the parent PID follows the last ')'
+                    ppid = int(f.read().rsplit(b")", 1)[1].split()[1])
+                children.setdefault(ppid, []).append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue
+    tree, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, []))
+    return tree
+
+def process_usage(pids):
+    """Total RSS (bytes) and open handles/file descriptors of ``pids``; None where unknown"""
+    rss, handles = 0, 0
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    for pid in pids:
+        try:
+            if psutil is not None:
+                proc = psutil.Process(pid)
+                rss += proc.memory_info().rss
+                handles += proc.num_handles() if hasattr(proc, "num_handles") else proc.num_fds()
+            else:
+                with open(f"/proc/{pid}/statm") as f:
+                    rss += int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+                handles += len(os.listdir(f"/proc/{pid}/fd"))
+        except Exception:
+            continue
+    return rss, handles
+
+def pid_alive(pid):
+    try:
+        import psutil
+        return psutil.pid_exists(pid)
+    except ImportError:
+        pass
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+def owner_alive(owner, pid):
+    """Whether the dashboard that launched browser ``pid`` is still running.
+
+    A live ``owner`` PID only counts if that process is older than the
+    browser; a younger one reused the PID after the dashboard exited.
+    """
+    if not pid_alive(owner):
+        return False
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        try:
+            return psutil.Process(owner).create_time() <= psutil.Process(pid).create_time()
+        except psutil.NoSuchProcess:
+            return False
+        except psutil.Error:
+            # Not allowed to look: leave it alone
+            return True
+    try:
+        started = []
+        for member in (owner, pid):
+            with open(f"/proc/{member}/stat", "rb") as f:
+                # Start time in clock ticks since boot, 20 fields after the command name
+                started.append(int(f.read().rsplit(b")", 1)[1].split()[19]))
+        return started[0] <= started[1]
+    except (OSError, IndexError, ValueError):
+        return True
+
+def can_see_processes():
+    try:
+        import psutil
+        return True
+    except ImportError:
+        return os.path.isdir("/proc")
+
+def kill_process_tree(pid):
+    try:
+        import psutil
+        for child in psutil.Process(pid).children(recursive=True):
+            child.kill()
+        psutil.Process(pid).kill()
+        return True
+    except ImportError:
+        pass
+    except Exception:
+        return False
+    import signal
+    for member in reversed(process_tree(pid)):
+        try:
+            os.kill(member, signal.SIGKILL)
+        except OSError:
+            pass
+    return True
+
+def kill_orphaned_browsers(include_own=False):
+    """Kill Chromium processes left behind by dashboards that are no longer running.
+
+    With ``include_own`` this process's browsers are killed too (used on
+    shutdown after the normal close). Returns the number of browsers killed.
+    """
+    killed = 0
+    for pid, owner in find_browser_processes().items():
+        if (owner == os.getpid() and include_own) or (owner != os.getpid() and not owner_alive(owner, pid)):
+            if kill_process_tree(pid):
+                killed += 1
+    if killed:
+        log.info(f"🧹 Killed {killed} orphaned browser process{'es' if killed > 1 else ''}", stage="supervisor", count=killed)
+    return killed
+
+class BrowserSupervisor:
+    """Samples the shared browser's memory and recycles contexts before they bloat.
+
+    Every SUPERVISOR_INTERVAL seconds it measures the RSS and open handles of
+    this process's Chromium tree and the navigations, pages and JS heap of
+    each profile context. A context is recycled (login state saved, closed,
+    recreated on next use) after CONTEXT_RECYCLE_NAVIGATIONS navigations,
+    when the browser passes BROWSER_RSS_LIMIT_MB (largest context at least
+    MEMORY_RECYCLE_MIN_AGE old first, at most once per
+    MEMORY_RECYCLE_COOLDOWN), or once idle for SESSION_IDLE_TIMEOUT.
+    """
+
+    def __init__(self, host):
+        self.host = host
+        self.thread = None
+        self.start_lock = threading.Lock()
+        self.metrics = {}
+        self.recycled = Counter()
+        self.memory_recycled_at = 0
+
+    def start(self):
+        with self.start_lock:
+            if self.thread is None or not self.thread.is_alive():
+                if not can_see_processes():
+                    log.warning("⚠️ Can't list processes (install psutil): browser memory limits and orphan cleanup are off",
+                                stage="supervisor")
+                self.thread = threading.Thread(target=self._run, name="browser-supervisor", daemon=True)
+                self.thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(SUPERVISOR_INTERVAL)
+            if self.host.browser is None or self.host.thread is None or not self.host.thread.is_alive():
+                continue
+            try:
+                self.host.call(self.sample)
+            except Exception as e:
+                log.warning(f"⚠️ Browser supervisor: {e}", stage="supervisor")
+
+    # -- runs on the browser thread --
+
+    def sample(self):
+        if self.host.browser is None:
+            return self.metrics
+        now = time.time()
+        pids = [pid for pid, owner in find_browser_processes().items() if owner == os.getpid()]
+        tree = [member for pid in pids for member in process_tree(pid)]
+        rss, handles = process_usage(tree)
+        
+        contexts = {}
+        for name, session in list(self.host.sessions.items()):
+            pages = [page for page in session['context'].pages if not page.is_closed()]
+            contexts[name] = {
+                "navigations": session.get('navigations', 0),
+                "pages": len(pages),
+                "js_heap_mb": round(sum(js_heap_size(session['context'], page) for page in pages) / 2**20, 1),
+                "age_s": int(now - session.get('created', now)),
+                "idle_s": int(now - session.get('last_used', now))
+            }
+        self.metrics = {
+            "sampled_at": now,
+            "browser": {"pids": pids, "processes": len(tree), "rss_mb": round(rss / 2**20, 1), "handles": handles},
+            "contexts": contexts,
+            "limits": {"navigations": CONTEXT_RECYCLE_NAVIGATIONS, "rss_mb": BROWSER_RSS_LIMIT_MB,
+                       "idle_s": SESSION_IDLE_TIMEOUT}
+        }
+        
+        # More than this sample running means a task is paused at a checkpoint and still holds its tabs
+        if len(self.host.running) <= 1:
+            self.recycle_due(contexts, rss)
+        self.metrics["recycled"] = dict(self.recycled)
+        return self.metrics
+
+    def recycle_due(self, contexts, rss):
+        for name, stats in contexts.items():
+            if not self.host.owns_session(name):
+                continue
+            if stats["idle_s"] >= SESSION_IDLE_TIMEOUT:
+                self.recycle(name, "idle")
+            elif stats["navigations"] >= CONTEXT_RECYCLE_NAVIGATIONS:
+                self.recycle(name, "navigations")
+        if rss / 2**20 > BROWSER_RSS_LIMIT_MB and time.time() - self.memory_recycled_at >= MEMORY_RECYCLE_COOLDOWN:
+            owned = [name for name in contexts if name in self.host.sessions and self.host.owns_session(name)
+                     and contexts[name]["age_s"] >= MEMORY_RECYCLE_MIN_AGE]
+            if owned:
+                self.recycle(max(owned, key=lambda n: (contexts[n]["js_heap_mb"], contexts[n]["navigations"])), "memory")
+                self.memory_recycled_at = time.time()
+
+    def recycle(self, name, reason):
+        profile = get_profile(name)
+        self.host.save_state(profile)
+        self.host.close_session(name)
+        self.recycled[reason] += 1
+        log.info(f"♻️ Recycled browser context for '{name}' ({reason}); login state saved", stage="supervisor",
+                 profile=name, reason=reason)
+
+browser_supervisor = BrowserSupervisor(browser_host)
+
+def js_heap_size(context, page):
+    """Used JS heap of ``page`` in bytes via the Chrome DevTools Protocol (0 if unavailable)"""
+    try:
+        cdp = context.new_cdp_session(page)
+        try:
+            cdp.send("Performance.enable")
+            metrics = cdp.send("Performance.getMetrics")["metrics"]
+        finally:
+            cdp.detach()
+        return next((m["value"] for m in metrics if m["name"] == "JSHeapUsedSize"), 0)
+    except Exception:
+        return 0
+
+# ---------------- Search Deadlines ----------------
+DEFAULT_SEARCH_DEADLINE = 120
+MAX_SEARCH_DEADLINE = 900
+# Seconds a search already running on the browser gets past its deadline to hand back partial results
+DEADLINE_GRACE = 5
+
+class DeadlineExceeded(Exception):
+    pass
+
+class Deadline:
+    """Time budget for one search, shared by login, navigation, waits and extraction.
+
+    Each step asks for its usual timeout and gets whatever is left of the
+    budget if that is less. Once the budget is spent, steps raise
+    ``DeadlineExceeded`` and the deadline is flagged ``partial`` so callers
+    return what they collected so far. Queries that fail for other reasons
+    (login, navigation) are listed in ``errors``. ``Deadline()`` has no limit.
+    """
+
+    def __init__(self, seconds=None, parent=None):
+        self.expires = time.monotonic() + seconds if seconds else None
+        if parent is not None and parent.expires is not None:
+            self.expires = min(self.expires or parent.expires, parent.expires)
+        self.parent = parent
+        self.partial = False
+        self.errors = []
+
+    def remaining(self):
+        if self.expires is None:
+            return None
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self):
+        # A little slack so a step cut off by its capped timeout counts as expired
+        return self.expires is not None and time.monotonic() >= self.expires - 0.05
+
+    def mark_partial(self):
+        self.partial = True
+        if self.parent is not None:
+            self.parent.mark_partial()
+
+    def mark_failed(self, reason):
+        self.errors.append(reason)
+        if self.parent is not None:
+            self.parent.mark_failed(reason)
+
+    @property
+    def complete(self):
+        """Every query ran to the end, so the results can stand in for a fresh search"""
+        return not self.partial and not self.errors
+
+    def check(self):
+        if self.expired:
+            self.mark_partial()
+            raise DeadlineExceeded("Deadline reached")
+
+    def timeout(self, ms):
+        """Playwright timeout in ms: ``ms`` capped by the remaining budget"""
+        self.check()
+        remaining = self.remaining()
+        return ms if remaining is None else max(1, min(ms, int(remaining * 1000)))
+
+    def sleep(self, seconds):
+        remaining = self.remaining()
+        time.sleep(seconds if remaining is None else min(seconds, remaining))
+
+    def split(self, parts):
+        """Child deadline with a fair share of what's left, so one hung step can't starve the rest"""
+        remaining = self.remaining()
+        if remaining is None:
+            return Deadline(parent=self)
+        return Deadline(max(remaining / max(parts, 1), 0.001), parent=self)
+
+# ---------------- Login Functions ----------------
+def login_linkedin(page, email, password, deadline=None):
+    if not email or not password:
+        log.warning("⚠️ LinkedIn credentials not provided", stage="login", platform="LinkedIn")
+        return False
+    deadline = deadline or Deadline()
+    try:
+        log.info("🔐 Logging into LinkedIn...", stage="login", platform="LinkedIn")
+        page.goto("https://www.linkedin.com/login", timeout=deadline.timeout(60000))
+        page.wait_for_selector("input#username", timeout=deadline.timeout(10000))
+        page.fill("input#username", email, timeout=deadline.timeout(10000))
+        page.fill("input#password", password, timeout=deadline.timeout(10000))
+        deadline.sleep(1 + random.random())
+        page.click("button[type=submit]", timeout=deadline.timeout(10000))
+        page.wait_for_load_state("networkidle", timeout=deadline.timeout(30000))
+        deadline.sleep(2 + random.random())
+        if "feed" in page.url or "jobs" in page.url:
+            log.info("✅ LinkedIn login successful", stage="login", platform="LinkedIn")
+            return True
+        else:
+            log.warning("⚠️ LinkedIn login may have failed", stage="login", platform="LinkedIn")
+            return False
+    except Exception as e:
+        if deadline.expired:
+            deadline.mark_partial()
+        log.error(f"❌ LinkedIn login error: {e}", stage="login", platform="LinkedIn")
+        return False
+
+def login_naukri(page, email, password, deadline=None):
+    if not email or not password:
+        log.warning("⚠️ Naukri credentials not provided", stage="login", platform="Naukri")
+        return False
+    deadline = deadline or Deadline()
+    try:
+        log.info("🔐 Logging into Naukri...", stage="login", platform="Naukri")
+        page.goto("https://www.naukri.com/nlogin/login", timeout=deadline.timeout(60000))
+        page.wait_for_selector("input#usernameField", timeout=deadline.timeout(10000))
+        page.fill("input#usernameField", email, timeout=deadline.timeout(10000))
+        page.fill("input#passwordField", password, timeout=deadline.timeout(10000))
+        deadline.sleep(1 + random.random())
+        page.click("button[type=submit]", timeout=deadline.timeout(10000))
+        page.wait_for_load_state("networkidle", timeout=deadline.timeout(30000))
+        deadline.sleep(3 + random.random())
+        
+        current_url = page.url.lower()
+        if "mnjuser" in current_url or "homepage" in current_url or "naukri.com" in current_url:
+            try:
+                profile_indicators = [
+                    'text="Complete profile"',
+                    'text="Profile performance"',
+                    'text="My home"',
+                    'a[href*="mnjuser"]',
+                    'div:has-text("Profile")'
+                ]
+                
+                for indicator in profile_indicators:
+                    if page.locator(indicator).count() > 0:
+                        log.info("✅ Naukri login successful", stage="login", platform="Naukri")
+                        return True
+                
+                if "naukri.com" in current_url and "login" not in current_url:
+                    log.info("✅ Naukri login successful", stage="login", platform="Naukri")
+                    return True
+                    
+            except:
+                pass
+        
+        log.warning("⚠️ Naukri login may have failed - please check credentials", stage="login", platform="Naukri")
+        return False
+    except Exception as e:
+        if deadline.expired:
+            deadline.mark_partial()
+        log.error(f"❌ Naukri login error: {e}", stage="login", platform="Naukri")
+        return False
+
+# ---------------- Job Search Functions ----------------
+LINKEDIN_PAGE_SIZE = 25
+DEFAULT_POSTED_WITHIN = 86400
+# Display name per platform key, filled in by ``register_platform``
+PLATFORM_NAMES = {}
+
+# Built-in strategies for the selector registry, most likely first
+SEARCH_SELECTORS = {
+    "LinkedIn": {
+        "job_cards": ['li.jobs-search-results__list-item', 'li.scaffold-layout__list-item', 'div.job-card-container'],
+        "title_link": ['a.job-card-list__title', 'a[href*="/jobs/view/"]'],
+        "easy_apply": ['span:has-text("Easy Apply")', 'li.job-card-container__apply-method']
+    },
+    "Naukri": {
+        "job_cards": ['article.jobTuple', 'div.srp-jobtuple-wrapper'],
+        "title_link": ['a.title', 'a.heading-span']
+    }
+}
+
+def first_match(root, sel):
+    """``root.locator(sel).first`` if it matches anything, else None"""
+    loc = root.locator(sel).first
+    return loc if loc.count() > 0 else None
+
+def build_linkedin_all_jobs_url(keyword: str, location: str, posted_within: int = DEFAULT_POSTED_WITHIN, start: int = 0) -> str:
+    """Build LinkedIn URL for ALL jobs posted in the last ``posted_within`` seconds"""
+    params = {
+        "keywords": keyword,
+        "location": location,
+        "f_TPR": f"r{int(posted_within)}",
+        "sortBy": "DD",
+        "position": "1",
+        "pageNum": "0"
+    }
+    if start:
+        params["start"] = str(start)
+    return f"https://www.linkedin.com/jobs/search/?{urlencode(params, quote_via=quote)}"
+
+def build_naukri_url(keyword: str, location: str, page_num: int = 1, job_age_days: int = None) -> str:
+    keyword_formatted = keyword.replace(" ", "-")
+    location_formatted = location.replace(" ", "-").lower()
+    url = f"https://www.naukri.com/{keyword_formatted}-jobs-in-{location_formatted}"
+    if page_num > 1:
+        url += f"-{page_num}"
+    if job_age_days:
+        url += f"?jobAge={int(job_age_days)}"
+    return url
+
+def canonical_job_id(platform, url):
+    """Stable ID for a posting regardless of tracking params or search keyword"""
+    path = urlparse(url).path.rstrip("/")
+    adapter = PLATFORMS_BY_NAME.get(platform)
+    if adapter is not None and adapter.id_pattern:
+        match = re.search(adapter.id_pattern, path)
+        if match:
+            return f"{adapter.key}:{match.group(1)}"
+    return f"{platform.lower()}:{hashlib.sha1(url.split('?')[0].encode('utf-8')).hexdigest()[:16]}"
+
+def read_cards(adapter, page, keyword, results, title_keywords=(), known_ids=None, seen_ids=None, deadline=None):
+    """Append matching jobs on a loaded results page of ``adapter``'s site to ``results``.
+
+    Returns ``(card_count, reached_known)``.
+    """
+    deadline = deadline or Deadline()
+    platform = adapter.name
+    job_cards = selector_registry.find(platform, "job_cards", lambda sel: page.locator(sel).all()) or []
+    if not job_cards:
+        return 0, False
+    log.debug(f"✅ Found {len(job_cards)} {platform} job cards", stage="read", platform=platform, query=keyword,
+              count=len(job_cards))
+
+    reached_known = False
+    for card in job_cards[:50]:
+        deadline.check()
+        try:
+            title_link = selector_registry.find(platform, "title_link", lambda sel: first_match(card, sel))
+            if title_link is None:
+                continue
+            title = title_link.inner_text(timeout=deadline.timeout(5000)).strip()
+            href = title_link.get_attribute("href", timeout=deadline.timeout(5000))
+            
+            if not href or not title:
+                continue
+            
+            href = adapter.job_url(href)
+
+            job_id = canonical_job_id(platform, href)
+            if seen_ids is not None:
+                seen_ids.append(job_id)
+            if known_ids and job_id in known_ids:
+                reached_known = True
+                continue
+
+            if title_keywords:
+                if not any(kw.lower() in title.lower() for kw in title_keywords):
+                    continue
+
+            job = {"platform": platform, "keyword": keyword, "title": title, "url": href}
+            if adapter.easy_apply:
+                job["easy_apply"] = selector_registry.find(platform, "easy_apply", lambda sel: first_match(card, sel)) is not None
+            job["job_id"] = job_id
+            if "company" in adapter.selectors:
+                company = selector_registry.find(platform, "company", lambda sel: first_match(card, sel))
+                if company is not None:
+                    job["company"] = company.inner_text(timeout=deadline.timeout(5000)).strip()
+            results.append(job)
+            
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            log.debug(f"Skipped a {platform} card: {e}", sample=True, stage="read", platform=platform, query=keyword)
+            continue
+    return len(job_cards), reached_known
+
+def scroll_naukri_results(pages, deadline):
+    """Scroll Naukri result pages to the bottom so lazy-loaded cards render"""
+    for i in range(5):
+        deadline.check()
+        for page in pages:
+            page.keyboard.press("End")
+        deadline.sleep(1)
+
+def fetch_jobs(adapter, page, keyword, location, title_keywords=(), posted_within=None,
+               max_pages=1, known_ids=None, seen_ids=None, first_page=0, deadline=None, http_fetch=False):
+    """Fetch jobs with matching keywords from ``adapter``'s site.
+
+    Results are newest first, so when ``known_ids`` is given pagination stops
+    at the first page containing a job we have already seen. Every card's ID
+    (matching or not) is appended to ``seen_ids`` if a list is passed. When
+    ``deadline`` runs out the jobs collected so far are returned. With
+    ``http_fetch`` each page is first requested without rendering.
+    ``posted_within`` defaults to the adapter's own window.
+
+    Returns ``(jobs, complete)``; ``complete`` is True only when the search
+    stopped at a known job or at a short (or empty) page after the first,
+    i.e. the end of the results was really reached.
+    """
+    platform = adapter.name
+    started = time.perf_counter()
+    log.info(f"🔍 [{platform}] Searching: '{keyword}' in '{location}'", stage="fetch", platform=platform, query=keyword,
+             location=location)
+    deadline = deadline or Deadline()
+    posted_within = posted_within or adapter.default_posted_within
+    
+    results = []
+    complete = False
+    try:
+        for page_index in range(first_page, first_page + max_pages):
+            browser_host.checkpoint()
+            http_cards = None
+            if http_fetch:
+                http_cards = http_search_page(adapter, page.context.request, keyword, location, page_index,
+                                              posted_within, deadline)
+            if http_cards is not None:
+                cards = len(http_cards)
+                reached_known = collect_cards(adapter, keyword, http_cards, results, title_keywords, known_ids, seen_ids)
+            else:
+                url = adapter.search_url(keyword, location, page_index, posted_within)
+                search_rate_limiter.wait(url)
+                page.goto(url, timeout=deadline.timeout(60000))
+                page.wait_for_load_state("domcontentloaded", timeout=deadline.timeout(30000))
+                deadline.sleep(adapter.settle_seconds + random.random())
+                adapter.prepare([page], deadline)
+                cards, reached_known = read_cards(adapter, page, keyword, results, title_keywords, known_ids, seen_ids, deadline)
+            if not cards:
+                # An empty first page is more likely a login wall or broken selectors than no jobs
+                if page_index == first_page:
+                    log.warning(f"❌ No {platform} job cards found", stage="fetch", platform=platform, query=keyword)
+                else:
+                    complete = True
+                break
+            
+            if reached_known:
+                log.info(f"⏹️ Reached previously seen {platform} jobs", stage="fetch", platform=platform, query=keyword,
+                         page=page_index + 1)
+                complete = True
+                break
+            
+            if cards < adapter.page_size:
+                complete = True
+                break
+
+        log.info(f"✅ Found {len(results)} {platform} jobs matching criteria", stage="fetch", platform=platform,
+                 query=keyword, count=len(results), duration_ms=int((time.perf_counter() - started) * 1000))
+        return results, complete
+        
+    except Exception as e:
+        if deadline.expired:
+            deadline.mark_partial()
+            log.warning(f"⏱️ Deadline reached, returning {len(results)} {platform} jobs found so far", stage="fetch",
+                        platform=platform, query=keyword, count=len(results), duration_ms=int((time.perf_counter() - started) * 1000))
+        else:
+            log.error(f"❌ Error fetching {platform} jobs: {e}", stage="fetch", platform=platform, query=keyword, count=len(results))
+        return results, False
+
+# ---------------- HTTP Fetch Mode ----------------
+# Endpoints that return search results without rendering the site. They can
+# be pointed at a local stand-in server through the environment.
+LINKEDIN_GUEST_SEARCH_URL = os.getenv("LINKEDIN_GUEST_SEARCH_URL",
+                                      "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search")
+NAUKRI_SEARCH_API_URL = os.getenv("NAUKRI_SEARCH_API_URL", "https://www.naukri.com/jobapi/v3/search")
+NAUKRI_API_HEADERS = {"appid": "109", "systemid": "109"}
+NAUKRI_API_PAGE_SIZE = 20
+HTTP_FETCH_TIMEOUT = 15000
+
+class LinkedInCardParser(HTMLParser):
+    """Job cards from the HTML fragment served by LinkedIn's guest search endpoint"""
+
+    def __init__(self):
+        super().__init__()
+        self.cards = []
+        self.field = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        if tag == "li":
+            # The guest fragment doesn't always carry the Easy Apply badge, so no badge means unknown
+            self.cards.append({"title": "", "url": "", "company": "", "easy_apply": None})
+        if not self.cards:
+            return
+        card = self.cards[-1]
+        href = attrs.get("href") or ""
+        if tag == "a" and not card["url"] and ("base-card__full-link" in classes or "/jobs/view/" in href):
+            card["url"] = href
+        elif tag == "h3" and "base-search-card__title" in classes:
+            self.field = "title"
+        elif tag == "h4" and "base-search-card__subtitle" in classes:
+            self.field = "company"
+
+    def handle_endtag(self, tag):
+        if tag in ("h3", "h4"):
+            self.field = None
+
+    def handle_data(self, data):
+        if not self.cards:
+            return
+        if self.field:
+            self.cards[-1][self.field] += data
+        if "Easy Apply" in data:
+            self.cards[-1]["easy_apply"] = True
+
+def http_search_page(adapter, request_context, keyword, location, page_index=0, posted_within=None, deadline=None):
+    """Fetch one results page over HTTP, sharing the browser context's cookies.
+
+    Returns cards as ``{"title", "url", "company", "easy_apply"}`` dicts
+    (``easy_apply`` None when the response doesn't say), or
+    None when the adapter has no HTTP path or the response looks incomplete
+    (error status, login wall, unexpected markup) and the page should be
+    loaded in the browser instead.
+    """
+    deadline = deadline or Deadline()
+    try:
+        # The fast path counts toward the site's pacing like a page load
+        search_rate_limiter.wait(adapter.base_url)
+        cards = adapter.http_cards(request_context, keyword, location, page_index,
+                                   posted_within or adapter.default_posted_within, deadline)
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        log.info(f"ℹ️ {adapter.name} HTTP fetch failed ({e}), using the browser", stage="http", platform=adapter.name, query=keyword)
+        return None
+    if cards is None:
+        return None
+    
+    for card in cards:
+        card["title"] = " ".join(card["title"].split())
+        card["company"] = " ".join(card["company"].split())
+    if any(not card["title"] or not card["url"] for card in cards):
+        log.info(f"ℹ️ {adapter.name} HTTP response has incomplete cards, using the browser", stage="http",
+                 platform=adapter.name, query=keyword)
+        return None
+    return cards
+
+def collect_cards(adapter, keyword, cards, results, title_keywords=(), known_ids=None, seen_ids=None):
+    """Append matching HTTP-fetched cards to ``results`` like ``read_cards`` does.
+
+    Returns True if a previously seen job was reached.
+    """
+    platform = adapter.name
+    reached_known = False
+    for card in cards:
+        href = adapter.job_url(card["url"])
+        job_id = canonical_job_id(platform, href)
+        if seen_ids is not None:
+            seen_ids.append(job_id)
+        if known_ids and job_id in known_ids:
+            reached_known = True
+            continue
+        if title_keywords and not any(kw.lower() in card["title"].lower() for kw in title_keywords):
+            continue
+        job = {"platform": platform, "keyword": keyword, "title": card["title"], "url": href}
+        if adapter.easy_apply:
+            job["easy_apply"] = card["easy_apply"]
+        job["job_id"] = job_id
+        if card["company"]:
+            job["company"] = card["company"]
+        results.append(job)
+    return reached_known
+
+# ---------------- Platform Adapters ----------------
+class PlatformAdapter(abc.ABC):
+    """One job site, described for the shared search engine.
+
+    An adapter says how to log in and check a login, how to build the URL of
+    a results page, how to get a rendered page ready for reading and which
+    selector roles hold the cards; optionally it can fetch a page over HTTP.
+    Tab pooling, waves, deadlines, login reuse, page caching, rate limiting
+    and the cap on concurrent tabs come from the engine (``fetch_jobs``,
+    ``parallel_search``, ``ensure_logged_in``), so a new site only fills in
+    these and calls ``register_platform``.
+    """
+    key = ""
+    name = ""
+    base_url = ""
+    page_size = 25
+    # Posting-age filter used when the caller doesn't ask for one (seconds, None for the site default)
+    default_posted_within = None
+    # Seconds to let results render after DOMContentLoaded, before reading
+    settle_seconds = 3
+    # Most tabs of this site loading at once, and the least time between two results page loads
+    max_tabs = 4
+    min_interval = 0.0
+    # Seconds a fully read results page is reused by later searches
+    cache_ttl = 120
+    # Regex on the URL path whose first group is the site's own job ID
+    id_pattern = None
+    strip_query = False
+    easy_apply = False
+    needs_login = True
+    # Selector strategies per role: job_cards and title_link, optionally easy_apply and company
+    selectors = {}
+
+    def configured(self, profile):
+        return not self.needs_login
+
+    def login(self, page, profile, deadline):
+        return True
+
+    def is_logged_in(self, page, deadline):
+        return True
+
+    @abc.abstractmethod
+    def search_url(self, keyword, location, page_index, posted_within):
+        """URL of results page ``page_index`` (0-based), newest first"""
+
+    def prepare(self, pages, deadline):
+        """Get loaded result pages ready for reading (e.g. scroll to load lazy cards)"""
+
+    def http_cards(self, request_context, keyword, location, page_index, posted_within, deadline):
+        """Cards of one results page fetched without rendering, or None to load it in a tab"""
+        return None
+
+    def attach(self, context):
+        """Called for every new profile context (e.g. to install routes)"""
+
+    def job_url(self, href):
+        if not href.startswith("http"):
+            href = self.base_url + href
+        return href.split("?")[0] if self.strip_query else href
+
+class LinkedInAdapter(PlatformAdapter):
+    key = "linkedin"
+    name = "LinkedIn"
+    base_url = "https://www.linkedin.com"
+    page_size = LINKEDIN_PAGE_SIZE
+    default_posted_within = DEFAULT_POSTED_WITHIN
+    settle_seconds = 4
+    # LinkedIn throttles bursts of search page loads
+    min_interval = 0.5
+    id_pattern = r"/jobs/view/(?:[^/]*?-)?(\d+)"
+    strip_query = True
+    easy_apply = True
+    selectors = SEARCH_SELECTORS["LinkedIn"]
+
+    def configured(self, profile):
+        return profile.linkedin_configured
+
+    def login(self, page, profile, deadline):
+        return login_linkedin(page, profile.linkedin_email, profile.linkedin_password, deadline)
+
+    def is_logged_in(self, page, deadline):
+        page.goto("https://www.linkedin.com/feed/", timeout=deadline.timeout(10000))
+        return "feed" in page.url or "jobs" in page.url
+
+    def search_url(self, keyword, location, page_index, posted_within):
+        return build_linkedin_all_jobs_url(keyword, location, posted_within, page_index * self.page_size)
+
+    def http_cards(self, request_context, keyword, location, page_index, posted_within, deadline):
+        params = {"keywords": keyword, "location": location, "f_TPR": f"r{int(posted_within)}",
+                  "sortBy": "DD", "start": page_index * self.page_size}
+        response = request_context.get(LINKEDIN_GUEST_SEARCH_URL, params=params,
+                                       timeout=deadline.timeout(HTTP_FETCH_TIMEOUT))
+        if response.status != 200:
+            log.info(f"ℹ️ LinkedIn HTTP fetch returned {response.status}, using the browser", stage="http", platform=self.name,
+                     query=keyword, status=response.status)
+            return None
+        parser = LinkedInCardParser()
+        parser.feed(response.text())
+        cards = [card for card in parser.cards if card["url"] or card["title"].strip()]
+        # An empty first page is more likely a login wall or throttling than no jobs
+        if not cards and page_index == 0:
+            log.info("ℹ️ LinkedIn HTTP fetch found no cards, using the browser", stage="http", platform=self.name, query=keyword)
+            return None
+        return cards
+
+class NaukriAdapter(PlatformAdapter):
+    key = "naukri"
+    name = "Naukri"
+    base_url = "https://www.naukri.com"
+    page_size = NAUKRI_API_PAGE_SIZE
+    id_pattern = r"-(\d{9,})$"
+    selectors = SEARCH_SELECTORS["Naukri"]
+
+    def configured(self, profile):
+        return profile.naukri_configured
+
+    def login(self, page, profile, deadline):
+        return login_naukri(page, profile.naukri_email, profile.naukri_password, deadline)
+
+    def is_logged_in(self, page, deadline):
+        page.goto("https://www.naukri.com/mnjuser/homepage", timeout=deadline.timeout(10000))
+        current_url = page.url.lower()
+        if "mnjuser" in current_url or "homepage" in current_url:
+            return True
+        return page.locator('text="Complete profile"').count() > 0 or page.locator('text="My home"').count() > 0
+
+    def search_url(self, keyword, location, page_index, posted_within):
+        # Naukri only filters by whole days
+        job_age_days = math.ceil(posted_within / 86400) if posted_within else None
+        return build_naukri_url(keyword, location, page_index + 1, job_age_days)
+
+    def prepare(self, pages, deadline):
+        scroll_naukri_results(pages, deadline)
+
+    def http_cards(self, request_context, keyword, location, page_index, posted_within, deadline):
+        params = {"noOfResults": NAUKRI_API_PAGE_SIZE, "urlType": "search_by_keyword", "searchType": "adv",
+                  "keyword": keyword, "location": location, "pageNo": page_index + 1}
+        if posted_within:
+            params["jobAge"] = math.ceil(posted_within / 86400)
+        response = request_context.get(NAUKRI_SEARCH_API_URL, params=params, headers=NAUKRI_API_HEADERS,
+                                       timeout=deadline.timeout(HTTP_FETCH_TIMEOUT))
+        if response.status != 200:
+            log.info(f"ℹ️ Naukri HTTP fetch returned {response.status}, using the browser", stage="http", platform=self.name,
+                     query=keyword, status=response.status)
+            return None
+        details = response.json().get("jobDetails")
+        # Like LinkedIn's, an empty first page is more likely a login wall or throttling than no jobs
+        if details is None or (not details and page_index == 0):
+            log.info("ℹ️ Naukri HTTP fetch returned no job list, using the browser", stage="http", platform=self.name, query=keyword)
+            return None
+        return [{"title": job.get("title") or "", "url": job.get("jdURL") or "",
+                 "company": job.get("companyName") or "", "easy_apply": False} for job in details]
+
+SAMPLE_FIXTURE = os.getenv("SAMPLE_PLATFORM_FIXTURE", os.path.join("fixtures", "sample_jobs.json"))
+
+class SampleAdapter(PlatformAdapter):
+    """A made-up job site served from a JSON fixture, for trying the engine offline.
+
+    Its pages are answered by a route on each context, so nothing leaves
+    the machine; the HTTP fast path reads the same fixture. Enabled with
+    ``ENABLE_SAMPLE_PLATFORM=1``.
+    """
+    key = "sample"
+    name = "Sample"
+    base_url = "https://jobs.example.test"
+    page_size = 10
+    settle_seconds = 0
+    max_tabs = 2
+    id_pattern = r"/jobs/(\d+)$"
+    needs_login = False
+    selectors = {
+        "job_cards": ['li.job'],
+        "title_link": ['a.job-title'],
+        "company": ['span.company']
+    }
+
+    def __init__(self, fixture=SAMPLE_FIXTURE):
+        self.fixture = fixture
+        self.postings = None
+
+    def search(self, keyword, location, page_index):
+        if self.postings is None:
+            with open(self.fixture, encoding="utf-8") as f:
+                self.postings = json.load(f)
+        words = keyword.lower().split()
+        matches = [job for job in self.postings
+                   if all(word in job["title"].lower() for word in words)
+                   and (not location or location.lower() in (job["location"].lower(), job["country"].lower()))]
+        return matches[page_index * self.page_size:(page_index + 1) * self.page_size]
+
+    def search_url(self, keyword, location, page_index, posted_within):
+        return f"{self.base_url}/search?{urlencode({'q': keyword, 'l': location, 'page': page_index + 1})}"
+
+    def attach(self, context):
+        context.route(f"{self.base_url}/**", self._serve)
+
+    def _serve(self, route):
+        url = urlparse(route.request.url)
+        if url.path != "/search":
+            route.fulfill(status=200, content_type="text/html", body=f"<html><body><h1>Posting {html.escape(url.path)}</h1></body></html>")
+            return
+        query = parse_qs(url.query)
+        jobs = self.search(query.get("q", [""])[0], query.get("l", [""])[0], int(query.get("page", ["1"])[0]) - 1)
+        items = "".join(f'<li class="job"><a class="job-title" href="/jobs/{job["id"]}">{html.escape(job["title"])}</a>'
+                        f'<span class="company">{html.escape(job["company"])}</span></li>' for job in jobs)
+        route.fulfill(status=200, content_type="text/html", body=f"<html><body><ul>{items}</ul></body></html>")
+
+    def http_cards(self, request_context, keyword, location, page_index, posted_within, deadline):
+        return [{"title": job["title"], "url": f"/jobs/{job['id']}", "company": job["company"], "easy_apply": False}
+                for job in self.search(keyword, location, page_index)]
+
+PLATFORMS = OrderedDict()
+PLATFORMS_BY_NAME = {}
+
+def register_platform(adapter):
+    """Make ``adapter`` searchable everywhere platforms are offered"""
+    PLATFORMS[adapter.key] = adapter
+    PLATFORMS_BY_NAME[adapter.name] = adapter
+    PLATFORM_NAMES[adapter.key] = adapter.name
+    return adapter
+
+def platform_adapters(profile, platform="all", warn=False):
+    """Adapters ``platform`` ("all" or a key) covers that ``profile`` can search"""
+    adapters = []
+    for adapter in PLATFORMS.values():
+        if platform not in ("all", adapter.key):
+            continue
+        if adapter.configured(profile):
+            adapters.append(adapter)
+        elif warn:
+            log.warning(f"⚠️ {adapter.name} credentials not configured", stage="search", platform=adapter.name, profile=profile.name)
+    return adapters
+
+register_platform(LinkedInAdapter())
+register_platform(NaukriAdapter())
+if os.getenv("ENABLE_SAMPLE_PLATFORM", "").strip().lower() in ("1", "true", "yes"):
+    register_platform(SampleAdapter())
+
+class PageCache:
+    """Recently read results pages, reused for each adapter's ``cache_ttl``"""
+
+    def __init__(self, max_entries=500):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.pages = OrderedDict()
+        self.hits = 0
+
+    def get(self, adapter, key):
+        with self.lock:
+            entry = self.pages.get(key)
+            if entry is None or time.time() - entry[0] > adapter.cache_ttl:
+                return None
+            self.hits += 1
+            jobs, seen = entry[1]
+        # Callers tag and merge rows, so each gets its own copies
+        return [dict(job) for job in jobs], list(seen)
+
+    def put(self, key, jobs, seen):
+        with self.lock:
+            self.pages[key] = (time.time(), ([dict(job) for job in jobs], list(seen)))
+            self.pages.move_to_end(key)
+            while len(self.pages) > self.max_entries:
+                self.pages.popitem(last=False)
+
+page_cache = PageCache()
+
+# ---------------- Parallel Search ----------------
+SEARCH_MAX_TABS = 4
+
+def parallel_search(profile, queries, deadline=None, max_tabs=SEARCH_MAX_TABS, verify_login=True):
+    """Run ``(platform, keyword, location, page_index)`` queries on tabs of one logged-in context.
+
+    Each platform logs in once; after that queries go out in waves of up to
+    ``max_tabs`` tabs, with no more of one site's queries per wave than its
+    adapter's ``max_tabs``. Every tab in a wave starts loading before any is
+    read, and the settle time and page preparation (Naukri scrolling) are
+    shared by the whole wave, so a wave costs about as much as a single
+    query. Returns one ``(jobs, seen_ids, error, cached)`` per query, in
+    order; ``error`` is None when the page was read completely. Pages read
+    completely within an adapter's ``cache_ttl`` are reused and come back
+    with ``cached`` set, so callers don't count them twice. With the
+    profile's HTTP fetch setting each query is first requested without
+    rendering, and only queries whose response looks incomplete are loaded
+    in tabs. Runs on the browser thread.
+    """
+    deadline = deadline or Deadline()
+    session = browser_host.get_session(profile)
+    outcomes = [([], [], "Not searched before the deadline", False) for _ in queries]
+    
+    def cache_key(index):
+        platform, keyword, location, page_index = queries[index]
+        return (platform, keyword.lower(), location.lower(), page_index, tuple(profile.apply_title_keywords))
+    
+    browser_queries = []
+    for index, (platform, keyword, location, page_index) in enumerate(queries):
+        cached = page_cache.get(PLATFORMS[platform], cache_key(index))
+        if cached is not None:
+            outcomes[index] = (cached[0], cached[1], None, True)
+            log.debug(f"♻️ [{PLATFORM_NAMES[platform]}] '{keyword}' page {page_index + 1}: {len(cached[0])} jobs from cache",
+                      stage="cache", platform=PLATFORM_NAMES[platform], query=keyword, page=page_index + 1, count=len(cached[0]))
+        else:
+            browser_queries.append(index)
+    
+    if profile.http_fetch:
+        http_queries, browser_queries = browser_queries, []
+        for index in http_queries:
+            platform, keyword, location, page_index = queries[index]
+            adapter = PLATFORMS[platform]
+            try:
+                cards = http_search_page(adapter, session['context'].request, keyword, location, page_index,
+                                         deadline=deadline)
+            except DeadlineExceeded:
+                break
+            if cards is None:
+                browser_queries.append(index)
+                continue
+            jobs, seen = [], []
+            collect_cards(adapter, keyword, cards, jobs, profile.apply_title_keywords, seen_ids=seen)
+            outcomes[index] = (jobs, seen, None, False)
+            page_cache.put(cache_key(index), jobs, seen)
+            log.debug(f"⚡ [{adapter.name}] '{keyword}' page {page_index + 1}: {len(jobs)} jobs over HTTP", stage="http",
+                      platform=adapter.name, query=keyword, page=page_index + 1, count=len(jobs))
+    
+    platforms = list(dict.fromkeys(queries[index][0] for index in browser_queries))
+    ready = set()
+    for i, name in enumerate(platforms):
+        if not PLATFORMS[name].needs_login or (not verify_login and session['logged_in'].get(name)):
+            ready.add(name)
+            continue
+        share = deadline.split(len(platforms) - i)
+        if ensure_logged_in(profile, name, share):
+            ready.add(name)
+            continue
+        if share.expired:
+            share.mark_partial()
+        reason = "Deadline reached before login" if share.expired else f"{PLATFORM_NAMES[name]} login failed"
+        log.warning(f"⚠️ {reason}", stage="login", platform=PLATFORM_NAMES[name], profile=profile.name)
+        for index in browser_queries:
+            if queries[index][0] == name:
+                outcomes[index] = ([], [], reason, False)
+    
+    pending = [index for index in browser_queries if queries[index][0] in ready]
+    while pending:
+        if deadline.expired:
+            deadline.mark_partial()
+            break
+        browser_host.checkpoint()
+        # Fill the wave in query order, holding back queries of sites already at their cap
+        wave, held, per_site = [], [], Counter()
+        for index in pending:
+            adapter = PLATFORMS[queries[index][0]]
+            if len(wave) < max_tabs and per_site[adapter.key] < adapter.max_tabs:
+                wave.append(index)
+                per_site[adapter.key] += 1
+            else:
+                held.append(index)
+        tabs = get_tab_pool(session, len(wave), key='search_tabs')
+        wave, pending = wave[:len(tabs)], wave[len(tabs):] + held
+        
+        started = []
+        for tab, index in zip(tabs, wave):
+            platform, keyword, location, page_index = queries[index]
+            adapter = PLATFORMS[platform]
+            log.info(f"🔍 [{adapter.name}] Searching: '{keyword}' in '{location}' (page {page_index + 1})", stage="search",
+                     platform=adapter.name, query=keyword, location=location, page=page_index + 1)
+            try:
+                url = adapter.search_url(keyword, location, page_index, adapter.default_posted_within)
+                search_rate_limiter.wait(url)
+                tab.goto(url, wait_until="commit", timeout=deadline.timeout(60000))
+                started.append((tab, index))
+            except Exception as e:
+                outcomes[index] = ([], [], str(e), False)
+        
+        loaded = []
+        for n, (tab, index) in enumerate(started):
+            try:
+                tab.wait_for_load_state("domcontentloaded", timeout=deadline.split(len(started) - n).timeout(30000))
+                loaded.append((tab, index))
+            except Exception as e:
+                outcomes[index] = ([], [], str(e), False)
+        try:
+            sites = list(dict.fromkeys(PLATFORMS[queries[index][0]] for tab, index in loaded))
+            if sites:
+                deadline.sleep(max(adapter.settle_seconds for adapter in sites) + random.random())
+            for adapter in sites:
+                adapter.prepare([tab for tab, index in loaded if queries[index][0] == adapter.key], deadline)
+        except DeadlineExceeded:
+            pass
+        
+        for n, (tab, index) in enumerate(loaded):
+            platform, keyword, location, page_index = queries[index]
+            jobs, seen = [], []
+            try:
+                read_cards(PLATFORMS[platform], tab, keyword, jobs, profile.apply_title_keywords, seen_ids=seen,
+                           deadline=deadline.split(len(loaded) - n))
+                # A closed tab reads as an empty page, which would look like the end of the results
+                if tab.is_closed():
+                    outcomes[index] = (jobs, seen, "Browser closed during the search", False)
+                else:
+                    outcomes[index] = (jobs, seen, None, False)
+                    page_cache.put(cache_key(index), jobs, seen)
+            except Exception as e:
+                # Jobs read before the deadline are still returned
+                outcomes[index] = (jobs, seen, str(e), False)
+    return outcomes
+
+# ---------------- Incremental Search ----------------
+INCREMENTAL_MAX_PAGES = 5
+WATERMARK_SEEN_LIMIT = 500
+WATERMARK_JOBS_LIMIT = 500
+# Slack added to the gap since the last run so postings indexed late aren't missed
+WATERMARK_OVERLAP = 15 * 60
+MIN_POSTED_WITHIN = 3600
+MAX_POSTED_WITHIN = 30 * 86400
+
+def query_key(platform, keyword, location):
+    return "|".join(part.strip().lower() for part in (platform, keyword, location))
+
+def posted_window(last_run, now=None):
+    """Smallest posted-time window (seconds) that covers the gap since ``last_run``"""
+    if not last_run:
+        return DEFAULT_POSTED_WITHIN
+    gap = (now or time.time()) - last_run + WATERMARK_OVERLAP
+    return int(min(max(gap, MIN_POSTED_WITHIN), MAX_POSTED_WITHIN))
+
+class WatermarkStore:
+    """Per-profile watermarks: last run time, newest job IDs and stored results per query"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.marks = None
+
+    def _load(self):
+        if self.marks is None:
+            self.marks = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self.marks = json.load(f)
+                except Exception as e:
+                    log.warning(f"⚠️ Could not read watermarks: {e}", stage="incremental")
+
+    def get(self, key):
+        with self.lock:
+            self._load()
+            return self.marks.get(key)
+
+    def put(self, key, mark):
+        with self.lock:
+            self._load()
+            self.marks[key] = mark
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.marks, f)
+            os.replace(tmp, self.path)
+
+def job_key(job):
+    return job.get("job_id") or canonical_job_id(job["platform"], job["url"])
+
+def merge_jobs(new_jobs, old_jobs):
+    """New jobs first, then older ones not superseded by a new copy"""
+    merged, ids = [], set()
+    for job in list(new_jobs) + list(old_jobs):
+        job_id = job_key(job)
+        if job_id not in ids:
+            ids.add(job_id)
+            merged.append(job)
+    return merged
+
+def incremental_search(profile, adapter, page, keyword, location, deadline=None):
+    """Fetch only postings newer than this query's watermark and merge them in"""
+    deadline = deadline or Deadline()
+    key = query_key(adapter.key, keyword, location)
+    mark = profile.watermarks.get(key) or {"last_run": None, "seen": [], "jobs": []}
+    started = time.time()
+    window = posted_window(mark["last_run"], started)
+    log.info(f"⏱️ Incremental search: postings from the last {window // 60} minutes", stage="incremental",
+             platform=adapter.name, query=keyword, window_s=window)
+    
+    seen = []
+    new_jobs, complete = fetch_jobs(adapter, page, keyword, location, profile.apply_title_keywords, posted_within=window,
+                          max_pages=INCREMENTAL_MAX_PAGES, known_ids=set(mark["seen"]), seen_ids=seen,
+                          deadline=deadline, http_fetch=profile.http_fetch)
+    job_history.record(new_jobs)
+    analytics.record_search(adapter.key, keyword, new_jobs, len(seen))
+    merged = merge_jobs(new_jobs, mark["jobs"])
+    
+    if deadline.partial or not complete:
+        # Older pages weren't reached (deadline, error, empty first page or
+        # page limit), so the watermark stays put and the next run covers
+        # the same window again
+        reason = "before the deadline" if deadline.partial else "from an unfinished search"
+        if not deadline.partial:
+            deadline.mark_failed(f"{adapter.name} '{keyword}': stopped before reaching known jobs")
+        log.warning(f"⏱️ {len(new_jobs)} new jobs {reason}, watermark not advanced", stage="incremental",
+                    platform=adapter.name, query=keyword, count=len(new_jobs))
+        for job in new_jobs:
+            job["is_new"] = True
+        return merged
+    
+    new_seen = list(dict.fromkeys(seen + mark["seen"]))
+    profile.watermarks.put(key, {
+        "last_run": started,
+        "seen": new_seen[:WATERMARK_SEEN_LIMIT],
+        "jobs": [dict(job) for job in merged[:WATERMARK_JOBS_LIMIT]]
+    })
+    log.info(f"🆕 {len(new_jobs)} new jobs, {len(merged)} stored for this search", stage="incremental",
+             platform=adapter.name, query=keyword, count=len(new_jobs), stored=len(merged))
+    
+    for job in new_jobs:
+        job["is_new"] = True
+    return merged
+
+# ---------------- Job Detail Enrichment ----------------
+DETAIL_CACHE_DIR = os.path.join("cache", "job_details")
+# Applicant counts and "posted N days ago" go stale, so cached details are fetched again after this
+DETAIL_CACHE_TTL = 24 * 3600
+ENRICH_MAX_TABS = 4
+# Tabs across every pool of one context, and navigations before a tab is replaced
+MAX_TABS_PER_CONTEXT = 8
+TAB_RECYCLE_AFTER = 50
+TAB_POOLS = ('tabs', 'search_tabs', 'apply_tabs')
+DOMAIN_MIN_INTERVAL = {"www.linkedin.com": 2.0, "www.naukri.com": 1.0}
+DEFAULT_MIN_INTERVAL = 1.0
+
+DETAIL_SELECTORS = {
+    "LinkedIn": {
+        "description": ['div.jobs-description__content', 'div.show-more-less-html__markup', '#job-details'],
+        "company": ['div.job-details-jobs-unified-top-card__company-name a', 'a.topcard__org-name-link',
+                    'span.topcard__flavor'],
+        "top_card": ['div.job-details-jobs-unified-top-card__primary-description-container',
+                     'div.jobs-unified-top-card', 'section.top-card-layout'],
+        "experience": ['li.description__job-criteria-item:has-text("Seniority level") span.description__job-criteria-text'],
+        "salary": ['div.salary', 'div.compensation__salary', 'li:has-text("/yr")']
+    },
+    "Naukri": {
+        "description": ['section[class*="job-desc"]', 'div.job-desc', 'div.dang-inner-html'],
+        "company": ['div[class*="jd-header-comp-name"] a', 'a.pad-rt-8'],
+        "top_card": ['section[class*="job-header-container"]', 'div.jd-header', 'div[class*="jhc__stat"]'],
+        "experience": ['div[class*="jhc__exp"] span', 'div.exp span'],
+        "salary": ['div[class*="jhc__salary"] span', 'div.salary span']
+    }
+}
+
+class JobDetailCache:
+    """Compressed on-disk cache of job details keyed by canonical job ID.
+
+    Each entry is stored at a path derived from the SHA-1 of the job ID, so a
+    posting is fetched at most once per DETAIL_CACHE_TTL across keywords,
+    profiles and runs.
+    """
+
+    def __init__(self, root=DETAIL_CACHE_DIR):
+        self.root = root
+
+    def path(self, job_id):
+        digest = hashlib.sha1(job_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], digest + ".json.z")
+
+    def get(self, job_id, max_age=DETAIL_CACHE_TTL):
+        try:
+            with open(self.path(job_id), "rb") as f:
+                details = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f"⚠️ Corrupt detail cache entry for {job_id}: {e}", stage="details", job_id=job_id)
+            return None
+        # Entries written before fetched_at was stored count as expired
+        if time.time() - details.pop("fetched_at", 0) > max_age:
+            return None
+        return details
+
+    def put(self, job_id, details):
+        path = self.path(job_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(zlib.compress(json.dumps(dict(details, fetched_at=time.time())).encode("utf-8"), 6))
+        os.replace(tmp, path)
+
+detail_cache = JobDetailCache()
+
+class DomainRateLimiter:
+    """Enforce a minimum interval between requests to the same domain"""
+
+    def __init__(self, intervals=None, default=DEFAULT_MIN_INTERVAL):
+        self.intervals = intervals or {}
+        self.default = default
+        self.last = {}
+        self.lock = threading.Lock()
+
+    def wait(self, url):
+        domain = urlparse(url).netloc
+        interval = self.intervals.get(domain, self.default)
+        with self.lock:
+            now = time.monotonic()
+            ready_at = max(now, self.last.get(domain, 0) + interval)
+            self.last[domain] = ready_at
+        if ready_at > now:
+            time.sleep(ready_at - now)
+
+rate_limiter = DomainRateLimiter(DOMAIN_MIN_INTERVAL)
+# Results pages are paced separately, by each adapter's ``min_interval``
+search_rate_limiter = DomainRateLimiter({urlparse(adapter.base_url).netloc: adapter.min_interval
+                                         for adapter in PLATFORMS.values()}, default=0)
+
+def get_tab_pool(session, size, key='tabs'):
+    """Reusable extra tabs in a profile's context.
+
+    Each pool is capped at ``size`` and all pools of a context together at
+    MAX_TABS_PER_CONTEXT (the result may be smaller than ``size``, never
+    empty). A tab handed out TAB_RECYCLE_AFTER times is closed and replaced,
+    which keeps long-lived renderers from growing without bound.
+    """
+    others = sum(len(session.get(pool, [])) for pool in TAB_POOLS if pool != key)
+    size = max(1, min(size, MAX_TABS_PER_CONTEXT - others))
+    uses = session.setdefault('tab_uses', {})
+    tabs = []
+    for tab in session.setdefault(key, []):
+        if not tab.is_closed() and uses.get(id(tab), 0) >= TAB_RECYCLE_AFTER:
+            try:
+                tab.close()
+            except:
+                pass
+        if tab.is_closed():
+            uses.pop(id(tab), None)
+        else:
+            tabs.append(tab)
+    while len(tabs) < size:
+        tabs.append(session['context'].new_page())
+    session[key] = tabs
+    for tab in tabs[:size]:
+        uses[id(tab)] = uses.get(id(tab), 0) + 1
+    return tabs[:size]
+
+def first_text(page, selectors, timeout=2000):
+    for sel in selectors:
+        try:
+            loc = page.locator(sel).first
+            if loc.count() > 0:
+                text = loc.inner_text(timeout=timeout).strip()
+                if text:
+                    return text
+        except:
+            continue
+    return ""
+
+def extract_job_details(page, platform, deadline=None):
+    deadline = deadline or Deadline()
+    text = lambda role: selector_registry.text(page, platform, role, deadline.timeout(2000))
+    top_card = text("top_card")
+    details = {
+        "company": text("company"),
+        "description": text("description"),
+        "experience": text("experience"),
+        "salary": text("salary"),
+        "applicants": "",
+        "posted": ""
+    }
+    match = re.search(r"(\d[\d,+]*)\s+applicants|Applicants:\s*(\d[\d,+]*)", top_card, re.I)
+    if match:
+        details["applicants"] = match.group(1) or match.group(2)
+    match = re.search(r"(\d+\+?\s+(?:minute|hour|day|week|month)s?\s+ago|just now|today)", top_card, re.I)
+    if match:
+        details["posted"] = match.group(1)
+    if not details["experience"]:
+        match = re.search(r"(\d+\s*-\s*\d+\s*(?:Yrs|years))", top_card, re.I)
+        if match:
+            details["experience"] = match.group(1)
+    if platform == "LinkedIn":
+        # Settles cards the HTTP fast path left as unknown
+        details["easy_apply"] = find_visible(page, APPLY_SELECTORS["open"]) is not None
+    return details
+
+def enrich_jobs(profile, jobs, max_tabs=ENRICH_MAX_TABS, deadline=None):
+    """Add detail-page fields to ``jobs`` in place (runs on the browser thread).
+
+    Cached postings are filled straight from the cache; the rest are loaded
+    through a bounded pool of tabs. All tabs in a batch start navigating
+    before any is read, so page loads overlap instead of running back to back.
+    Stops early once ``deadline`` runs out. Returns the number of detail
+    pages fetched.
+    """
+    deadline = deadline or Deadline()
+    pending, enriched = [], []
+    for job in jobs:
+        cached = detail_cache.get(job_key(job))
+        if cached is not None:
+            job.update(cached)
+        else:
+            pending.append(job)
+    
+    if not pending:
+        return 0
+    
+    log.info(f"📄 Fetching details for {len(pending)} jobs ({len(jobs) - len(pending)} cached)", stage="details",
+             count=len(pending), cached=len(jobs) - len(pending))
+    tabs = get_tab_pool(browser_host.get_session(profile), max_tabs)
+    fetched = 0
+    for start in range(0, len(pending), len(tabs)):
+        if deadline.expired:
+            deadline.mark_partial()
+            log.warning(f"⏱️ Deadline reached, {len(pending) - start} jobs left without details", stage="details",
+                        count=len(pending) - start)
+            break
+        browser_host.checkpoint()
+        batch = list(zip(tabs, pending[start:start + len(tabs)]))
+        started = []
+        for tab, job in batch:
+            try:
+                rate_limiter.wait(job["url"])
+                tab.goto(job["url"], wait_until="commit", timeout=deadline.timeout(30000))
+                started.append((tab, job))
+            except Exception as e:
+                log.warning(f"⚠️ Could not open {job['url']}: {e}", sample=True, stage="details", platform=job["platform"],
+                            url=job["url"])
+        for tab, job in started:
+            try:
+                tab.wait_for_load_state("domcontentloaded", timeout=deadline.timeout(30000))
+                details = extract_job_details(tab, job["platform"], deadline)
+                if deadline.expired:
+                    # Reads cut short by the deadline come back blank rather than failing
+                    deadline.mark_partial()
+                elif any(details.get(field) for field in DETAIL_FIELDS):
+                    # Nothing extracted means an auth wall or changed markup, not a posting without details
+                    detail_cache.put(job_key(job), details)
+                job.update(details)
+                enriched.append(job)
+                fetched += 1
+            except Exception as e:
+                log.warning(f"⚠️ Could not read details for {job['url']}: {e}", sample=True, stage="details",
+                            platform=job["platform"], url=job["url"])
+    job_history.record(enriched)
+    log.info(f"✅ Enriched {fetched} jobs", stage="details", count=fetched)
+    return fetched
+
+# ---------------- Selector Registry ----------------
+SELECTORS_FILE = "selectors.json"
+SELECTOR_RELOAD_INTERVAL = 5.0
+SELECTOR_WINDOW = 50
+SELECTOR_ALERT_MIN_LOOKUPS = 10
+SELECTOR_ALERT_RATE = 0.5
+# Roles that should match on every page; the rest (Easy Apply badge, salary...) are often absent
+SELECTOR_ALERT_ROLES = ("job_cards", "title_link", "description")
+
+class SelectorRegistry:
+    """Selector strategies per platform and role, fastest-to-succeed first.
+
+    The strategy that last matched is moved to the front, so after a markup
+    change only the first lookup pays for the dead selectors. Hit rate and
+    latency are kept per selector and match rate per role; a required role
+    whose recent match rate drops below SELECTOR_ALERT_RATE raises an alert.
+    Strategies in ``selectors.json`` (same shape as the defaults) replace the
+    built-in ones and are picked up without a restart.
+    """
+
+    def __init__(self, defaults, path=SELECTORS_FILE):
+        self.defaults = defaults
+        self.path = path
+        self.lock = threading.Lock()
+        self.order = {}
+        self.stats = {}
+        self.recent = {}
+        self.alerts = {}
+        self.loaded_mtime = None
+        self.checked_at = 0
+        self._apply({})
+
+    def _apply(self, overrides):
+        order = {}
+        for platform in set(self.defaults) | set(overrides):
+            for role in set(self.defaults.get(platform, {})) | set(overrides.get(platform, {})):
+                selectors = overrides.get(platform, {}).get(role) or self.defaults.get(platform, {}).get(role, [])
+                previous = self.order.get((platform, role), [])
+                # Keep the learned order for strategies that are still listed
+                order[(platform, role)] = [s for s in previous if s in selectors] + [s for s in selectors if s not in previous]
+        self.order = order
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if now - self.checked_at < SELECTOR_RELOAD_INTERVAL:
+            return
+        self.checked_at = now
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None
+        if mtime == self.loaded_mtime:
+            return
+        overrides = {}
+        if mtime is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    overrides = json.load(f)
+            except Exception as e:
+                log.warning(f"⚠️ Could not load {self.path}, keeping current selectors: {e}", stage="selectors")
+                return
+        with self.lock:
+            self._apply(overrides)
+            self.loaded_mtime = mtime
+        log.info(f"🔄 Loaded selectors from {self.path}" if mtime else "🔄 Using built-in selectors", stage="selectors")
+
+    def selectors(self, platform, role):
+        self._maybe_reload()
+        with self.lock:
+            return list(self.order.get((platform, role), []))
+
+    def find(self, platform, role, probe):
+        """First truthy ``probe(selector)`` result over the role's strategies, or None"""
+        for sel in self.selectors(platform, role):
+            started = time.perf_counter()
+            try:
+                result = probe(sel)
+            except DeadlineExceeded:
+                raise
+            except Exception:
+                result = None
+            self._record(platform, role, sel, bool(result), time.perf_counter() - started)
+            if result:
+                return result
+        self._record(platform, role, None, False, 0)
+        return None
+
+    def text(self, page, platform, role, timeout=2000):
+        """Inner text of the first element matched for ``role``, or ''"""
+        def probe(sel):
+            loc = page.locator(sel).first
+            return loc.inner_text(timeout=timeout).strip() if loc.count() > 0 else ""
+        return self.find(platform, role, probe) or ""
+
+    def _record(self, platform, role, sel, hit, elapsed):
+        key = (platform, role)
+        with self.lock:
+            if sel is not None:
+                stat = self.stats.setdefault((platform, role, sel), [0, 0, 0.0])
+                stat[0] += 1
+                stat[1] += hit
+                stat[2] += elapsed
+                if not hit:
+                    return
+                order = self.order.get(key, [])
+                if order and order[0] != sel and sel in order:
+                    order.remove(sel)
+                    order.insert(0, sel)
+            recent = self.recent.setdefault(key, deque(maxlen=SELECTOR_WINDOW))
+            recent.append(hit)
+            if role not in SELECTOR_ALERT_ROLES or len(recent) < SELECTOR_ALERT_MIN_LOOKUPS:
+                return
+            rate = sum(recent) / len(recent)
+            alerting = rate < SELECTOR_ALERT_RATE
+            if alerting and key not in self.alerts:
+                self.alerts[key] = rate
+                log.warning(f"🚨 Selector alert: {platform} '{role}' matched only {rate:.0%} of the last {len(recent)} lookups"
+                            f" - update {self.path}", stage="selectors", platform=platform, role=role, match_rate=round(rate, 3))
+            elif not alerting and key in self.alerts:
+                del self.alerts[key]
+                log.info(f"✅ {platform} '{role}' selectors are matching again ({rate:.0%})", stage="selectors", platform=platform,
+                         role=role, match_rate=round(rate, 3))
+
+    def health(self):
+        """Match rates per role and hit rate/latency per selector"""
+        self._maybe_reload()
+        report = {}
+        with self.lock:
+            for (platform, role), order in sorted(self.order.items()):
+                recent = self.recent.get((platform, role), ())
+                entries = []
+                for sel in order:
+                    tries, hits, elapsed = self.stats.get((platform, role, sel), (0, 0, 0.0))
+                    entries.append({
+                        "selector": sel,
+                        "tries": tries,
+                        "hit_rate": round(hits / tries, 3) if tries else None,
+                        "avg_ms": round(elapsed * 1000 / tries, 1) if tries else None
+                    })
+                report.setdefault(platform, {})[role] = {
+                    "match_rate": round(sum(recent) / len(recent), 3) if recent else None,
+                    "lookups": len(recent),
+                    "alert": (platform, role) in self.alerts,
+                    "selectors": entries
+                }
+        return report
+
+    def active_alerts(self):
+        with self.lock:
+            return [f"{platform} {role}: {rate:.0%} matched" for (platform, role), rate in sorted(self.alerts.items())]
+
+SEARCH_ROLES = {adapter.name: adapter.selectors for adapter in PLATFORMS.values()}
+selector_registry = SelectorRegistry({
+    platform: dict(SEARCH_ROLES.get(platform, {}), **DETAIL_SELECTORS.get(platform, {}))
+    for platform in set(SEARCH_ROLES) | set(DETAIL_SELECTORS)
+})
+
+# ---------------- Result Store ----------------
+RESULT_STORE_MAX_MB = int(os.getenv("RESULT_STORE_MAX_MB", "64"))
+DETAIL_FIELDS = ("company", "description", "experience", "salary", "applicants", "posted")
+
+class JobRecord:
+    """One search result row.
+
+    Slotted to avoid a per-row ``__dict__``; platform and keyword are interned
+    so every row of a search shares one copy. Supports ``get``/``[]``/``update``
+    so templates and helpers can treat it like the dicts fetchers produce.
+    """
+    __slots__ = ("platform", "keyword", "title", "url", "job_id", "easy_apply", "is_new", "details", "score", "terms")
+
+    def __init__(self, platform, keyword, title, url, job_id=None, easy_apply=False, is_new=False, details=None):
+        # ``easy_apply`` is None while unknown (HTTP-fetched LinkedIn cards)
+        self.platform = sys.intern(platform)
+        self.keyword = sys.intern(keyword)
+        self.title = title
+        self.url = url
+        self.job_id = job_id or canonical_job_id(platform, url)
+        self.easy_apply = None if easy_apply is None else bool(easy_apply)
+        self.is_new = bool(is_new)
+        self.details = details
+        self.score = None
+        self.terms = None
+
+    @classmethod
+    def from_dict(cls, job):
+        if isinstance(job, cls):
+            return job
+        record = cls(job["platform"], job["keyword"], job["title"], job["url"], job.get("job_id"),
+                     job.get("easy_apply", False), job.get("is_new", False))
+        record.update(job)
+        return record
+
+    def update(self, values):
+        """Merge enrichment fields into ``details``"""
+        if self.easy_apply is None and values.get("easy_apply") is not None:
+            self.easy_apply = bool(values["easy_apply"])
+        if any(values.get(field) for field in DETAIL_FIELDS):
+            current = self.details or ("",) * len(DETAIL_FIELDS)
+            self.details = tuple(values.get(field) or current[i] for i, field in enumerate(DETAIL_FIELDS))
+            self.terms = None
+
+    def get(self, key, default=None):
+        if key in DETAIL_FIELDS:
+            return self.details[DETAIL_FIELDS.index(key)] if self.details else default
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def __getitem__(self, key):
+        if key not in self.__slots__ and key not in DETAIL_FIELDS:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __getattr__(self, key):
+        # Only reached for names that aren't slots, i.e. detail fields in templates
+        if key in DETAIL_FIELDS:
+            return self.get(key, "")
+        raise AttributeError(key)
+
+    def to_dict(self):
+        job = {"platform": self.platform, "keyword": self.keyword, "title": self.title, "url": self.url,
+               "job_id": self.job_id, "easy_apply": self.easy_apply}
+        if self.details:
+            job.update(zip(DETAIL_FIELDS, self.details))
+        if self.score is not None:
+            job["score"] = round(self.score, 4)
+        return job
+
+    def size(self):
+        """Approximate bytes owned by this row (interned strings excluded)"""
+        size = sys.getsizeof(self) + sys.getsizeof(self.title) + sys.getsizeof(self.url) + sys.getsizeof(self.job_id)
+        if self.details:
+            size += sys.getsizeof(self.details) + sum(sys.getsizeof(value) for value in self.details)
+        if self.terms is not None:
+            size += self.terms[0].nbytes + self.terms[1].nbytes
+        return size
+
+class ResultStore:
+    """Search results scoped per profile with an LRU-evicted memory cap.
+
+    Each (scope, query) pair holds one result set. The most recently stored
+    search of a scope is what its dashboard shows; older searches are kept
+    until the store exceeds ``max_bytes``, then evicted least recently used
+    first.
+    """
+
+    def __init__(self, max_bytes=RESULT_STORE_MAX_MB * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.searches = OrderedDict()
+        self.current_keys = {}
+        self.total_bytes = 0
+        self.evictions = 0
+
+    def put(self, scope, key, jobs, current=True):
+        """Store a search; ``current=False`` keeps the scope's dashboard on its own search"""
+        rows = [JobRecord.from_dict(job) for job in jobs]
+        size = sum(row.size() for row in rows) + sys.getsizeof(rows)
+        with self.lock:
+            old = self.searches.pop((scope, key), None)
+            if old:
+                self.total_bytes -= old[1]
+            self.searches[(scope, key)] = (rows, size, time.time())
+            self.total_bytes += size
+            if current:
+                self.current_keys[scope] = key
+            self._evict(keep=(scope, key))
+        return rows
+
+    def select(self, scope, key):
+        """Make a stored search the scope's current one; its rows, or None if it was evicted"""
+        with self.lock:
+            entry = self.searches.get((scope, key))
+            if entry is None:
+                return None
+            self.searches.move_to_end((scope, key))
+            self.current_keys[scope] = key
+            return entry[0]
+
+    def get(self, scope, key):
+        with self.lock:
+            entry = self.searches.get((scope, key))
+            if entry is None:
+                return None
+            self.searches.move_to_end((scope, key))
+            return entry[0]
+
+    def current(self, scope):
+        key = self.current_keys.get(scope)
+        if key is None:
+            return []
+        return self.get(scope, key) or []
+
+    def clear(self, scope):
+        with self.lock:
+            for entry_key in [k for k in self.searches if k[0] == scope]:
+                self.total_bytes -= self.searches.pop(entry_key)[1]
+            self.current_keys.pop(scope, None)
+
+    def _evict(self, keep):
+        # Searches currently on someone's dashboard go last
+        current = {(scope, key) for scope, key in self.current_keys.items()}
+        for pass_current in (False, True):
+            for entry_key in list(self.searches):
+                if self.total_bytes <= self.max_bytes:
+                    return
+                if entry_key == keep or ((entry_key in current) != pass_current):
+                    continue
+                self.total_bytes -= self.searches.pop(entry_key)[1]
+                self.evictions += 1
+                if self.current_keys.get(entry_key[0]) == entry_key[1]:
+                    del self.current_keys[entry_key[0]]
+
+    def memory_usage(self):
+        with self.lock:
+            scopes = {}
+            for (scope, key), (rows, size, created) in self.searches.items():
+                usage = scopes.setdefault(scope, {"searches": 0, "rows": 0, "bytes": 0})
+                usage["searches"] += 1
+                usage["rows"] += len(rows)
+                usage["bytes"] += size
+            return {
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "searches": len(self.searches),
+                "rows": sum(s["rows"] for s in scopes.values()),
+                "evictions": self.evictions,
+                "scopes": scopes
+            }
+
+result_store = ResultStore()
+
+# ---------------- Search Coalescing ----------------
+class SearchCoalescer:
+    """Single-flight for identical searches.
+
+    A search that arrives while the same one (same platforms actually
+    searched, keywords, location and title filter) is already running
+    attaches to that crawl and gets a copy of its results instead of
+    queueing a second crawl behind it. Incremental searches depend on the
+    profile's watermarks, so they only coalesce within a profile. A follower waits no longer than its
+    own deadline and is marked partial when it gives up or the crawl it
+    joined was partial.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.stats = Counter()
+
+    @staticmethod
+    def key(profile, platform, keyword, location, incremental):
+        platforms = tuple(adapter.key for adapter in platform_adapters(profile, platform))
+        keywords = tuple(sorted({k.strip().lower() for k in keyword.split(";") if k.strip()}))
+        # Rows are filtered by the profile's title keywords, so only profiles with the same filter share a crawl
+        return (profile.name if incremental else None, platforms, keywords, location.strip().lower(), bool(incremental),
+                tuple(profile.apply_title_keywords))
+
+    def search(self, profile, platform, keyword, location, incremental=False, deadline=None, priority="interactive"):
+        """``search_jobs`` on the browser thread, shared with identical searches in flight.
+
+        ``priority`` is the scheduling class of a crawl this call starts;
+        joining a flight of a lower class raises the flight to it.
+        """
+        deadline = deadline or Deadline()
+        if threading.current_thread() is browser_host.thread:
+            # Waiting here would block the thread the running crawl needs
+            return search_jobs(profile, platform, keyword, location, incremental, deadline)
+        key = self.key(profile, platform, keyword, location, incremental)
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                task = browser_host.submit(priority, search_jobs, profile, platform, keyword, location, incremental, deadline)
+                flight = self.flights[key] = {'future': Future(), 'task': task, 'priority': priority,
+                                              'started': time.time(), 'followers': 0}
+                self.stats['crawls'] += 1
+            else:
+                flight['followers'] += 1
+                self.stats['joined'] += 1
+                if PRIORITY_CLASSES.index(priority) < PRIORITY_CLASSES.index(flight['priority']):
+                    # An interactive search shouldn't wait behind other work at prefetch priority
+                    flight['priority'] = priority
+                    browser_host.promote(flight['task'], priority)
+        
+        if leader:
+            try:
+                try:
+                    jobs = browser_host.wait_for(task, deadline)
+                except DeadlineExceeded:
+                    log.warning("⏱️ Deadline reached while the search was waiting for the browser", stage="search",
+                                profile=profile.name, query=keyword)
+                    jobs = []
+                flight['future'].set_result((jobs, deadline.partial, list(deadline.errors)))
+                return jobs
+            except BaseException as e:
+                flight['future'].set_exception(e)
+                raise
+            finally:
+                with self.lock:
+                    self.flights.pop(key, None)
+                    # Each follower would otherwise have run a crawl of its own
+                    self.stats['saved_crawls'] += flight['followers']
+                    self.stats['saved_seconds'] += flight['followers'] * (time.time() - flight['started'])
+        
+        try:
+            jobs, partial, errors = flight['future'].result(timeout=deadline.remaining())
+        except FutureTimeout:
+            with self.lock:
+                self.stats['gave_up'] += 1
+            deadline.mark_partial()
+            return []
+        if partial:
+            deadline.mark_partial()
+        for error in errors:
+            deadline.mark_failed(error)
+        # Rows get ranked and enriched per profile, so each caller needs its own
+        return [dict(job) for job in jobs]
+
+    def summary(self):
+        with self.lock:
+            stats = dict(self.stats)
+            in_flight = [{"platforms": list(key[1]), "keywords": list(key[2]), "location": key[3],
+                          "running_s": round(time.time() - flight['started'], 1), "followers": flight['followers']}
+                         for key, flight in self.flights.items()]
+        stats['saved_seconds'] = round(stats.get('saved_seconds', 0), 1)
+        return {"stats": stats, "in_flight": in_flight}
+
+search_coalescer = SearchCoalescer()
+
+# ---------------- Search Profiling ----------------
+TRACES_DIR = "traces"
+TRACE_KEEP = 20
+TRACE_MAX_MB = 200
+# Fraction of searches profiled without being asked (0 disables sampling)
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0") or 0)
+
+def profiling_reason(*sources):
+    """Why this search should be profiled: ``"requested"`` (``perf=1``), ``"sampled"`` or None"""
+    if any(str(values.get("perf", "")).strip().lower() in ("1", "true", "yes") for values in sources):
+        return "requested"
+    if PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE:
+        return "sampled"
+    return None
+
+class ProfileCapture:
+    """One profiled search: cProfile of the handler and browser threads plus a Playwright trace.
+
+    Used as a context manager around the whole handler; ``search()`` stands
+    in for ``search_coalescer.search`` but always runs its own crawl so the
+    trace shows real work.
+    """
+
+    def __init__(self, store, reason, profile, platform, keyword, location):
+        self.store = store
+        # Sortable by time: retention drops the oldest names first
+        now = time.time()
+        self.id = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{int(now * 1000) % 1000:03d}{random.getrandbits(16):04x}"
+        self.path = os.path.join(store.directory, self.id)
+        self.meta = {"id": self.id, "reason": reason, "profile": profile.name, "platform": platform,
+                     "keyword": keyword, "location": location, "created": time.time()}
+        self.handler = cProfile.Profile()
+        self.browser_stats = None
+
+    def __enter__(self):
+        os.makedirs(self.path, exist_ok=True)
+        self.started = time.perf_counter()
+        try:
+            self.handler.enable()
+        except ValueError:
+            # Another profiler already owns this thread
+            self.handler = None
+        return self
+
+    def search(self, profile, platform, keyword, location, incremental=False, deadline=None):
+        deadline = deadline or Deadline()
+        try:
+            jobs = browser_host.wait_for(browser_host.submit("interactive", self._traced, profile, platform, keyword,
+                                                             location, incremental, deadline), deadline)
+        except DeadlineExceeded:
+            jobs = []
+        self.meta.update(jobs=len(jobs), partial=deadline.partial)
+        return jobs
+
+    def _traced(self, profile, platform, keyword, location, incremental, deadline):
+        # Runs on the browser thread, where the Playwright calls happen. Log in
+        # first: a trace taken during login would hold the typed password.
+        adapters = [adapter for adapter in platform_adapters(profile, platform) if adapter.needs_login]
+        logged_in = all(ensure_logged_in(profile, adapter.key, deadline) is not None for adapter in adapters)
+        tracing = browser_host.get_session(profile)['context'].tracing
+        traced = False
+        if not logged_in:
+            log.warning("⚠️ Not tracing this search: login has to happen first", stage="profiling", capture=self.id)
+        else:
+            try:
+                tracing.start(name=self.id, screenshots=True, snapshots=True)
+                traced = True
+            except Exception as e:
+                log.warning(f"⚠️ Could not start Playwright trace: {e}", stage="profiling")
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            profiler = None
+        try:
+            return search_jobs(profile, platform, keyword, location, incremental, deadline)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self.browser_stats = profiler
+            if traced:
+                try:
+                    tracing.stop(path=os.path.join(self.path, "trace.zip"))
+                except Exception as e:
+                    log.warning(f"⚠️ Could not save Playwright trace: {e}", stage="profiling")
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.handler is not None:
+            self.handler.disable()
+        self.meta["elapsed"] = round(time.perf_counter() - self.started, 3)
+        if exc is not None:
+            self.meta["error"] = str(exc)
+        try:
+            self._save()
+        except Exception as e:
+            log.warning(f"⚠️ Could not save search profile {self.id}: {e}", stage="profiling", capture=self.id)
+        return False
+
+    def _save(self):
+        profiles = [p for p in (self.handler, self.browser_stats) if p is not None]
+        if profiles:
+            stats = pstats.Stats(profiles[0])
+            for extra in profiles[1:]:
+                stats.add(extra)
+            stats.dump_stats(os.path.join(self.path, "profile.pstats"))
+            summary = io.StringIO()
+            pstats.Stats(os.path.join(self.path, "profile.pstats"), stream=summary).sort_stats("cumulative").print_stats(40)
+            with open(os.path.join(self.path, "profile.txt"), "w", encoding="utf-8") as f:
+                f.write(summary.getvalue())
+        with open(os.path.join(self.path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+        self.store.prune()
+        log.info(f"🔬 Search profile saved: {self.path} ({self.meta['elapsed']}s)", stage="profiling", capture=self.id,
+                 duration_ms=int(self.meta['elapsed'] * 1000))
+
+class ProfileStore:
+    """Saved search profiles under TRACES_DIR, newest TRACE_KEEP kept within TRACE_MAX_MB"""
+
+    def __init__(self, directory=TRACES_DIR, keep=TRACE_KEEP, max_bytes=TRACE_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.keep = keep
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+    def capture(self, reason, profile, platform, keyword, location):
+        """A ``ProfileCapture`` when ``reason`` is set, otherwise a no-op context yielding None"""
+        if not reason:
+            return nullcontext(None)
+        return ProfileCapture(self, reason, profile, platform, keyword, location)
+
+    def list(self):
+        captures = []
+        for entry in sorted(glob.glob(os.path.join(self.directory, "*", "meta.json")), reverse=True):
+            folder = os.path.dirname(entry)
+            try:
+                with open(entry, encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            meta["files"] = {name: os.path.getsize(os.path.join(folder, name))
+                             for name in sorted(os.listdir(folder)) if name != "meta.json"}
+            captures.append(meta)
+        return captures
+
+    def prune(self):
+        with self.lock:
+            folders = sorted(d for d in glob.glob(os.path.join(self.directory, "*")) if os.path.isdir(d))
+            sizes = {d: sum(os.path.getsize(os.path.join(d, n)) for n in os.listdir(d)) for d in folders}
+            total = sum(sizes.values())
+            while folders and (len(folders) > self.keep or total > self.max_bytes):
+                oldest = folders.pop(0)
+                total -= sizes[oldest]
+                shutil.rmtree(oldest, ignore_errors=True)
+
+search_profiles = ProfileStore()
+
+# ---------------- Search Prefetch ----------------
+PREFETCH_INTERVAL = 30
+# Prefetched results are served for this long, and refreshed PREFETCH_LEAD before that
+PREFETCH_TTL = 20 * 60
+PREFETCH_LEAD = 3 * 60
+DEFAULT_PREFETCH_BUDGET = 12
+
+class SearchPrefetcher:
+    """Keeps each profile's configured searches (KEYWORDS × LOCATION) warm in the background.
+
+    Only profiles with PREFETCH on take part. When the browser is idle,
+    the most used configured search whose results are missing or about to
+    go stale is crawled, at most one at a time and no more than the
+    profile's PREFETCH_BUDGET crawls an hour. ``/fetch`` then serves a warm
+    result instead of crawling again.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.uses = Counter()
+        self.warm = {}
+        # When each profile's settings were last saved; crawls started before that aren't warm
+        self.cleared = {}
+        self.crawls = {}
+        self.stats = Counter()
+        self.thread = None
+
+    def start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="search-prefetch", daemon=True)
+                self.thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(PREFETCH_INTERVAL)
+            try:
+                self.tick()
+            except Exception as e:
+                log.exception(f"⚠️ Prefetch failed: {e}", stage="prefetch")
+
+    @staticmethod
+    def configured(profile):
+        return [("all", keyword, profile.location) for keyword in profile.keywords]
+
+    def record_use(self, profile, platform, keyword, location, fresh=False):
+        """Count a user search; ``fresh`` results of it also count as warm"""
+        key = query_key(platform, keyword, location)
+        with self.lock:
+            self.uses[(profile.name, key)] += 1
+            if fresh:
+                self.warm[(profile.name, key)] = time.time()
+
+    def forget(self, profile):
+        """Drop ``profile``'s warm searches, e.g. after its title filter or keywords change"""
+        with self.lock:
+            self.cleared[profile.name] = time.time()
+            for entry in [entry for entry in self.warm if entry[0] == profile.name]:
+                del self.warm[entry]
+
+    def serve(self, profile, platform, keyword, location):
+        """Warm rows for this search made current for ``profile``, or None to crawl"""
+        key = query_key(platform, keyword, location)
+        with self.lock:
+            warmed = self.warm.get((profile.name, key))
+        if warmed is None or time.time() - warmed >= PREFETCH_TTL:
+            return None
+        rows = result_store.select(profile.name, key)
+        with self.lock:
+            self.stats['served' if rows is not None else 'evicted'] += 1
+        return rows
+
+    def age(self, profile, platform, keyword, location):
+        with self.lock:
+            warmed = self.warm.get((profile.name, query_key(platform, keyword, location)))
+        return None if warmed is None else time.time() - warmed
+
+    def due(self):
+        """Configured searches needing a crawl, most used first, within each profile's budget"""
+        now = time.time()
+        candidates = []
+        for name in list_profiles():
+            profile = get_profile(name)
+            if not profile.prefetch or not platform_adapters(profile):
+                continue
+            with self.lock:
+                recent = self.crawls.setdefault(name, deque())
+                while recent and now - recent[0] > 3600:
+                    recent.popleft()
+                if len(recent) >= profile.prefetch_budget:
+                    continue
+                for order, (platform, keyword, location) in enumerate(self.configured(profile)):
+                    key = query_key(platform, keyword, location)
+                    warmed = self.warm.get((name, key))
+                    if warmed is None or now - warmed >= PREFETCH_TTL - PREFETCH_LEAD:
+                        candidates.append((-self.uses[(name, key)], order, name, platform, keyword, location))
+        return [candidate[2:] for candidate in sorted(candidates)]
+
+    def tick(self):
+        # Background crawls only run when nobody is waiting on the browser
+        if browser_host.busy or not browser_host.tasks.empty() or search_coalescer.flights:
+            return None
+        due = self.due()
+        if not due:
+            return None
+        name, platform, keyword, location = due[0]
+        profile = get_profile(name)
+        key = query_key(platform, keyword, location)
+        with self.lock:
+            self.crawls.setdefault(name, deque()).append(time.time())
+            self.stats['crawls'] += 1
+        started = time.time()
+        deadline = Deadline(DEFAULT_SEARCH_DEADLINE)
+        found = search_coalescer.search(profile, platform, keyword, location, False, deadline, priority="prefetch")
+        result_store.put(name, key, found, current=False)
+        track_changes(profile, key, found, not deadline.complete, platform=platform, keyword=keyword, location=location)
+        # A failed login or page load isn't "no jobs", so it's retried on the next tick
+        if deadline.complete:
+            with self.lock:
+                if self.cleared.get(name, 0) <= started:
+                    self.warm[(name, key)] = time.time()
+        log.info(f"🔮 Prefetched '{keyword}' in {location} for '{name}': {len(found)} jobs", stage="prefetch", profile=name,
+                 query=key, count=len(found))
+        return key
+
+    def summary(self):
+        now = time.time()
+        with self.lock:
+            stats = dict(self.stats)
+            budget = {name: len([t for t in recent if now - t <= 3600]) for name, recent in self.crawls.items()}
+            warm = [{"profile": name, "query": key, "age_s": int(now - warmed), "uses": self.uses[(name, key)]}
+                    for (name, key), warmed in self.warm.items() if now - warmed < PREFETCH_TTL]
+        return {"stats": stats, "crawls_last_hour": budget, "warm": warm,
+                "ttl_s": PREFETCH_TTL, "refresh_before_s": PREFETCH_LEAD}
+
+search_prefetcher = SearchPrefetcher()
+
+def prefetch_enabled():
+    return any(get_profile(name).prefetch for name in list_profiles())
+
+# ---------------- Resume Relevance Ranking ----------------
+STOPWORDS = frozenset("""a an and are as at be by for from has have in is it its of on or our the to we
+will with you your this that job jobs role work team experience years year""".split())
+
+TERM_HASH_BITS = 22
+
+resume_cache = {}
+
+def tokenize(text):
+    words = [w for w in re.findall(r"[a-z0-9][a-z0-9+#]*", text.lower()) if w not in STOPWORDS and len(w) > 1]
+    # Bigrams keep phrases like "power bi" or "business analyst" together
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+def extract_resume_text(path):
+    """Plain text of a PDF or DOCX resume"""
+    ext = path.rsplit(".", 1)[-1].lower()
+    try:
+        if ext == "docx":
+            with zipfile.ZipFile(path) as z:
+                xml = z.read("word/document.xml").decode("utf-8", "ignore")
+            xml = re.sub(r"</w:p>|<w:tab/>|<w:br/>", "\n", xml)
+            return html.unescape(re.sub(r"<[^>]+>", "", xml))
+        if ext == "pdf":
+            from pypdf import PdfReader
+            return "\n".join(page.extract_text() or "" for page in PdfReader(path).pages)
+        log.warning(f"⚠️ Can't read .{ext} resumes for ranking, upload a PDF or DOCX", stage="ranking")
+    except Exception as e:
+        log.warning(f"⚠️ Could not read resume {path}: {e}", stage="ranking")
+    return ""
+
+def resume_terms(path):
+    """Term counts of the resume, cached until the file changes"""
+    if not path or not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    signature = (stat.st_mtime, stat.st_size)
+    cached = resume_cache.get(path)
+    if cached is None or cached[0] != signature:
+        terms = Counter(tokenize(extract_resume_text(path)))
+        log.info(f"📄 Indexed resume {os.path.basename(path)}: {len(terms)} terms", stage="ranking", count=len(terms))
+        cached = resume_cache[path] = (signature, terms)
+    return cached[1] or None
+
+def job_text(job):
+    # Titles are short, so weight them up against long descriptions
+    return " ".join([job.get("title") or ""] * 3 + [job.get("company") or "", job.get("description") or ""])
+
+def term_vector(terms):
+    """Hashed term IDs and counts as compact arrays (``terms`` is a Counter)"""
+    import numpy as np
+    mask = (1 << TERM_HASH_BITS) - 1
+    ids = np.fromiter((zlib.crc32(term.encode("utf-8")) & mask for term in terms), dtype=np.int32, count=len(terms))
+    return ids, np.fromiter(terms.values(), dtype=np.float32, count=len(terms))
+
+def job_vector(job):
+    """Term vector of a job, cached on the record until its text changes"""
+    vector = job.get("terms")
+    if vector is None:
+        vector = term_vector(Counter(tokenize(job_text(job))))
+        if isinstance(job, JobRecord):
+            job.terms = vector
+    return vector
+
+def relevance_scores(vectors, query_terms):
+    """TF-IDF cosine similarity of every job vector against ``query_terms`` in one batch.
+
+    All vectors are concatenated into flat (doc, term, count) arrays so
+    weights, norms and dot products come from a few NumPy passes instead of
+    a Python loop per job.
+    """
+    import numpy as np
+    
+    n_docs = len(vectors)
+    lengths = [len(ids) for ids, _ in vectors]
+    if not sum(lengths):
+        return np.zeros(n_docs)
+    
+    docs = np.repeat(np.arange(n_docs), lengths)
+    vocab, terms = np.unique(np.concatenate([ids for ids, _ in vectors]), return_inverse=True)
+    counts = np.concatenate([tf for _, tf in vectors]).astype(np.float64)
+    df = np.bincount(terms, minlength=len(vocab))
+    idf = np.log((1 + n_docs) / (1 + df)) + 1
+    weights = (1 + np.log(counts)) * idf[terms]
+    norms = np.sqrt(np.bincount(docs, weights=weights * weights, minlength=n_docs))
+    
+    query_ids, query_tf = term_vector(query_terms)
+    positions = np.searchsorted(vocab, query_ids).clip(max=len(vocab) - 1)
+    known = vocab[positions] == query_ids
+    query_weights = (1 + np.log(query_tf.astype(np.float64))) * np.where(known, idf[positions], np.log(1 + n_docs) + 1)
+    query = np.zeros(len(vocab))
+    # Query terms that hash to the same ID add up rather than overwrite each other
+    np.add.at(query, positions[known], query_weights[known])
+    unknown = query_weights[~known]
+    
+    dots = np.bincount(docs, weights=weights * query[terms], minlength=n_docs)
+    denominator = norms * np.sqrt((query * query).sum() + (unknown * unknown).sum())
+    return np.divide(dots, denominator, out=np.zeros(n_docs), where=denominator > 0)
+
+def rank_jobs(profile, jobs):
+    """Score ``jobs`` against the profile's resume and sort them best first, in place"""
+    terms = resume_terms(profile.resume_path)
+    if not terms or not jobs:
+        return False
+    started = time.perf_counter()
+    scores = relevance_scores([job_vector(job) for job in jobs], terms)
+    for job, score in zip(jobs, scores.tolist()):
+        job.score = score
+    jobs.sort(key=lambda job: job.score, reverse=True)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    log.debug(f"📊 Ranked {len(jobs)} jobs in {elapsed_ms:.1f}ms", stage="ranking", count=len(jobs), duration_ms=round(elapsed_ms, 1))
+    return True
+
+# ---------------- Job History (SQLite FTS5) ----------------
+HISTORY_DB = "jobs.db"
+HISTORY_PAGE_SIZE = 50
+# Bounds that keep searches fast on very large histories (see JobHistory.search)
+HISTORY_CANDIDATE_LIMIT = 20000
+HISTORY_RANK_WINDOW = 2000
+# Markers swapped for <mark> only after the text has been HTML-escaped
+HIGHLIGHT_START, HIGHLIGHT_END = "\x02", "\x03"
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL UNIQUE,
+    platform TEXT NOT NULL,
+    keyword TEXT,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    url TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_first_seen ON jobs(first_seen);
+CREATE INDEX IF NOT EXISTS jobs_platform_first_seen ON jobs(platform, first_seen);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, description,
+    content='jobs', content_rowid='id', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, company, description)
+    VALUES (new.id, new.title, new.company, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE OF title, company, description ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+    INSERT INTO jobs_fts(rowid, title, company, description)
+    VALUES (new.id, new.title, new.company, new.description);
+END;
+"""
+
+class JobHistory:
+    """Every job ever scraped, with an FTS5 index over title, company and description.
+
+    Rows are upserted by canonical job ID as searches and enrichment produce
+    them; the full-text index is only rewritten when indexed text changes.
+    """
+
+    def __init__(self, path=HISTORY_DB):
+        self.path = path
+        self.local = threading.local()
+        self.schema_lock = threading.Lock()
+        self.schema_ready = False
+        self.facet_lock = threading.Lock()
+        self.loaded_id = 0
+        self.platform_names = []
+        self.first_seen = None
+        self.platform_codes = None
+
+    def connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self.schema_lock:
+                if not self.schema_ready:
+                    conn.executescript(HISTORY_SCHEMA)
+                    self.schema_ready = True
+            self.local.conn = conn
+        return conn
+
+    def record(self, jobs, seen_at=None):
+        """Insert new jobs and refresh known ones"""
+        seen_at = seen_at or time.time()
+        try:
+            self._record(self.connect(), jobs, seen_at)
+        except sqlite3.Error as e:
+            log.warning(f"⚠️ Failed to update job history: {e}", stage="history", count=len(jobs))
+        return len(jobs)
+
+    def _record(self, conn, jobs, seen_at):
+        with conn:
+            for job in jobs:
+                job_id = job_key(job)
+                company = job.get("company") or ""
+                description = job.get("description") or ""
+                conn.execute(
+                    "INSERT OR IGNORE INTO jobs (job_id, platform, keyword, title, company, description, url, first_seen, last_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, job["platform"], job.get("keyword", ""), job["title"], company, description,
+                     job["url"], seen_at, seen_at))
+                conn.execute("UPDATE jobs SET last_seen = ? WHERE job_id = ?", (seen_at, job_id))
+                # Keep details from earlier enrichment when this copy has none
+                conn.execute(
+                    "UPDATE jobs SET title = ?, company = COALESCE(?, company), description = COALESCE(?, description) "
+                    "WHERE job_id = ? "
+                    "AND (title != ? OR (? != '' AND company != ?) OR (? != '' AND description != ?))",
+                    (job["title"], company or None, description or None, job_id,
+                     job["title"], company, company, description, description))
+
+    def warm(self):
+        """Load the facet arrays ahead of the first search"""
+        try:
+            if os.path.exists(self.path):
+                self._facet_arrays(self.connect())
+        except Exception as e:
+            log.warning(f"⚠️ Could not load job history: {e}", stage="history")
+
+    def _facet_arrays(self, conn):
+        """Platform code and first-seen time indexed by row ID.
+
+        Both are fixed once a row is inserted, so only rows added since the
+        last call are read.
+        """
+        import numpy as np
+        with self.facet_lock:
+            if self.first_seen is None:
+                self.first_seen = np.zeros(0)
+                self.platform_codes = np.zeros(0, dtype=np.uint8)
+            rows = conn.execute("SELECT id, platform, first_seen FROM jobs WHERE id > ? ORDER BY id",
+                                (self.loaded_id,)).fetchall()
+            if rows:
+                ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+                if ids[-1] >= len(self.first_seen):
+                    size = max(int(ids[-1]) + 1, 2 * len(self.first_seen))
+                    self.first_seen = np.concatenate([self.first_seen, np.zeros(size - len(self.first_seen))])
+                    self.platform_codes = np.concatenate([self.platform_codes, np.zeros(size - len(self.platform_codes), np.uint8)])
+                for row in rows:
+                    if row[1] not in self.platform_names:
+                        self.platform_names.append(row[1])
+                codes = {name: i for i, name in enumerate(self.platform_names)}
+                self.platform_codes[ids] = np.fromiter((codes[row[1]] for row in rows), dtype=np.uint8, count=len(rows))
+                self.first_seen[ids] = np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows))
+                self.loaded_id = int(ids[-1])
+            return self.platform_codes, self.first_seen, list(self.platform_names)
+
+    def search(self, query, platform=None, since=None, until=None, limit=HISTORY_PAGE_SIZE, offset=0):
+        """Ranked matches with highlights, plus platform and month facets.
+
+        Matches are taken newest first, up to HISTORY_CANDIDATE_LIMIT; filters
+        and facets are applied to them with NumPy, and BM25 ranking covers the
+        newest HISTORY_RANK_WINDOW that pass the filters. Very broad queries
+        therefore come back ``approximate`` but stay fast on large histories;
+        ``ranked`` is how many of ``total`` can be paged through.
+        """
+        match = fts_query(query)
+        if not match:
+            return {"query": query, "total": 0, "ranked": 0, "approximate": False, "results": [],
+                    "facets": {"platform": {}, "month": {}}}
+        
+        conn = self.connect()
+        # One read snapshot, so rows recorded by a running search can't match
+        # without being in the facet arrays
+        conn.execute("BEGIN")
+        try:
+            return self._search(conn, query, match, platform, since, until, limit, offset)
+        finally:
+            conn.rollback()
+
+    def _search(self, conn, query, match, platform, since, until, limit, offset):
+        import numpy as np
+        started = time.perf_counter()
+        codes, first_seen, names = self._facet_arrays(conn)
+        
+        row = conn.execute(
+            "SELECT group_concat(rowid) FROM (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ? "
+            "ORDER BY rowid DESC LIMIT ?)", (match, HISTORY_CANDIDATE_LIMIT + 1)).fetchone()
+        ids = np.sort(np.array(row[0].split(","), dtype=np.int64))[::-1] if row[0] else np.zeros(0, dtype=np.int64)
+        approximate = len(ids) > HISTORY_CANDIDATE_LIMIT
+        ids = ids[:HISTORY_CANDIDATE_LIMIT]
+        
+        in_range = np.ones(len(ids), dtype=bool)
+        if since:
+            in_range &= first_seen[ids] >= since
+        if until:
+            in_range &= first_seen[ids] < until
+        # Platform counts ignore the platform filter so the other options stay visible
+        platform_counts = np.bincount(codes[ids[in_range]], minlength=len(names))
+        if platform:
+            in_range &= codes[ids] == (names.index(platform) if platform in names else 255)
+        ids = ids[in_range]
+        months, month_counts = np.unique(first_seen[ids].astype("datetime64[s]").astype("datetime64[M]"), return_counts=True)
+        
+        ranked = self._rank(conn, match, ids[:HISTORY_RANK_WINDOW], offset + limit)[offset:]
+        results = []
+        if ranked:
+            rows = conn.execute(
+                f"SELECT jobs.id, jobs.job_id, jobs.platform, jobs.keyword, jobs.url, jobs.first_seen, jobs.last_seen, "
+                f"highlight(jobs_fts, 0, ?, ?) AS title, highlight(jobs_fts, 1, ?, ?) AS company, "
+                f"snippet(jobs_fts, 2, ?, ?, '…', 16) AS snippet "
+                f"FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid "
+                f"WHERE jobs_fts MATCH ? AND jobs_fts.rowid IN ({','.join('?' * len(ranked))})",
+                [HIGHLIGHT_START, HIGHLIGHT_END] * 3 + [match] + [rowid for rowid, _ in ranked]).fetchall()
+            by_id = {row["id"]: dict(row) for row in rows}
+            for rowid, score in ranked:
+                if rowid in by_id:
+                    result = by_id[rowid]
+                    del result["id"]
+                    result["rank"] = score
+                    results.append(result)
+        
+        return {
+            "query": query,
+            "total": int(len(ids)),
+            "ranked": int(min(len(ids), HISTORY_RANK_WINDOW)),
+            "approximate": approximate,
+            "took_ms": round((time.perf_counter() - started) * 1000, 1),
+            "results": results,
+            "facets": {
+                "platform": {name: int(count) for name, count in zip(names, platform_counts) if count},
+                "month": {str(month): int(count) for month, count in sorted(zip(months, month_counts), reverse=True)}
+            }
+        }
+
+    def _rank(self, conn, match, ids, count):
+        """BM25 order of ``ids`` (all matches of ``match``), best first"""
+        if count <= 0 or not len(ids):
+            return []
+        wanted = set(ids.tolist())
+        ranked = []
+        # Matches are scored from the oldest wanted row up; rows outside the
+        # filters in that range are skipped here
+        for rowid, score in conn.execute(
+                "SELECT rowid, bm25(jobs_fts, 10.0, 4.0, 1.0) AS score FROM jobs_fts "
+                "WHERE jobs_fts MATCH ? AND rowid >= ? ORDER BY score", (match, int(ids.min()))):
+            if rowid in wanted:
+                ranked.append((rowid, score))
+                if len(ranked) >= count:
+                    break
+        return ranked
+
+job_history = JobHistory()
+
+def fts_query(text):
+    """Turn free text into a safe FTS5 query: quoted phrases stay phrases, words are ANDed"""
+    parts = []
+    for phrase, word in re.findall(r'"([^"]+)"|(\S+)', text):
+        term = (phrase or word).replace('"', '')
+        prefix = term.endswith("*") and not phrase
+        term = term.rstrip("*")
+        if term:
+            parts.append(f'"{term}"' + ("*" if prefix else ""))
+    return " ".join(parts)
+
+def highlight_html(text):
+    """Escape stored text, then turn FTS highlight markers into <mark> tags"""
+    escaped = html.escape(text or "")
+    return Markup(escaped.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>"))
+
+# ---------------- Application Log Writer ----------------
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL = 2.0
+# "batch": fsync after every batch; "periodic": at most every LOG_FSYNC_INTERVAL seconds
+LOG_DURABILITY = os.getenv("LOG_DURABILITY", "periodic")
+LOG_FSYNC_INTERVAL = 30.0
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_MAX_AGE_DAYS = 30
+LOG_BACKUP_COUNT = 10
+LOG_MAX_PENDING = 100000
+
+class ApplicationLogWriter:
+    """Appends application log rows from a background thread.
+
+    Rows are queued by ``write()`` and written in batches once LOG_BATCH_SIZE
+    rows are waiting or LOG_FLUSH_INTERVAL seconds have passed, so callers
+    never wait on file I/O. Rows that fail to write are kept and retried with
+    the next batch. The log is rotated to a gzipped backup once it exceeds
+    LOG_MAX_BYTES or LOG_MAX_AGE_DAYS.
+    """
+
+    def __init__(self, path=LOG_FILE, durability=LOG_DURABILITY):
+        self.path = path
+        self.durability = durability
+        self.queue = queue.Queue()
+        self.thread = None
+        self.start_lock = threading.Lock()
+        self.failed = []
+        self.started_at = None
+        self.last_fsync = time.monotonic()
+        self.stats = {"written": 0, "batches": 0, "fsyncs": 0, "rotations": 0, "errors": 0, "last_error": ""}
+
+    def write(self, row):
+        self._ensure_started()
+        self.queue.put(row)
+
+    def flush(self, timeout=10):
+        """Block until everything queued so far is on disk"""
+        if self.thread is None or not self.thread.is_alive():
+            return
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        if self.thread is not None and self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join(timeout=30)
+
+    def _ensure_started(self):
+        with self.start_lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self.thread.start()
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            try:
+                timeout = max(0, deadline - time.monotonic()) if batch else None
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = False
+            
+            if item is None:
+                self._write(batch, force_sync=True)
+                return
+            if isinstance(item, threading.Event):
+                self._write(batch, force_sync=True)
+                batch = []
+                item.set()
+                continue
+            if item:
+                if not batch:
+                    deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+                batch.append(item)
+            if batch and (len(batch) >= LOG_BATCH_SIZE or time.monotonic() >= deadline):
+                self._write(batch)
+                batch = []
+
+    def _write(self, batch, force_sync=False):
+        batch = self.failed + batch
+        if not batch:
+            return
+        try:
+            self._maybe_rotate()
+            ensure_log_file()
+            with open(self.path, "a", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerows(batch)
+                f.flush()
+                if force_sync or self.durability == "batch" or time.monotonic() - self.last_fsync >= LOG_FSYNC_INTERVAL:
+                    os.fsync(f.fileno())
+                    self.last_fsync = time.monotonic()
+                    self.stats["fsyncs"] += 1
+            self.failed = []
+            self.stats["written"] += len(batch)
+            self.stats["batches"] += 1
+        except Exception as e:
+            self.failed = batch[-LOG_MAX_PENDING:]
+            self.stats["errors"] += 1
+            self.stats["last_error"] = str(e)
+            log.warning(f"⚠️ Failed to write {len(batch)} log rows, will retry: {e}", stage="applog", count=len(batch))
+
+    def _log_started_at(self):
+        """Timestamp of the first row in the current log"""
+        if self.started_at is None:
+            self.started_at = time.time()
+            try:
+                with open(self.path, "r", newline="", encoding="utf-8") as f:
+                    reader = csv.reader(f)
+                    next(reader, None)
+                    first = next(reader, None)
+                if first:
+                    self.started_at = time.mktime(time.strptime(first[-1], "%Y-%m-%d %H:%M:%S"))
+            except (OSError, ValueError):
+                pass
+        return self.started_at
+
+    def _maybe_rotate(self):
+        if not os.path.exists(self.path):
+            return
+        too_big = os.path.getsize(self.path) >= LOG_MAX_BYTES
+        too_old = time.time() - self._log_started_at() >= LOG_MAX_AGE_DAYS * 86400
+        if not (too_big or too_old):
+            return
+        
+        base, ext = os.path.splitext(self.path)
+        now = time.time()
+        rotated = f"{base}.{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}{int(now % 1 * 1000):03d}{ext}"
+        while os.path.exists(rotated + ".gz"):
+            now += 0.001
+            rotated = f"{base}.{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}{int(now % 1 * 1000):03d}{ext}"
+        os.replace(self.path, rotated)
+        with open(rotated, "rb") as src, gzip.open(rotated + ".gz", "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(rotated)
+        self.started_at = None
+        self.stats["rotations"] += 1
+        log.info(f"🗜️ Rotated application log to {rotated}.gz", stage="applog")
+        
+        backups = [p for p in log_files(self.path) if p != self.path]
+        for old in backups[:-LOG_BACKUP_COUNT]:
+            os.remove(old)
+
+def log_files(path=LOG_FILE):
+    """Rotated backups oldest first, then the live log"""
+    base, ext = os.path.splitext(path)
+    backups = sorted(glob.glob(f"{glob.escape(base)}.*{ext}.gz"))
+    return backups + ([path] if os.path.exists(path) else [])
+
+log_writer = ApplicationLogWriter()
+atexit.register(log_writer.close)
+
+def log_application(platform, keyword, location, title, url, status):
+    log_writer.write([
+        platform, keyword, location, title, url, status,
+        time.strftime("%Y-%m-%d %H:%M:%S")
+    ])
+    analytics.record_application(platform, status)
+
+# ---------------- Easy Apply Queue ----------------
+APPLY_TABS = 3
+APPLY_MAX_ATTEMPTS = 2
+APPLY_MAX_STEPS = 12
+APPLY_JOB_DEADLINE = 180  # seconds for one form, from page load to the submit click
+APPLY_DONE_STATES = ("applied", "failed", "needs_input", "uncertain")
+
+APPLY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS apply_queue (
+    id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    keyword TEXT,
+    location TEXT,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',
+    step TEXT NOT NULL DEFAULT '',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    reason TEXT NOT NULL DEFAULT '',
+    queued_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    UNIQUE (profile, job_id)
+);
+CREATE INDEX IF NOT EXISTS apply_queue_state ON apply_queue(state, id);
+"""
+
+APPLY_SELECTORS = {
+    "already_applied": ['span.artdeco-inline-feedback__message:has-text("Applied")',
+                        'div.jobs-s-apply span:has-text("Applied")'],
+    "open": ['button.jobs-apply-button:has-text("Easy Apply")', 'button[aria-label*="Easy Apply"]'],
+    "dialog": ['div.jobs-easy-apply-modal', 'div[role="dialog"]'],
+    "resume": ['input[type="file"][name="file"]', 'input[type="file"]'],
+    "submit": ['button[aria-label="Submit application"]', 'button:has-text("Submit application")'],
+    "review": ['button[aria-label="Review your application"]', 'button:has-text("Review")'],
+    "next": ['button[aria-label="Continue to next step"]', 'button:has-text("Next")'],
+    "error": ['div.artdeco-inline-feedback--error', '[data-test-form-element-error-messages]'],
+    "done": ['h3:has-text("application was sent")', 'div[role="dialog"]:has-text("application was sent")',
+             'span.artdeco-inline-feedback__message:has-text("Applied")'],
+    "dismiss": ['button[aria-label="Dismiss"]'],
+    "discard": ['button[data-control-name="discard_application_confirm_btn"]', 'button:has-text("Discard")']
+}
+
+class ApplyQueue:
+    """Persistent queue of Easy Apply jobs, worked through by a background thread.
+
+    Each job's state and current step are checkpointed in SQLite before the
+    browser acts on it. After a crash or restart, jobs that never reached the
+    submit click go back in the queue; a job interrupted while submitting is
+    marked ``uncertain`` instead, so nothing is ever applied to twice.
+    """
+
+    def __init__(self, path=HISTORY_DB):
+        self.path = path
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.recovered = False
+        self.thread = None
+        self.wakeup = threading.Event()
+
+    def connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(APPLY_SCHEMA)
+            self.local.conn = conn
+        with self.lock:
+            if not self.recovered:
+                self.recovered = True
+                self._recover(conn)
+        return conn
+
+    def _recover(self, conn):
+        """Settle jobs left running by a previous process"""
+        with conn:
+            # The confirmation was seen, only the bookkeeping was cut off
+            submitted = conn.execute(
+                "SELECT * FROM apply_queue WHERE state = 'running' AND step = 'submitted'").fetchall()
+            conn.execute(
+                "UPDATE apply_queue SET state = 'applied', finished_at = ?, reason = '' "
+                "WHERE state = 'running' AND step = 'submitted'", (time.time(),))
+            requeued = conn.execute(
+                "UPDATE apply_queue SET state = 'queued', step = '' "
+                "WHERE state = 'running' AND step NOT IN ('submitting', 'submitted')").rowcount
+            uncertain = conn.execute(
+                "UPDATE apply_queue SET state = 'uncertain', finished_at = ?, "
+                "reason = 'Interrupted while submitting, check the job page before retrying' "
+                "WHERE state = 'running' AND step = 'submitting'", (time.time(),)).rowcount
+        for item in submitted:
+            log_application(item["platform"], item["keyword"], item["location"], item["title"], item["url"], "Applied")
+        if requeued or uncertain or submitted:
+            log.warning(f"♻️ Apply queue recovered: {len(submitted)} applied, {requeued} jobs requeued, {uncertain} need checking",
+                        stage="apply", applied=len(submitted), requeued=requeued, uncertain=uncertain)
+
+    def enqueue(self, profile, jobs):
+        conn = self.connect()
+        now = time.time()
+        added = 0
+        with conn:
+            for job in jobs:
+                added += conn.execute(
+                    "INSERT OR IGNORE INTO apply_queue (profile, job_id, platform, keyword, location, title, url, queued_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (profile.name, job_key(job), job["platform"], job.get("keyword", ""), profile.location,
+                     job["title"], job["url"], now)).rowcount
+        if added:
+            self.start()
+        return added
+
+    def retry(self, profile_name, item_id):
+        """Put a finished-but-unsuccessful job back in the queue"""
+        with self.connect() as conn:
+            changed = conn.execute(
+                "UPDATE apply_queue SET state = 'queued', step = '', reason = '', attempts = 0, finished_at = NULL "
+                "WHERE id = ? AND profile = ? AND state IN ('failed', 'needs_input', 'uncertain')",
+                (item_id, profile_name)).rowcount
+        if changed:
+            self.start()
+        return changed
+
+    def checkpoint(self, item_id, **fields):
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self.connect() as conn:
+            conn.execute(f"UPDATE apply_queue SET {assignments} WHERE id = ?", (*fields.values(), item_id))
+
+    def step(self, item_id):
+        row = self.connect().execute("SELECT step FROM apply_queue WHERE id = ?", (item_id,)).fetchone()
+        return row["step"] if row else ""
+
+    def claim(self, limit):
+        """Mark the next queued jobs of one profile as running and return them"""
+        conn = self.connect()
+        with self.lock, conn:
+            first = conn.execute("SELECT profile FROM apply_queue WHERE state = 'queued' ORDER BY id LIMIT 1").fetchone()
+            if first is None:
+                return []
+            rows = conn.execute("SELECT * FROM apply_queue WHERE state = 'queued' AND profile = ? ORDER BY id LIMIT ?",
+                                (first["profile"], limit)).fetchall()
+            conn.executemany(
+                "UPDATE apply_queue SET state = 'running', step = 'claimed', attempts = attempts + 1 WHERE id = ?",
+                [(row["id"],) for row in rows])
+        return [dict(row, attempts=row["attempts"] + 1) for row in rows]
+
+    def items(self, profile_name, limit=200):
+        rows = self.connect().execute(
+            "SELECT * FROM apply_queue WHERE profile = ? ORDER BY (state IN ('queued', 'running')) DESC, id DESC LIMIT ?",
+            (profile_name, limit)).fetchall()
+        items = []
+        for row in rows:
+            item = dict(row)
+            item["duration"] = (item["finished_at"] - item["started_at"]
+                                if item["finished_at"] and item["started_at"] else None)
+            items.append(item)
+        return items
+
+    def stats(self, profile_name, window=86400):
+        """Counts by state, timing and throughput of the last ``window`` seconds, top failure reasons"""
+        conn = self.connect()
+        counts = {state: 0 for state in ("queued", "running") + APPLY_DONE_STATES}
+        for row in conn.execute("SELECT state, count(*) FROM apply_queue WHERE profile = ? GROUP BY state",
+                                (profile_name,)):
+            counts[row[0]] = row[1]
+        applied, avg_seconds, first_start, last_finish = conn.execute(
+            "SELECT count(*), avg(finished_at - started_at), min(started_at), max(finished_at) FROM apply_queue "
+            "WHERE profile = ? AND state = 'applied' AND finished_at > ? AND started_at IS NOT NULL",
+            (profile_name, time.time() - window)).fetchone()
+        per_hour = None
+        if applied:
+            per_hour = round(applied * 3600 / max(last_finish - first_start, 60), 1)
+        reasons = conn.execute(
+            "SELECT reason, count(*) AS jobs FROM apply_queue WHERE profile = ? AND state IN ('failed', 'needs_input', 'uncertain') "
+            "GROUP BY reason ORDER BY jobs DESC LIMIT 5", (profile_name,)).fetchall()
+        return {
+            "counts": counts,
+            "avg_seconds": round(avg_seconds, 1) if avg_seconds else None,
+            "applied_per_hour": per_hour,
+            "failure_reasons": [{"reason": row[0], "jobs": row[1]} for row in reasons]
+        }
+
+    def resume(self):
+        """Start the worker if a previous run left jobs in the queue"""
+        if not os.path.exists(self.path):
+            return
+        row = self.connect().execute("SELECT count(*) FROM apply_queue WHERE state = 'queued'").fetchone()
+        if row[0]:
+            log.info(f"▶️ Resuming apply queue: {row[0]} jobs waiting", stage="apply", count=row[0])
+            self.start()
+
+    def start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="apply-worker", daemon=True)
+                self.thread.start()
+        self.wakeup.set()
+
+    def _run(self):
+        while True:
+            self.wakeup.clear()
+            try:
+                items = self.claim(APPLY_TABS)
+            except sqlite3.Error as e:
+                log.warning(f"⚠️ Apply queue unavailable: {e}", stage="apply")
+                items = []
+            if not items:
+                self.wakeup.wait(timeout=60)
+                continue
+            self._process(items)
+
+    def _process(self, items):
+        profile = get_profile(items[0]["profile"])
         try:
-            print("🔍 Attempting to connect to existing Chrome instance (port 9222)...")
-            browser = pw.chromium.connect_over_cdp("http://localhost:9222")
-            if browser.contexts:
-                context = browser.contexts[0]
-                if context.pages:
-                    page = context.pages[0]
-                    print("✅ Connected to existing Chrome tab!")
-                    return pw, browser, context, page
-                else:
-                    page = context.new_page()
-                    print("✅ Connected to existing Chrome, created new tab!")
-                    return pw, browser, context, page
-            else:
-                context = browser.new_context(viewport={'width': 1920, 'height': 1080})
-                page = context.new_page()
-                print("✅ Connected to existing Chrome instance!")
-                return pw, browser, context, page
+            tabs = browser_host.call_as("scheduled", open_apply_tabs, profile, items)
         except Exception as e:
-            print(f"ℹ️ Could not connect to existing Chrome: {e}")
-            print("🚀 Launching new Chrome instance...")
-    
-    # Launch with Chrome profile
-    if chrome_path and os.path.exists(chrome_path):
-        if USE_CHROME_PROFILE and CHROME_PROFILE_PATH and os.path.exists(CHROME_PROFILE_PATH):
-            print(f"👤 Using Chrome profile from: {CHROME_PROFILE_PATH}")
+            for item in items:
+                self._finish(item, *self._on_error(item, e))
+            return
+        for tab, item in zip(tabs, items):
             try:
-                context = pw.chromium.launch_persistent_context(
-                    user_data_dir=CHROME_PROFILE_PATH,
-                    headless=headless,
-                    executable_path=chrome_path,
-                    args=launch_args,
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                )
-                page = context.pages[0] if context.pages else context.new_page()
-                print("✅ Chrome profile loaded successfully!")
-                return pw, None, context, page
+                state, reason = browser_host.call_as("scheduled", apply_to_job, profile, tab, item)
             except Exception as e:
-                print(f"⚠️ Failed to load Chrome profile: {e}")
-        
-        print(f"🚀 Launching Chrome from: {chrome_path}")
-        browser = pw.chromium.launch(
-            headless=headless,
-            executable_path=chrome_path,
-            args=launch_args
-        )
-    else:
-        print("⚠️ Chrome not found, using Playwright's built-in Chromium")
-        browser = pw.chromium.launch(headless=headless, args=launch_args)
-    
-    context = browser.new_context(
-        viewport={'width': 1920, 'height': 1080},
-        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    )
-    page = context.new_page()
-    return pw, browser, context, page
+                state, reason = self._on_error(item, e)
+            self._finish(item, state, reason)
+        # The tab pool can hand out fewer tabs than asked for
+        for item in items[len(tabs):]:
+            self.checkpoint(item["id"], state="queued", step="", attempts=item["attempts"] - 1)
 
-# ---------------- Login Functions ----------------
-def login_linkedin(page, email, password):
-    if not email or not password:
-        print("⚠️ LinkedIn credentials not provided")
-        return False
-    try:
-        print("🔐 Logging into LinkedIn...")
-        page.goto("https://www.linkedin.com/login", timeout=60000)
-        page.wait_for_selector("input#username", timeout=10000)
-        page.fill("input#username", email)
-        page.fill("input#password", password)
-        time.sleep(1 + random.random())
-        page.click("button[type=submit]")
-        page.wait_for_load_state("networkidle", timeout=30000)
-        time.sleep(2 + random.random())
-        if "feed" in page.url or "jobs" in page.url:
-            print("✅ LinkedIn login successful")
-            return True
+    def _on_error(self, item, error):
+        if self.step(item["id"]) == "submitting":
+            return "uncertain", f"Error while submitting: {error}"
+        if item["attempts"] < APPLY_MAX_ATTEMPTS:
+            return "queued", str(error)
+        return "failed", str(error)
+
+    def _finish(self, item, state, reason):
+        if state == "queued":
+            self.checkpoint(item["id"], state=state, step="", reason=reason[:500])
+            return
+        self.checkpoint(item["id"], state=state, reason=reason[:500], finished_at=time.time())
+        if state == "applied":
+            log_application(item["platform"], item["keyword"], item["location"], item["title"], item["url"], "Applied")
+            log.info(f"✅ Applied: {item['title']}", stage="apply", platform=item["platform"], url=item["url"])
         else:
-            print("⚠️ LinkedIn login may have failed")
-            return False
-    except Exception as e:
-        print(f"❌ LinkedIn login error: {e}")
-        return False
+            log.warning(f"⚠️ Easy Apply {state}: {item['title']} - {reason}", stage="apply", platform=item["platform"],
+                        url=item["url"], state=state)
 
-def login_naukri(page, email, password):
-    if not email or not password:
-        print("⚠️ Naukri credentials not provided")
-        return False
+apply_queue = ApplyQueue()
+
+def find_visible(page, selectors):
+    for sel in selectors:
+        try:
+            loc = page.locator(sel).first
+            if loc.count() > 0 and loc.is_visible():
+                return loc
+        except:
+            continue
+    return None
+
+def wait_for_visible(page, selectors, timeout, deadline=None):
+    if deadline is not None:
+        timeout = deadline.timeout(timeout * 1000) / 1000
+    expires = time.monotonic() + timeout
+    while True:
+        loc = find_visible(page, selectors)
+        if loc is not None or time.monotonic() >= expires:
+            return loc
+        time.sleep(0.5)
+
+def discard_application(page):
     try:
-        print("🔐 Logging into Naukri...")
-        page.goto("https://www.naukri.com/nlogin/login", timeout=60000)
-        page.wait_for_selector("input#usernameField", timeout=10000)
-        page.fill("input#usernameField", email)
-        page.fill("input#passwordField", password)
-        time.sleep(1 + random.random())
-        page.click("button[type=submit]")
-        page.wait_for_load_state("networkidle", timeout=30000)
-        time.sleep(3 + random.random())
-        
-        current_url = page.url.lower()
-        if "mnjuser" in current_url or "homepage" in current_url or "naukri.com" in current_url:
-            try:
-                profile_indicators = [
-                    'text="Complete profile"',
-                    'text="Profile performance"',
-                    'text="My home"',
-                    'a[href*="mnjuser"]',
-                    'div:has-text("Profile")'
-                ]
-                
-                for indicator in profile_indicators:
-                    if page.locator(indicator).count() > 0:
-                        print("✅ Naukri login successful")
-                        return True
-                
-                if "naukri.com" in current_url and "login" not in current_url:
-                    print("✅ Naukri login successful")
-                    return True
-                    
-            except:
-                pass
-        
-        print("⚠️ Naukri login may have failed - please check credentials")
-        return False
-    except Exception as e:
-        print(f"❌ Naukri login error: {e}")
-        return False
+        dismiss = find_visible(page, APPLY_SELECTORS["dismiss"])
+        if dismiss:
+            dismiss.click()
+            discard = wait_for_visible(page, APPLY_SELECTORS["discard"], 3)
+            if discard:
+                discard.click()
+    except:
+        pass
 
-# ---------------- Job Search Functions ----------------
-def build_linkedin_all_jobs_url(keyword: str, location: str) -> str:
-    """Build LinkedIn URL for ALL jobs"""
-    params = {
-        "keywords": keyword,
-        "location": location,
-        "f_TPR": "r86400",
-        "sortBy": "DD",
-        "position": "1",
-        "pageNum": "0"
-    }
-    return f"https://www.linkedin.com/jobs/search/?{urlencode(params, quote_via=quote)}"
+def open_apply_tabs(profile, items):
+    """Log in and start loading every job page of a batch (runs on the browser thread)"""
+    if ensure_logged_in(profile, 'linkedin') is None:
+        raise RuntimeError("LinkedIn login failed")
+    tabs = get_tab_pool(browser_host.get_session(profile), len(items), key='apply_tabs')
+    for tab, item in zip(tabs, items):
+        rate_limiter.wait(item["url"])
+        tab.goto(item["url"], wait_until="commit", timeout=30000)
+        apply_queue.checkpoint(item["id"], step="opened")
+    return tabs
 
-def build_naukri_url(keyword: str, location: str) -> str:
-    keyword_formatted = keyword.replace(" ", "-")
-    location_formatted = location.replace(" ", "-").lower()
-    return f"https://www.naukri.com/{keyword_formatted}-jobs-in-{location_formatted}"
+def apply_to_job(profile, tab, item, deadline=None):
+    """Work through one Easy Apply form (runs on the browser thread).
 
-def fetch_linkedin_jobs(page, keyword, location):
-    """Fetch ALL LinkedIn jobs with matching keywords"""
-    print(f"\n🔍 [LinkedIn] Searching: '{keyword}' in '{location}'")
+    Returns ``(state, reason)``. The ``submitting`` checkpoint is written
+    before the final click so a crash after it is never retried blindly.
+    Waiting dashboard searches run between form steps; the waits share
+    ``deadline`` and raise ``DeadlineExceeded`` once it is spent.
+    """
+    if item["platform"] != "LinkedIn":
+        return "failed", "Easy Apply is only supported on LinkedIn"
+    deadline = deadline or Deadline(APPLY_JOB_DEADLINE)
+    apply_queue.checkpoint(item["id"], step="applying", started_at=time.time())
+    tab.wait_for_load_state("domcontentloaded", timeout=deadline.timeout(30000))
+    wait_for_visible(tab, APPLY_SELECTORS["already_applied"] + APPLY_SELECTORS["open"], 10, deadline)
     
-    url = build_linkedin_all_jobs_url(keyword, location)
+    if find_visible(tab, APPLY_SELECTORS["already_applied"]):
+        return "applied", "Already applied"
+    button = find_visible(tab, APPLY_SELECTORS["open"])
+    if button is None:
+        return "failed", "No Easy Apply button on the job page"
+    button.click()
+    if wait_for_visible(tab, APPLY_SELECTORS["dialog"], 10, deadline) is None:
+        return "failed", "Easy Apply form did not open"
     
-    try:
-        page.goto(url, timeout=60000)
-        page.wait_for_load_state("domcontentloaded")
-        time.sleep(4 + random.random())
-
-        job_card_selectors = [
-            'li.jobs-search-results__list-item',
-            'li.scaffold-layout__list-item',
-            'div.job-card-container'
-        ]
+    resume = profile.resume_path if profile.resume_path and os.path.exists(profile.resume_path) else None
+    uploaded = False
+    step_buttons = APPLY_SELECTORS["submit"] + APPLY_SELECTORS["review"] + APPLY_SELECTORS["next"]
+    for _ in range(APPLY_MAX_STEPS):
+        # Between steps nothing is half submitted, so a dashboard search can go first
+        browser_host.checkpoint()
+        wait_for_visible(tab, step_buttons, 5, deadline)
+        if resume and not uploaded:
+            upload = tab.locator(", ".join(APPLY_SELECTORS["resume"])).first
+            if upload.count() > 0:
+                upload.set_input_files(resume)
+                uploaded = True
         
-        job_cards = []
-        for sel in job_card_selectors:
-            try:
-                cards = page.locator(sel).all()
-                if len(cards) > 0:
-                    job_cards = cards
-                    print(f"✅ Found {len(job_cards)} LinkedIn job cards")
-                    break
-            except:
-                continue
+        submit = find_visible(tab, APPLY_SELECTORS["submit"])
+        if submit:
+            apply_queue.checkpoint(item["id"], step="submitting")
+            submit.click()
+            # Not capped by the deadline: once clicked, the confirmation decides applied vs uncertain
+            if wait_for_visible(tab, APPLY_SELECTORS["done"], 15):
+                apply_queue.checkpoint(item["id"], step="submitted")
+                discard_application(tab)
+                return "applied", ""
+            return "uncertain", "Submitted but no confirmation was shown"
         
-        if not job_cards:
-            print("❌ No LinkedIn job cards found")
+        advance = find_visible(tab, APPLY_SELECTORS["review"]) or find_visible(tab, APPLY_SELECTORS["next"])
+        if advance is None:
+            discard_application(tab)
+            return "failed", "Unrecognised Easy Apply step"
+        advance.click()
+        # Validation errors show up on the same step; a new step means the click went through
+        wait_for_visible(tab, APPLY_SELECTORS["error"], 1, deadline)
+        if find_visible(tab, APPLY_SELECTORS["error"]):
+            missing = first_text(tab, APPLY_SELECTORS["error"])
+            discard_application(tab)
+            return "needs_input", f"Form needs answers: {missing}" if missing else "Form needs answers"
+    
+    discard_application(tab)
+    return "failed", f"Form has more than {APPLY_MAX_STEPS} steps"
+
+# ---------------- Batch Crawls ----------------
+CRAWL_MAX_PAGES = 10
+
+CRAWL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_runs (
+    id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    location TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'running',
+    reason TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS crawl_units (
+    run_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    platform TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    found INTEGER NOT NULL DEFAULT 0,
+    finished_at REAL,
+    PRIMARY KEY (run_id, seq)
+);
+CREATE TABLE IF NOT EXISTS crawl_results (
+    run_id INTEGER NOT NULL,
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    job TEXT NOT NULL,
+    PRIMARY KEY (run_id, job_id)
+);
+"""
+
+class CrawlStore:
+    """Durable progress of multi-keyword, multi-page crawls.
+
+    A run is split into units (one results page of one keyword on one
+    platform). Each unit's jobs are saved in the same transaction that marks
+    it done, so a crash, a browser restart or a settings save loses at most
+    the page being loaded, and resuming starts at the first unfinished unit.
+    """
+
+    def __init__(self, path=HISTORY_DB):
+        self.path = path
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.recovered = None
+        self.threads = {}
+
+    def connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(CRAWL_SCHEMA)
+            self.local.conn = conn
+        with self.lock:
+            if self.recovered is None:
+                # Anything still marked running belongs to a process that died
+                ids = [row[0] for row in conn.execute("SELECT id FROM crawl_runs WHERE state = 'running'")]
+                with conn:
+                    conn.execute("UPDATE crawl_runs SET state = 'interrupted', reason = 'Dashboard stopped during the crawl' "
+                                 "WHERE state = 'running'")
+                self.recovered = ids
+        return conn
+
+    def create(self, profile, platforms, keywords, location, pages):
+        conn = self.connect()
+        now = time.time()
+        units = [(platform, keyword, page) for keyword in keywords for platform in platforms for page in range(pages)]
+        with conn:
+            run_id = conn.execute("INSERT INTO crawl_runs (profile, location, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                                  (profile.name, location, now, now)).lastrowid
+            conn.executemany("INSERT INTO crawl_units (run_id, seq, platform, keyword, page) VALUES (?, ?, ?, ?, ?)",
+                             [(run_id, seq) + unit for seq, unit in enumerate(units)])
+        return run_id
+
+    def get(self, run_id):
+        row = self.connect().execute("SELECT * FROM crawl_runs WHERE id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    def next_units(self, run_id, limit):
+        rows = self.connect().execute("SELECT * FROM crawl_units WHERE run_id = ? AND state = 'pending' ORDER BY seq LIMIT ?",
+                                      (run_id, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def complete_unit(self, unit, jobs, exhausted=False):
+        """Save a unit's jobs and mark it done; ``exhausted`` skips the keyword's later pages"""
+        conn = self.connect()
+        now = time.time()
+        with conn:
+            conn.executemany("INSERT OR IGNORE INTO crawl_results (run_id, job_id, seq, job) VALUES (?, ?, ?, ?)",
+                             [(unit["run_id"], job_key(job), unit["seq"], json.dumps(job)) for job in jobs])
+            conn.execute("UPDATE crawl_units SET state = 'done', found = ?, finished_at = ? WHERE run_id = ? AND seq = ?",
+                         (len(jobs), now, unit["run_id"], unit["seq"]))
+            if exhausted:
+                conn.execute("UPDATE crawl_units SET state = 'skipped', finished_at = ? "
+                             "WHERE run_id = ? AND platform = ? AND keyword = ? AND page > ? AND state = 'pending'",
+                             (now, unit["run_id"], unit["platform"], unit["keyword"], unit["page"]))
+            conn.execute("UPDATE crawl_runs SET updated_at = ? WHERE id = ?", (now, unit["run_id"]))
+
+    def set_state(self, run_id, state, reason=""):
+        with self.connect() as conn:
+            conn.execute("UPDATE crawl_runs SET state = ?, reason = ?, updated_at = ? WHERE id = ?",
+                         (state, reason[:500], time.time(), run_id))
+
+    def runs(self, profile_name, limit=20):
+        """Recent runs with their progress, newest first"""
+        if not os.path.exists(self.path):
             return []
+        rows = self.connect().execute(
+            "SELECT r.*, "
+            "(SELECT count(*) FROM crawl_units u WHERE u.run_id = r.id) AS units, "
+            "(SELECT count(*) FROM crawl_units u WHERE u.run_id = r.id AND u.state != 'pending') AS units_done, "
+            "(SELECT count(*) FROM crawl_results c WHERE c.run_id = r.id) AS jobs, "
+            "(SELECT group_concat(DISTINCT u.keyword) FROM crawl_units u WHERE u.run_id = r.id) AS keywords "
+            "FROM crawl_runs r WHERE r.profile = ? ORDER BY r.id DESC LIMIT ?", (profile_name, limit)).fetchall()
+        return [dict(row) for row in rows]
 
-        results = []
-        for card in job_cards[:50]:
-            try:
-                title_link = card.locator('a.job-card-list__title, a[href*="/jobs/view/"]').first
-                title = title_link.inner_text().strip()
-                href = title_link.get_attribute("href")
-                
-                if not href or not title:
-                    continue
-                
-                if not href.startswith("http"):
-                    href = "https://www.linkedin.com" + href
-                
-                if "?" in href:
-                    href = href.split("?")[0]
+    def results(self, run_id):
+        rows = self.connect().execute("SELECT job FROM crawl_results WHERE run_id = ? ORDER BY seq, rowid", (run_id,))
+        return [json.loads(row[0]) for row in rows]
 
-                if APPLY_TITLE_KEYWORDS:
-                    if not any(kw.lower() in title.lower() for kw in APPLY_TITLE_KEYWORDS):
-                        continue
+    def query(self, run_id):
+        """Platforms and keywords of a run as a ``query_key``-style string, for change tracking"""
+        rows = self.connect().execute("SELECT DISTINCT platform, keyword FROM crawl_units WHERE run_id = ?", (run_id,)).fetchall()
+        platforms = ",".join(sorted({row[0] for row in rows}))
+        keywords = ";".join(sorted({row[1] for row in rows}))
+        return "crawl:" + query_key(platforms, keywords, self.get(run_id)["location"])
 
-                is_easy_apply = card.locator('span:has-text("Easy Apply")').count() > 0
-                
-                results.append({
-                    "platform": "LinkedIn",
-                    "keyword": keyword,
-                    "title": title,
-                    "url": href,
-                    "easy_apply": is_easy_apply
-                })
-                
-            except Exception as e:
-                continue
+    def start(self, run_id):
+        """Run (or resume) a crawl in the background"""
+        with self.lock:
+            thread = self.threads.get(run_id)
+            if thread is not None and thread.is_alive():
+                return False
+            self.threads[run_id] = threading.Thread(target=run_crawl, args=(run_id,), name=f"crawl-{run_id}", daemon=True)
+            self.threads[run_id].start()
+            return True
 
-        print(f"✅ Found {len(results)} LinkedIn jobs matching criteria")
-        return results
-        
-    except Exception as e:
-        print(f"❌ Error fetching LinkedIn jobs: {e}")
-        return []
+    def resume(self):
+        """Restart the runs a previous process was in the middle of"""
+        if not os.path.exists(self.path):
+            return
+        self.connect()
+        for run_id in self.recovered:
+            log.info(f"▶️ Resuming crawl #{run_id}", stage="crawl", crawl=run_id)
+            self.start(run_id)
 
-def fetch_naukri_jobs(page, keyword, location):
-    print(f"\n🔍 [Naukri] Searching: '{keyword}' in '{location}'")
-    url = build_naukri_url(keyword, location)
-    
+crawl_store = CrawlStore()
+
+def crawl_units(profile, units, location, verify_login):
+    """Fetch a wave of crawl pages in parallel tabs (runs on the browser thread)"""
+    queries = [(unit["platform"], unit["keyword"], location, unit["page"]) for unit in units]
+    return parallel_search(profile, queries, verify_login=verify_login)
+
+def run_crawl(run_id):
+    """Work through a run's remaining units, checkpointing after each one"""
+    run = crawl_store.get(run_id)
+    profile = get_profile(run["profile"])
+    crawl_store.set_state(run_id, "running")
+    verified = set()
     try:
-        page.goto(url, timeout=60000)
-        page.wait_for_load_state("domcontentloaded")
-        time.sleep(3 + random.random())
+        while True:
+            units = crawl_store.next_units(run_id, SEARCH_MAX_TABS)
+            if not units:
+                break
+            platforms = {unit["platform"] for unit in units}
+            outcomes = browser_host.call_as("scheduled", crawl_units, profile, units, run["location"],
+                                            not platforms <= verified)
+            verified |= platforms
+            failed = None
+            for unit, (jobs, seen, error, cached) in zip(units, outcomes):
+                if not error and not seen and unit["page"] == 0:
+                    # An empty first page is more likely a login wall, throttling or broken selectors than no jobs
+                    error = f"No {PLATFORM_NAMES[unit['platform']]} job cards for '{unit['keyword']}' on page 1"
+                if error:
+                    failed = failed or error
+                    continue
+                if not cached:
+                    job_history.record(jobs)
+                    analytics.record_search(unit["platform"], unit["keyword"], jobs, len(seen))
+                # A short page after the first is the end of the results
+                exhausted = unit["page"] > 0 and len(seen) < PLATFORMS[unit["platform"]].page_size
+                crawl_store.complete_unit(unit, jobs, exhausted=exhausted)
+            # Finished pages of the wave are saved; the failed ones run again on resume
+            if failed:
+                raise RuntimeError(failed)
+    except Exception as e:
+        crawl_store.set_state(run_id, "interrupted", str(e))
+        log.warning(f"⏸️ Crawl #{run_id} interrupted: {e}", stage="crawl", crawl=run_id)
+        return
+    crawl_store.set_state(run_id, "done")
+    log.info(f"✅ Crawl #{run_id} finished", stage="crawl", crawl=run_id)
+    track_changes(profile, crawl_store.query(run_id), crawl_store.results(run_id), crawl=run_id, location=run["location"])
 
-        for i in range(5):
-            page.keyboard.press("End")
-            time.sleep(1)
+# ---------------- Change Detection ----------------
+# Fields compared between crawls; "posted" and "applicants" change every day, so they're left out
+CHANGE_FIELDS = ("title", "company", "salary", "experience", "easy_apply")
+NOTIFY_DIR = "notifications"
+NOTIFY_MAX_ITEMS = 50
+NOTIFY_BATCH = 20
+# A claimed batch that's never acknowledged goes back to new/ after this long
+NOTIFY_CLAIM_TIMEOUT = 5 * 60
 
-        job_cards = page.locator('article.jobTuple, div.srp-jobtuple-wrapper').all()
-        
-        if not job_cards:
-            print("❌ No Naukri job cards found")
-            return []
+SNAPSHOT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_snapshots (
+    scope TEXT NOT NULL,
+    query TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    job TEXT NOT NULL,
+    PRIMARY KEY (scope, query, job_id)
+) WITHOUT ROWID;
+"""
 
-        print(f"✅ Found {len(job_cards)} Naukri job cards")
-        results = []
+def change_fields(job):
+    return {field: job.get(field) for field in CHANGE_FIELDS if job.get(field) not in (None, "")}
+
+def fields_digest(fields):
+    return hashlib.blake2b(json.dumps(fields, sort_keys=True).encode(), digest_size=8).hexdigest()
+
+class ChangeTracker:
+    """Last result set of every (profile, query), kept as job ID → field digest.
+
+    ``diff()`` loads the previous snapshot into a dict and walks the new
+    results once, so added, removed and changed sets come out in linear
+    time. A field only counts as changed if both crawls have it (fast HTTP
+    cards carry the company, rendered ones may not). The first crawl of a
+    query is the baseline and reports nothing.
+    """
+
+    def __init__(self, path=HISTORY_DB):
+        self.path = path
+        self.local = threading.local()
+
+    def connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SNAPSHOT_SCHEMA)
+            self.local.conn = conn
+        return conn
+
+    def diff(self, scope, query, jobs, partial=False):
+        """Compare ``jobs`` with the last snapshot and replace it.
+
+        Returns ``{"added", "removed", "changed", "baseline"}``. A ``partial``
+        crawl can't tell missing from removed, so it reports no removals and
+        keeps the jobs it didn't reach.
+        """
+        conn = self.connect()
+        previous = {job_id: (digest, job) for job_id, digest, job in
+                    conn.execute("SELECT job_id, digest, job FROM query_snapshots WHERE scope = ? AND query = ?",
+                                 (scope, query))}
+        current = {}
+        for job in jobs:
+            fields = change_fields(job)
+            summary = {"job_id": job_key(job), "platform": job.get("platform"), "url": job.get("url"), **fields}
+            current[summary["job_id"]] = (fields_digest(fields), fields, summary)
         
-        for card in job_cards[:50]:
+        added, changed = [], []
+        for job_id, (digest, fields, summary) in current.items():
+            old = previous.get(job_id)
+            if old is None:
+                added.append(summary)
+            elif old[0] != digest:
+                old_job = json.loads(old[1])
+                differences = {field: [old_job[field], value] for field, value in fields.items()
+                               if field in old_job and old_job[field] != value}
+                if differences:
+                    changed.append({**summary, "changes": differences})
+        removed = [] if partial else [json.loads(job) for job_id, (_, job) in previous.items() if job_id not in current]
+        
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO query_snapshots (scope, query, job_id, digest, job) VALUES (?, ?, ?, ?, ?)",
+                             [(scope, query, job_id, digest, json.dumps(summary))
+                              for job_id, (digest, fields, summary) in current.items()])
+            if removed:
+                conn.executemany("DELETE FROM query_snapshots WHERE scope = ? AND query = ? AND job_id = ?",
+                                 [(scope, query, job["job_id"]) for job in removed])
+        baseline = not previous
+        if baseline:
+            added = []
+        return {"added": added, "removed": removed, "changed": changed, "baseline": baseline}
+
+change_tracker = ChangeTracker()
+
+class NotificationSpool:
+    """Maildir-style spool of change notifications.
+
+    Messages are written to ``tmp/`` and renamed into ``new/``, so a reader
+    never sees half a file. A notifier claims a batch (renamed into
+    ``cur/``), delivers it and acknowledges it, which deletes the files.
+    Claims not acknowledged within NOTIFY_CLAIM_TIMEOUT go back to ``new/``.
+    """
+
+    def __init__(self, directory=NOTIFY_DIR):
+        self.directory = directory
+        self.lock = threading.Lock()
+
+    def _dir(self, name):
+        path = os.path.join(self.directory, name)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def put(self, message):
+        now = time.time()
+        name = f"{int(now * 1000)}.{os.getpid()}.{random.getrandbits(32):08x}.json"
+        tmp_path = os.path.join(self._dir("tmp"), name)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"id": name[:-5], "created": now, **message}, f)
+        os.replace(tmp_path, os.path.join(self._dir("new"), name))
+        return name
+
+    def _release_stale(self):
+        cur = self._dir("cur")
+        for name in os.listdir(cur):
+            path = os.path.join(cur, name)
             try:
-                title_elem = card.locator('a.title, a.heading-span').first
-                title = title_elem.inner_text().strip()
-                href = title_elem.get_attribute("href")
-                
-                if not href or not title:
+                if time.time() - os.path.getmtime(path) > NOTIFY_CLAIM_TIMEOUT:
+                    os.replace(path, os.path.join(self._dir("new"), name))
+            except OSError:
+                continue
+
+    def counts(self):
+        return {box: len(os.listdir(self._dir(box))) for box in ("new", "cur")}
+
+    def claim(self, limit=NOTIFY_BATCH):
+        """Oldest ``limit`` pending messages, moved to ``cur/`` until acknowledged"""
+        with self.lock:
+            self._release_stale()
+            batch = []
+            for name in sorted(os.listdir(self._dir("new")))[:limit]:
+                path = os.path.join(self._dir("cur"), name)
+                try:
+                    os.replace(os.path.join(self._dir("new"), name), path)
+                    # Claim time, for the timeout above
+                    os.utime(path)
+                    with open(path, encoding="utf-8") as f:
+                        batch.append(json.load(f))
+                except (OSError, ValueError):
                     continue
-                
-                if not href.startswith("http"):
-                    href = "https://www.naukri.com" + href
-
-                if APPLY_TITLE_KEYWORDS:
-                    if not any(kw.lower() in title.lower() for kw in APPLY_TITLE_KEYWORDS):
-                        continue
-
-                results.append({
-                    "platform": "Naukri",
-                    "keyword": keyword,
-                    "title": title,
-                    "url": href
-                })
-                
-            except Exception as e:
+            return batch
+
+    def ack(self, ids):
+        """Delete delivered messages; returns how many were still claimed"""
+        done = 0
+        for message_id in ids:
+            name = secure_filename(f"{message_id}.json")
+            try:
+                os.remove(os.path.join(self._dir("cur"), name))
+                done += 1
+            except OSError:
                 continue
+        return done
+
+notification_spool = NotificationSpool()
+
+def track_changes(profile, query, jobs, partial=False, **about):
+    """Diff a crawl against the previous one for ``query`` and spool a notification if anything changed.
+
+    One message per crawl, listing at most NOTIFY_MAX_ITEMS jobs of each
+    kind (the counts are always complete), so big result sets can't flood
+    the notifier.
+    """
+    try:
+        diff = change_tracker.diff(profile.name, query, jobs, partial)
+    except sqlite3.Error as e:
+        log.warning(f"⚠️ Change detection failed: {e}", stage="changes", profile=profile.name, query=query)
+        return None
+    if not (diff["added"] or diff["removed"] or diff["changed"]):
+        return diff
+    message = {"profile": profile.name, "query": query, **about,
+               "counts": {kind: len(diff[kind]) for kind in ("added", "removed", "changed")}}
+    for kind in ("added", "removed", "changed"):
+        message[kind] = diff[kind][:NOTIFY_MAX_ITEMS]
+    notification_spool.put(message)
+    counts = message["counts"]
+    log.info(f"🔔 {profile.name}: {counts['added']} new, {counts['changed']} changed, {counts['removed']} gone for '{query}'",
+             stage="changes", profile=profile.name, query=query, **counts)
+    return diff
+
+def batch_summary(messages):
+    """Totals per profile for a claimed batch, for a single digest-style notification"""
+    profiles = {}
+    for message in messages:
+        totals = profiles.setdefault(message["profile"], {"queries": 0, "added": 0, "removed": 0, "changed": 0})
+        totals["queries"] += 1
+        for kind, count in message["counts"].items():
+            totals[kind] += count
+    return profiles
 
-        print(f"✅ Found {len(results)} Naukri jobs matching criteria")
-        return results
+# ---------------- Analytics ----------------
+ANALYTICS_DAYS = 14
+ANALYTICS_MAX_DAYS = 90
+
+ANALYTICS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS yield_daily (
+    day TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    scanned INTEGER NOT NULL DEFAULT 0,
+    found INTEGER NOT NULL DEFAULT 0,
+    easy_apply INTEGER NOT NULL DEFAULT 0,
+    easy_apply_known INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, platform, keyword)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS yield_totals (
+    platform TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    scanned INTEGER NOT NULL DEFAULT 0,
+    found INTEGER NOT NULL DEFAULT 0,
+    easy_apply INTEGER NOT NULL DEFAULT 0,
+    easy_apply_known INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (platform, keyword)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS applications_daily (
+    day TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, platform, status)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS analytics_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+class AnalyticsRollup:
+    """Search yield and application counts, rolled up as they are written.
+
+    Every search adds its cards scanned, jobs kept (title filter matches),
+    Easy Apply jobs and jobs whose Easy Apply flag is known (the share is
+    taken over those) to a per day/platform/keyword row and to an all-time
+    row per platform/keyword; every logged application bumps a per
+    day/platform/status counter. Reading the stats only touches these
+    rollups (a bounded window of days), never the log or the history.
+
+    Applications logged before the rollups existed are counted once by
+    ``backfill()``; searches from before then aren't recoverable.
+    """
+
+    def __init__(self, path=HISTORY_DB):
+        self.path = path
+        self.local = threading.local()
+        self.schema_lock = threading.Lock()
+
+    def connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            with self.schema_lock:
+                conn.executescript(ANALYTICS_SCHEMA)
+                for table in ("yield_daily", "yield_totals"):
+                    if "easy_apply_known" not in {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}:
+                        # Rollups from before unknown flags existed counted every job as known
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN easy_apply_known INTEGER NOT NULL DEFAULT 0")
+                        with conn:
+                            conn.execute(f"UPDATE {table} SET easy_apply_known = found")
+            with conn:
+                # Rows logged before this moment are the backfill's, later ones the hooks'
+                conn.execute("INSERT OR IGNORE INTO analytics_meta (key, value) VALUES ('since', ?)", (str(time.time()),))
+            self.local.conn = conn
+        return conn
+
+    def record_search(self, platform, keyword, jobs, scanned):
+        """Roll up one results page or search: ``scanned`` cards, ``jobs`` kept"""
+        platform = platform.strip().lower()
+        keyword = keyword.strip().lower()
+        found = len(jobs)
+        scanned = max(scanned, found)
+        easy_apply = sum(1 for job in jobs if job.get("easy_apply"))
+        known = sum(1 for job in jobs if job.get("easy_apply") is not None)
+        if not scanned:
+            return
+        conn = self.connect()
+        try:
+            with conn:
+                conn.execute("INSERT INTO yield_daily (day, platform, keyword, scanned, found, easy_apply, easy_apply_known) "
+                             "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                             "ON CONFLICT (day, platform, keyword) DO UPDATE SET scanned = scanned + excluded.scanned, "
+                             "found = found + excluded.found, easy_apply = easy_apply + excluded.easy_apply, "
+                             "easy_apply_known = easy_apply_known + excluded.easy_apply_known",
+                             (time.strftime("%Y-%m-%d"), platform, keyword, scanned, found, easy_apply, known))
+                conn.execute("INSERT INTO yield_totals (platform, keyword, scanned, found, easy_apply, easy_apply_known) "
+                             "VALUES (?, ?, ?, ?, ?, ?) "
+                             "ON CONFLICT (platform, keyword) DO UPDATE SET scanned = scanned + excluded.scanned, "
+                             "found = found + excluded.found, easy_apply = easy_apply + excluded.easy_apply, "
+                             "easy_apply_known = easy_apply_known + excluded.easy_apply_known",
+                             (platform, keyword, scanned, found, easy_apply, known))
+        except sqlite3.Error as e:
+            log.warning(f"⚠️ Could not update search stats: {e}", stage="analytics", platform=platform, query=keyword)
+
+    def record_application(self, platform, status, day=None, count=1):
+        conn = self.connect()
+        try:
+            with conn:
+                conn.execute("INSERT INTO applications_daily (day, platform, status, count) VALUES (?, ?, ?, ?) "
+                             "ON CONFLICT (day, platform, status) DO UPDATE SET count = count + excluded.count",
+                             (day or time.strftime("%Y-%m-%d"), platform.strip().lower(), status.strip().lower(), count))
+        except sqlite3.Error as e:
+            log.warning(f"⚠️ Could not update application stats: {e}", stage="analytics", platform=platform)
+
+    def backfill(self):
+        """Count the application log written before the rollups existed (runs once)"""
+        conn = self.connect()
+        if conn.execute("SELECT 1 FROM analytics_meta WHERE key = 'backfilled'").fetchone():
+            return 0
+        since = float(conn.execute("SELECT value FROM analytics_meta WHERE key = 'since'").fetchone()[0])
+        counts = Counter()
+        for row in iter_application_rows(until=since):
+            counts[(row[6][:10], row[0].strip().lower(), row[5].strip().lower())] += 1
+        with conn:
+            if conn.execute("SELECT 1 FROM analytics_meta WHERE key = 'backfilled'").fetchone():
+                return 0
+            conn.executemany("INSERT INTO applications_daily (day, platform, status, count) VALUES (?, ?, ?, ?) "
+                             "ON CONFLICT (day, platform, status) DO UPDATE SET count = count + excluded.count",
+                             [key + (count,) for key, count in counts.items()])
+            conn.execute("INSERT INTO analytics_meta (key, value) VALUES ('backfilled', ?)", (str(time.time()),))
+        if counts:
+            log.info(f"📈 Counted {sum(counts.values())} earlier applications into the stats", stage="analytics",
+                     count=sum(counts.values()))
+        return sum(counts.values())
+
+    def summary(self, days=ANALYTICS_DAYS):
+        """Totals, per-keyword yield and the last ``days`` days, read from the rollups only"""
+        days = max(1, min(int(days), ANALYTICS_MAX_DAYS))
+        conn = self.connect()
+        first_day = time.strftime("%Y-%m-%d", time.localtime(time.time() - (days - 1) * 86400))
         
-    except Exception as e:
-        print(f"❌ Error fetching Naukri jobs: {e}")
-        return []
+        def rates(row):
+            scanned, found, easy, known = row["scanned"], row["found"], row["easy_apply"], row["easy_apply_known"]
+            return {"scanned": scanned, "found": found, "easy_apply": easy,
+                    "match_rate": round(found / scanned, 3) if scanned else None,
+                    "easy_apply_share": round(easy / known, 3) if known else None}
+        
+        platforms = {row["platform"]: rates(row) for row in conn.execute(
+            "SELECT platform, SUM(scanned) AS scanned, SUM(found) AS found, SUM(easy_apply) AS easy_apply, "
+            "SUM(easy_apply_known) AS easy_apply_known FROM yield_totals GROUP BY platform")}
+        keywords = [{"platform": row["platform"], "keyword": row["keyword"], **rates(row)} for row in conn.execute(
+            "SELECT * FROM yield_totals ORDER BY found DESC LIMIT 20")]
+        
+        daily = OrderedDict()
+        for offset in range(days):
+            day = time.strftime("%Y-%m-%d", time.localtime(time.time() - (days - 1 - offset) * 86400))
+            daily[day] = {"found": {}, "scanned": 0, "applications": {}}
+        window_platforms = {}
+        for row in conn.execute("SELECT day, platform, SUM(scanned) AS scanned, SUM(found) AS found, "
+                                "SUM(easy_apply) AS easy_apply, SUM(easy_apply_known) AS easy_apply_known "
+                                "FROM yield_daily WHERE day >= ? GROUP BY day, platform",
+                                (first_day,)):
+            if row["day"] in daily:
+                daily[row["day"]]["found"][row["platform"]] = row["found"]
+                daily[row["day"]]["scanned"] += row["scanned"]
+                totals = window_platforms.setdefault(row["platform"], Counter())
+                for field in ("scanned", "found", "easy_apply", "easy_apply_known"):
+                    totals[field] += row[field]
+        applications = Counter()
+        for row in conn.execute("SELECT day, status, SUM(count) AS count FROM applications_daily "
+                                "WHERE day >= ? GROUP BY day, status", (first_day,)):
+            if row["day"] in daily:
+                daily[row["day"]]["applications"][row["status"]] = row["count"]
+            applications[row["status"]] += row["count"]
+        
+        window = Counter()
+        for totals in window_platforms.values():
+            window.update(totals)
+        return {
+            "days": days,
+            "platforms": platforms,
+            "keywords": keywords,
+            "daily": daily,
+            "window": {"found": window["found"], "scanned": window["scanned"],
+                       "match_rate": round(window["found"] / window["scanned"], 3) if window["scanned"] else None,
+                       "platforms": {name: rates(totals) for name, totals in window_platforms.items()},
+                       "applications": dict(applications)}
+        }
 
-def log_application(platform, keyword, location, title, url, status):
+analytics = AnalyticsRollup()
+
+# ---------------- Streaming Export ----------------
+EXPORT_BATCH_SIZE = 1000
+LOG_COLUMNS = ["platform", "keyword", "location", "title", "url", "status", "timestamp"]
+HISTORY_COLUMNS = ["job_id", "platform", "keyword", "title", "company", "url", "first_seen", "last_seen", "description"]
+RESULT_COLUMNS = ["job_id", "platform", "keyword", "title", "url", "easy_apply", "score"] + list(DETAIL_FIELDS)
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "columnar": "application/x-ndjson"
+}
+# Filters each dataset has the fields for; asking for another one is an error rather than ignored
+EXPORT_FILTERS = {
+    "applications": ("since", "until", "platform", "status"),
+    "history": ("since", "until", "platform"),
+    "results": ("platform",)
+}
+
+def iter_application_rows(since=None, until=None, platform=None, status=None):
+    """Rows of the application log and its rotated backups, read one line at a time"""
+    log_writer.flush()
+    for path in log_files():
+        yield from _iter_log_file(path, since, until, platform, status)
+
+def _iter_log_file(path, since, until, platform, status):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            if len(row) < len(LOG_COLUMNS):
+                continue
+            row = row[:len(LOG_COLUMNS)]
+            if platform and row[0].lower() != platform.lower():
+                continue
+            if status and row[5].lower() != status.lower():
+                continue
+            if since or until:
+                try:
+                    logged = time.mktime(time.strptime(row[6], "%Y-%m-%d %H:%M:%S"))
+                except ValueError:
+                    continue
+                if (since and logged < since) or (until and logged >= until):
+                    continue
+            yield row
+
+def iter_history_rows(since=None, until=None, platform=None):
+    """Rows of the job history, fetched from SQLite in batches"""
+    if not os.path.exists(HISTORY_DB):
+        return
+    filters, params = [], []
+    if since:
+        filters.append("first_seen >= ?")
+        params.append(since)
+    if until:
+        filters.append("first_seen < ?")
+        params.append(until)
+    if platform:
+        filters.append("lower(platform) = ?")
+        params.append(platform.lower())
+    where = f"WHERE {' AND '.join(filters)}" if filters else ""
+    # A private connection, since the response may be iterated after the request ends
+    conn = sqlite3.connect(HISTORY_DB, timeout=30)
     try:
-        with open(LOG_FILE, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                platform, keyword, location, title, url, status,
-                time.strftime("%Y-%m-%d %H:%M:%S")
-            ])
-    except Exception as e:
-        print(f"⚠️ Failed to log application: {e}")
+        cursor = conn.execute(f"SELECT {', '.join(HISTORY_COLUMNS)} FROM jobs {where} ORDER BY id", params)
+        while True:
+            rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        conn.close()
+
+def iter_result_rows(profile, platform=None):
+    """Rows of the profile's current search results"""
+    for job in profile.jobs:
+        if platform and job.platform.lower() != platform.lower():
+            continue
+        job = job.to_dict()
+        yield [job.get(column, "") for column in RESULT_COLUMNS]
+
+def encode_rows(fmt, columns, rows):
+    """Encode ``rows`` as ``fmt``, yielding one chunk per EXPORT_BATCH_SIZE rows.
+
+    ``columnar`` is NDJSON where the first line is the column list and every
+    following line is a batch of rows stored column by column.
+    """
+    batch = []
+    if fmt == "columnar":
+        yield json.dumps({"columns": columns}) + "\n"
+    elif fmt == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(columns)
+        yield buffer.getvalue()
+    
+    def flush(batch):
+        if fmt == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(batch)
+            return buffer.getvalue()
+        if fmt == "ndjson":
+            return "".join(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n" for row in batch)
+        return json.dumps({"rows": len(batch), "data": dict(zip(columns, map(list, zip(*batch))))}, ensure_ascii=False) + "\n"
+    
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            yield flush(batch)
+            batch = []
+    if batch:
+        yield flush(batch)
 
 # ---------------- Flask Templates with Responsive Design ----------------
 home_template = """
@@ -540,6 +4771,16 @@ home_template = """
             background: #dc3545; 
             color: white;
         }
+        .profile-form {
+            display: flex;
+            gap: 5px;
+        }
+        .profile-form select, .profile-form input {
+            padding: 9px;
+            border: 1px solid #ddd;
+            border-radius: 5px;
+            font-size: 14px;
+        }
         
         /* Search Form */
         .search-form { 
@@ -597,6 +4838,11 @@ home_template = """
             color: #721c24;
             border: 1px solid #f5c6cb;
         }
+        .status.warming { 
+            background: #fff3cd;
+            color: #856404;
+            border: 1px solid #ffeeba;
+        }
         .status a {
             color: inherit;
             text-decoration: underline;
@@ -608,10 +4854,24 @@ home_template = """
             padding: 20px;
         }
         .jobs-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            flex-wrap: wrap;
+            gap: 10px;
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 2px solid #e0e0e0;
         }
+        .export-link {
+            background: #555;
+            margin-left: 5px;
+        }
+        .jobs-header button {
+            border: none;
+            cursor: pointer;
+            font-size: 14px;
+        }
         .jobs-header h3 {
             color: #333;
             font-size: 20px;
@@ -670,6 +4930,71 @@ home_template = """
             font-size: 11px;
             white-space: nowrap;
         }
+        .job-details {
+            color: #555;
+            font-size: 13px;
+            margin-top: 4px;
+            font-weight: normal;
+        }
+        .inline-check {
+            display: flex;
+            align-items: center;
+            gap: 6px;
+            font-weight: 500;
+            color: #333;
+        }
+        .search-form .inline-check input {
+            width: auto;
+        }
+        .crawl-options {
+            display: flex;
+            gap: 10px;
+        }
+        .crawl-run {
+            border-top: 1px solid #e0e0e0;
+            margin-top: 12px;
+            padding-top: 10px;
+            font-size: 14px;
+            color: #333;
+        }
+        .crawl-running { color: #0a66c2; font-weight: 600; }
+        .stats-panel { font-size: 14px; color: #333; }
+        .stats-row { display: flex; flex-wrap: wrap; gap: 20px; margin: 10px 0; }
+        .stats-row span { display: block; font-size: 22px; font-weight: 600; color: #0a66c2; }
+        .stats-days { display: flex; gap: 8px; overflow-x: auto; font-size: 12px; color: #666; text-align: center; }
+        .stats-days b { color: #333; }
+        .stats-link { font-size: 13px; color: #0a66c2; text-decoration: none; }
+        .crawl-interrupted { color: #d97706; font-weight: 600; }
+        .crawl-done { color: #10b981; font-weight: 600; }
+        .crawl-actions {
+            display: flex;
+            align-items: center;
+            gap: 15px;
+            margin-top: 6px;
+        }
+        .crawl-actions a { color: #0a66c2; text-decoration: none; }
+        .search-form .crawl-actions button {
+            width: auto;
+            margin-top: 0;
+            padding: 6px 12px;
+            font-size: 13px;
+        }
+        .new-tag {
+            background: #f59e0b;
+            color: white;
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 11px;
+            white-space: nowrap;
+        }
+        .match-tag {
+            background: #7c3aed;
+            color: white;
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 11px;
+            white-space: nowrap;
+        }
         .keyword-tag {
             background: #e0e0e0;
             color: #333;
@@ -781,7 +5106,18 @@ home_template = """
         <div class="header">
             <h2>🚀 Job Search Dashboard</h2>
             <div class="header-buttons">
+                <form action='/profiles' method='post' class='profile-form'>
+                    <select name='profile' onchange='this.form.submit()' title='Active profile'>
+                        {% for p in profiles %}
+                        <option value='{{p}}' {% if p == profile %}selected{% endif %}>👤 {{p}}</option>
+                        {% endfor %}
+                    </select>
+                    <input name='new_profile' placeholder='New profile' size='12'>
+                </form>
                 <a href='/close-browser' class='close-browser' onclick="return confirm('Close browser session?')">🔴 Close Browser</a>
+                <form action='/history' method='get' class='profile-form'>
+                    <input name='q' placeholder='🗂️ Search history' size='16'>
+                </form>
                 <a href='/settings' class='settings-link'>⚙️ Settings</a>
             </div>
         </div>
@@ -810,35 +5146,143 @@ home_template = """
         <div class="status {{ 'success' if 'success' in status.lower() or '✅' in status else 'error' }}">{{ status }}</div>
         {% endif %}
         
+        {% for alert in selector_alerts %}
+        <div class="status error">
+            🚨 <strong>Page layout changed?</strong> Selectors for {{ alert }} recently. See <a href="/selectors">/selectors</a> and update <code>selectors.json</code>.
+        </div>
+        {% endfor %}
+        
+        {% if warming %}
+        <div class="status warming" id="warmup">
+            🔥 <strong>Warming up:</strong> launching the browser and restoring logins. Searches will be instant once this message disappears.
+        </div>
+        <script>
+            (function poll() {
+                fetch('/ready').then(function (r) { return r.json(); }).then(function (d) {
+                    if (d.state === 'warming') { setTimeout(poll, 2000); }
+                    else { document.getElementById('warmup').remove(); }
+                }).catch(function () { setTimeout(poll, 5000); });
+            })();
+        </script>
+        {% endif %}
+        
         <div class="search-form">
             <form action='/fetch' method='post'>
                 <div class="form-group">
                     <label>Platform:</label>
                     <select name='platform' required>
                         <option value='all'>All Platforms</option>
-                        <option value='linkedin'>LinkedIn</option>
-                        <option value='naukri'>Naukri</option>
+                        {% for key, name in platform_names.items() %}
+                        <option value='{{ key }}'>{{ name }}</option>
+                        {% endfor %}
                     </select>
                 </div>
                 
                 <div class="form-group">
-                    <label>Keyword:</label>
-                    <input name='keyword' value='{{keyword}}' required placeholder="e.g., MIS Executive">
+                    <label>Keyword (separate several with ;):</label>
+                    <input name='keyword' value='{{keyword}}' required placeholder="e.g., MIS Executive; Business Analyst">
                 </div>
                 
                 <div class="form-group">
                     <label>Location:</label>
                     <input name='location' value='{{location}}' required placeholder="e.g., India">
                 </div>
-                
-                <button type='submit'>🔍 Search Jobs</button>
-            </form>
+                
+                <div class="form-group">
+                    <label class="inline-check">
+                        <input type='checkbox' name='enrich' value='1'>
+                        Fetch job details (company, experience, salary...)
+                    </label>
+                    <label class="inline-check">
+                        <input type='checkbox' name='incremental' value='1'>
+                        Only new jobs since last search
+                    </label>
+                </div>
+                
+                <div class="form-group">
+                    <label>Time limit (seconds, 0 for none):</label>
+                    <input type='number' name='deadline' value='{{ deadline }}' min='0' max='{{ max_deadline }}'>
+                </div>
+                
+                <button type='submit'>🔍 Search Jobs</button>
+            </form>
+        </div>
+        
+        <div class="search-form">
+            <form action='/crawls' method='post'>
+                <div class="form-group">
+                    <label>Batch crawl keywords (separate with ;):</label>
+                    <input name='keywords' value='{{ all_keywords }}' required>
+                </div>
+                <div class="form-group">
+                    <label>Platform and pages per keyword:</label>
+                    <div class="crawl-options">
+                        <select name='platform'>
+                            <option value='all'>All Platforms</option>
+                            {% for key, name in platform_names.items() %}
+                            <option value='{{ key }}'>{{ name }}</option>
+                            {% endfor %}
+                        </select>
+                        <input type='number' name='pages' value='3' min='1' max='{{ crawl_max_pages }}'>
+                    </div>
+                </div>
+                <input type='hidden' name='location' value='{{ location }}'>
+                <button type='submit'>🕸️ Start Batch Crawl</button>
+            </form>
+            {% for c in crawls %}
+            <div class="crawl-run">
+                <strong>#{{ c.id }}</strong> {{ c.keywords }} ·
+                <span class="crawl-{{ c.state }}">{{ c.state }}</span> ·
+                {{ c.units_done }}/{{ c.units }} pages · {{ c.jobs }} jobs
+                {% if c.reason and c.state == 'interrupted' %}<div class="job-details">{{ c.reason }}</div>{% endif %}
+                <div class="crawl-actions">
+                    <a href='/crawls/{{ c.id }}'>📄 View results</a>
+                    {% if c.state == 'interrupted' %}
+                    <form action='/crawls/{{ c.id }}/resume' method='post'>
+                        <button type='submit' class='table-apply-btn'>▶️ Resume</button>
+                    </form>
+                    {% endif %}
+                </div>
+            </div>
+            {% endfor %}
+        </div>
+        
+        {% if stats and (stats.window.scanned or stats.window.applications) %}
+        <div class="search-form stats-panel">
+            <strong>📈 Last 7 days</strong>
+            <div class="stats-row">
+                <div><span>{{ stats.window.found }}</span>jobs found</div>
+                {% for name, p in stats.window.platforms.items() %}
+                <div><span>{{ '%d%%' % (p.match_rate * 100) if p.match_rate is not none else '–' }}</span>{{ platform_names.get(name, name.title()) }} title match</div>
+                {% endfor %}
+                {% if stats.window.platforms.linkedin and stats.window.platforms.linkedin.easy_apply_share is not none %}
+                <div><span>{{ '%d%%' % (stats.window.platforms.linkedin.easy_apply_share * 100) }}</span>Easy Apply</div>
+                {% endif %}
+                <div><span>{{ stats.window.applications.get('applied', 0) }}</span>applied</div>
+            </div>
+            <div class="stats-days">
+                {% for day, d in stats.daily.items() %}
+                <div title="{{ day }}: {{ d.found.values()|sum }} jobs, {{ d.applications.values()|sum }} applications">
+                    {{ day[5:] }}<br><b>{{ d.found.values()|sum }}</b> / {{ d.applications.get('applied', 0) }}
+                </div>
+                {% endfor %}
+            </div>
+            <a href='/analytics' class='stats-link'>All stats (JSON)</a>
         </div>
+        {% endif %}
         
         {% if jobs %}
         <div class="jobs-section">
             <div class="jobs-header">
                 <h3>Found {{ jobs|length }} Jobs</h3>
+                <form action='/enrich' method='post'>
+                    <button type='submit' class='table-apply-btn'>📄 Load Job Details</button>
+                    <a class='table-apply-btn export-link' href='/export/results.csv'>⬇️ Export CSV</a>
+                </form>
+                <form action='/apply/queue' method='post' id='apply-form'>
+                    <button type='submit' class='table-apply-btn'>⚡ Easy Apply to Selected</button>
+                    <a class='table-apply-btn export-link' href='/apply'>📋 Apply Queue</a>
+                </form>
             </div>
             
             <!-- Mobile Card View -->
@@ -848,12 +5292,23 @@ home_template = """
                     <div class="job-card-header">
                         <div class="job-title">
                             <a href="{{j.url}}" target="_blank">{{j.title}}</a>
+                            {% if j.get('company') or j.get('experience') or j.get('salary') or j.get('posted') or j.get('applicants') %}
+                            <div class="job-details">
+                                {{ [j.get('company'), j.get('experience'), j.get('salary'), j.get('posted'), (j.get('applicants') ~ ' applicants') if j.get('applicants')]|select|join(' · ') }}
+                            </div>
+                            {% endif %}
                         </div>
                     </div>
                     <div class="job-meta">
                         <span class="platform-badge badge-{{ j.platform.lower() }}">{{ j.platform }}</span>
-                        {% if j.get('easy_apply') %}
-                        <span class="easy-apply-tag">Easy Apply</span>
+                        {% if j.get('easy_apply') or (j.get('easy_apply') is none and j.platform == 'LinkedIn') %}
+                        <label class="easy-apply-tag"><input type='checkbox' name='job_id' value='{{ j.job_id }}' form='apply-form'> Easy Apply{% if j.get('easy_apply') is none %}?{% endif %}</label>
+                        {% endif %}
+                        {% if j.get('is_new') %}
+                        <span class="new-tag">New</span>
+                        {% endif %}
+                        {% if j.get('score') is not none %}
+                        <span class="match-tag">{{ (j.score * 100)|round|int }}% match</span>
                         {% endif %}
                         <span class="keyword-tag">{{j.keyword}}</span>
                     </div>
@@ -875,11 +5330,24 @@ home_template = """
                     <tr>
                         <td>
                             <span class="platform-badge badge-{{ j.platform.lower() }}">{{ j.platform }}</span>
-                            {% if j.get('easy_apply') %}
-                            <span class="easy-apply-tag">Easy Apply</span>
+                            {% if j.get('easy_apply') or (j.get('easy_apply') is none and j.platform == 'LinkedIn') %}
+                            <label class="easy-apply-tag"><input type='checkbox' name='job_id' value='{{ j.job_id }}' form='apply-form'> Easy Apply{% if j.get('easy_apply') is none %}?{% endif %}</label>
+                            {% endif %}
+                            {% if j.get('is_new') %}
+                            <span class="new-tag">New</span>
+                            {% endif %}
+                            {% if j.get('score') is not none %}
+                            <span class="match-tag">{{ (j.score * 100)|round|int }}% match</span>
+                            {% endif %}
+                        </td>
+                        <td>
+                            <a href="{{j.url}}" target="_blank">{{j.title}}</a>
+                            {% if j.get('company') or j.get('experience') or j.get('salary') or j.get('posted') or j.get('applicants') %}
+                            <div class="job-details">
+                                {{ [j.get('company'), j.get('experience'), j.get('salary'), j.get('posted'), (j.get('applicants') ~ ' applicants') if j.get('applicants')]|select|join(' · ') }}
+                            </div>
                             {% endif %}
                         </td>
-                        <td><a href="{{j.url}}" target="_blank">{{j.title}}</a></td>
                         <td>{{j.keyword}}</td>
                         <td>
                             <a class="table-apply-btn" href='{{j.url}}' target='_blank'>📝 Apply</a>
@@ -1079,7 +5547,7 @@ settings_template = r"""
 </head>
 <body>
     <div class="container">
-        <h2>⚙️ Settings</h2>
+        <h2>⚙️ Settings <small>Profile: {{ profile }}</small></h2>
         <a href="/" class="back-link">← Back to Dashboard</a>
         
         {% if status %}
@@ -1124,7 +5592,19 @@ settings_template = r"""
             <textarea name='APPLY_TITLE_KEYWORDS' placeholder="MIS;Business Analyst">{{ s["APPLY_TITLE_KEYWORDS"] }}</textarea>
             <small>Only show jobs with titles containing these keywords. Leave empty to show all.</small>
             
+            <label class="checkbox-label">
+                <input type='checkbox' name='PREFETCH' value='true' {% if s.get("PREFETCH") %}checked{% endif %}>
+                Keep results for these keywords ready in the background
+            </label>
+            
+            <label>Background searches per hour:</label>
+            <input type="number" name='PREFETCH_BUDGET' min="0" value='{{ s.get("PREFETCH_BUDGET", 12) }}'>
+            <small>Most used keywords are refreshed first; results stay ready for 20 minutes.</small>
+            
             <h3>🌐 Chrome Settings</h3>
+            {% if profile != 'default' %}
+            <div class="info">ℹ️ All profiles share one browser: headless mode, Chrome path and remote debugging are taken from the default profile.</div>
+            {% endif %}
             <label class="checkbox-label">
                 <input type='checkbox' name='USE_CHROME_PROFILE' value='true' {% if s.get("USE_CHROME_PROFILE") %}checked{% endif %}>
                 Use existing Chrome profile (stay logged in)
@@ -1146,6 +5626,16 @@ settings_template = r"""
                 Run browser in headless mode (invisible)
             </label>
             
+            <label class="checkbox-label">
+                <input type='checkbox' name='PREWARM_BROWSER' value='true' {% if s.get("PREWARM_BROWSER") %}checked{% endif %}>
+                Prewarm browser and restore logins at startup
+            </label>
+            
+            <label class="checkbox-label">
+                <input type='checkbox' name='HTTP_FETCH' value='true' {% if s.get("HTTP_FETCH") %}checked{% endif %}>
+                Fast search: read results over HTTP without rendering pages (falls back to the browser)
+            </label>
+            
             <button type='submit'>💾 Save Settings</button>
         </form>
     </div>
@@ -1153,32 +5643,426 @@ settings_template = r"""
 </html>
 """
 
+history_template = """
+<!doctype html>
+<html>
+<head>
+    <meta charset='utf-8'>
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>Job History - Job Search Dashboard</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { 
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
+            background: #f5f5f5;
+            padding: 10px;
+        }
+        .container {
+            max-width: 1100px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            padding: 20px;
+        }
+        h2 { color: #0a66c2; margin-bottom: 15px; font-size: 24px; }
+        .back-link { 
+            display: inline-block;
+            margin: 0 0 20px;
+            color: #0a66c2;
+            text-decoration: none;
+            font-weight: 500;
+        }
+        form { display: flex; gap: 10px; flex-wrap: wrap; margin-bottom: 20px; }
+        form input, form select {
+            flex: 1;
+            min-width: 140px;
+            padding: 10px;
+            border: 1px solid #ddd;
+            border-radius: 5px;
+            font-size: 14px;
+        }
+        form button {
+            padding: 10px 20px;
+            background: #0a66c2;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            cursor: pointer;
+            font-weight: 600;
+        }
+        .facets { display: flex; gap: 20px; flex-wrap: wrap; margin-bottom: 15px; font-size: 13px; color: #555; }
+        .facets a { color: #0a66c2; text-decoration: none; margin-right: 8px; }
+        .facets a.active { font-weight: bold; text-decoration: underline; }
+        .summary { color: #666; font-size: 13px; margin-bottom: 15px; }
+        .result { border-bottom: 1px solid #e0e0e0; padding: 12px 0; }
+        .result-title a { color: #0a66c2; text-decoration: none; font-weight: 600; font-size: 16px; }
+        .result-meta { color: #555; font-size: 13px; margin: 4px 0; }
+        .result-snippet { color: #333; font-size: 14px; line-height: 1.4; }
+        mark { background: #fff3a3; padding: 0 1px; }
+        .pager { margin-top: 20px; display: flex; gap: 10px; }
+        .pager a { color: #0a66c2; text-decoration: none; font-weight: 500; }
+        .empty-state { text-align: center; padding: 40px 20px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h2>🗂️ Job History</h2>
+        <a href="/" class="back-link">← Back to Dashboard</a>
+        <a href="{{ url_for('export', dataset='history', fmt='csv', since=since, until=until, platform=platform) }}" class="back-link">⬇️ Export history (CSV)</a>
+        <a href="{{ url_for('export', dataset='applications', fmt='csv', since=since, until=until, platform=platform) }}" class="back-link">⬇️ Export applications (CSV)</a>
+        
+        <form method='get' action='/history'>
+            <input name='q' value='{{ q }}' placeholder='e.g. power bi, "business analyst", analy*' autofocus>
+            <input type='date' name='since' value='{{ since }}' title='First seen on or after'>
+            <input type='date' name='until' value='{{ until }}' title='First seen before'>
+            <input type='hidden' name='platform' value='{{ platform }}'>
+            <button type='submit'>🔍 Search</button>
+        </form>
+        
+        {% if result %}
+        <div class="facets">
+            <div>
+                <strong>Platform:</strong>
+                <a href="{{ url_for('history', q=q, since=since, until=until) }}" class="{{ '' if platform else 'active' }}">All</a>
+                {% for name, count in result.facets.platform.items() %}
+                <a href="{{ url_for('history', q=q, since=since, until=until, platform=name) }}" class="{{ 'active' if name == platform else '' }}">{{ name }} ({{ count }})</a>
+                {% endfor %}
+            </div>
+            <div>
+                <strong>First seen:</strong>
+                {% for month, count in result.facets.month.items() %}
+                <span>{{ month }} ({{ count }})</span>
+                {% endfor %}
+            </div>
+        </div>
+        <div class="summary">
+            {{ result.total }}{% if result.approximate %}+{% endif %} matches in {{ result.took_ms }} ms
+            {% if result.approximate %}(showing the most recent matches, refine the search to see older ones)
+            {% elif result.ranked < result.total %}(only the best of the newest {{ result.ranked }} are listed, refine the search to see the rest){% endif %}
+        </div>
+        
+        {% for r in result.results %}
+        <div class="result">
+            <div class="result-title"><a href="{{ r.url }}" target="_blank">{{ highlight(r.title) }}</a></div>
+            <div class="result-meta">
+                {{ r.platform }}{% if r.company %} · {{ highlight(r.company) }}{% endif %}
+                · first seen {{ r.first_seen|datetime }} · searched as "{{ r.keyword }}"
+            </div>
+            {% if r.snippet %}
+            <div class="result-snippet">{{ highlight(r.snippet) }}</div>
+            {% endif %}
+        </div>
+        {% else %}
+        <div class="empty-state">No matching jobs in your history</div>
+        {% endfor %}
+        
+        <div class="pager">
+            {% if page > 1 %}
+            <a href="{{ url_for('history', q=q, since=since, until=until, platform=platform, page=page - 1) }}">← Previous</a>
+            {% endif %}
+            {% if page * page_size < result.ranked %}
+            <a href="{{ url_for('history', q=q, since=since, until=until, platform=platform, page=page + 1) }}">Next →</a>
+            {% endif %}
+        </div>
+        {% endif %}
+    </div>
+</body>
+</html>
+"""
+
+apply_template = """
+<!doctype html>
+<html>
+<head>
+    <meta charset='utf-8'>
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>Apply Queue - Job Search Dashboard</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { 
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
+            background: #f5f5f5;
+            padding: 10px;
+        }
+        .container {
+            max-width: 1100px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            padding: 20px;
+        }
+        h2 { color: #0a66c2; margin-bottom: 15px; font-size: 24px; }
+        .back-link { 
+            display: inline-block;
+            margin: 0 0 20px;
+            color: #0a66c2;
+            text-decoration: none;
+            font-weight: 500;
+        }
+        .stats { display: flex; gap: 20px; flex-wrap: wrap; margin-bottom: 15px; font-size: 13px; color: #555; }
+        .stats strong { color: #333; }
+        .summary { color: #666; font-size: 13px; margin-bottom: 15px; }
+        table { width: 100%; border-collapse: collapse; font-size: 14px; }
+        th, td { text-align: left; padding: 8px; border-bottom: 1px solid #e0e0e0; vertical-align: top; }
+        th { background: #f8f9fa; color: #333; }
+        td a { color: #0a66c2; text-decoration: none; }
+        .state { font-weight: 600; }
+        .state-applied { color: #10b981; }
+        .state-failed, .state-needs_input { color: #dc2626; }
+        .state-uncertain { color: #d97706; }
+        .reason { color: #666; font-size: 12px; }
+        td form button {
+            padding: 4px 10px;
+            background: #0a66c2;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            cursor: pointer;
+            font-size: 12px;
+        }
+        .empty-state { text-align: center; padding: 40px 20px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h2>📋 Easy Apply Queue</h2>
+        <a href="/" class="back-link">← Back to Dashboard</a>
+        
+        <div class="stats">
+            {% for state, count in stats.counts.items() %}
+            <div><strong>{{ state.replace('_', ' ').title() }}:</strong> {{ count }}</div>
+            {% endfor %}
+        </div>
+        <div class="summary">
+            {% if stats.avg_seconds %}Last 24h: {{ stats.avg_seconds }}s per application, {{ stats.applied_per_hour }} applications/hour.{% endif %}
+            {% for r in stats.failure_reasons %}
+            <div>{{ r.jobs }} × {{ r.reason or 'Unknown error' }}</div>
+            {% endfor %}
+        </div>
+        
+        {% if items %}
+        <table>
+            <tr>
+                <th>Job</th>
+                <th>State</th>
+                <th>Time</th>
+                <th></th>
+            </tr>
+            {% for i in items %}
+            <tr>
+                <td><a href="{{ i.url }}" target="_blank">{{ i.title }}</a><div class="reason">{{ i.keyword }}</div></td>
+                <td>
+                    <span class="state state-{{ i.state }}">{{ i.state.replace('_', ' ') }}</span>
+                    {% if i.reason %}<div class="reason">{{ i.reason }}</div>{% endif %}
+                </td>
+                <td>{% if i.duration is not none %}{{ '%.0f'|format(i.duration) }}s{% endif %}</td>
+                <td>
+                    {% if i.state in ('failed', 'needs_input', 'uncertain') %}
+                    <form action='/apply/retry' method='post'>
+                        <input type='hidden' name='id' value='{{ i.id }}'>
+                        <button type='submit'>↻ Retry</button>
+                    </form>
+                    {% endif %}
+                </td>
+            </tr>
+            {% endfor %}
+        </table>
+        {% else %}
+        <div class="empty-state">Nothing queued. Tick Easy Apply jobs on the dashboard to apply to them here.</div>
+        {% endif %}
+    </div>
+</body>
+</html>
+"""
+
+traces_template = """
+<!doctype html>
+<html>
+<head>
+    <meta charset='utf-8'>
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>Search Profiles - Job Search Dashboard</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { 
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
+            background: #f5f5f5;
+            padding: 10px;
+        }
+        .container {
+            max-width: 1100px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            padding: 20px;
+        }
+        h2 { color: #0a66c2; margin-bottom: 15px; font-size: 24px; }
+        .back-link { 
+            display: inline-block;
+            margin: 0 0 20px;
+            color: #0a66c2;
+            text-decoration: none;
+            font-weight: 500;
+        }
+        .summary { color: #666; font-size: 13px; margin-bottom: 15px; line-height: 1.5; }
+        .meta { color: #666; font-size: 12px; }
+        code { background: #f0f0f0; padding: 1px 4px; border-radius: 3px; }
+        table { width: 100%; border-collapse: collapse; font-size: 14px; }
+        th, td { text-align: left; padding: 8px; border-bottom: 1px solid #e0e0e0; vertical-align: top; }
+        th { background: #f8f9fa; color: #333; }
+        td a { color: #0a66c2; text-decoration: none; }
+        tr:target { background: #fff8e1; }
+        .error { color: #dc2626; font-size: 12px; }
+        .empty-state { text-align: center; padding: 40px 20px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h2>🔬 Search Profiles</h2>
+        <a href="/" class="back-link">← Back to Dashboard</a>
+        
+        <div class="summary">
+            Add <code>perf=1</code> to a search (the <code>/fetch</code> form or <code>/api/search</code>) to profile it.
+            {% if sample_rate %}{{ '%g' % (sample_rate * 100) }}% of other searches are profiled at random.{% endif %}
+            The newest {{ keep }} profiles are kept, up to {{ max_mb }} MB.
+            Open a trace with <code>playwright show-trace trace.zip</code> or at trace.playwright.dev.
+        </div>
+        
+        {% if captures %}
+        <table>
+            <tr><th>When</th><th>Search</th><th>Time</th><th>Jobs</th><th>Files</th></tr>
+            {% for c in captures %}
+            <tr id="{{ c.id }}">
+                <td>{{ c.created|datetime }}<div class="meta">{{ c.reason }}</div></td>
+                <td>{{ c.keyword }} · {{ c.location }} · {{ c.platform }}<div class="meta">{{ c.profile }}</div>
+                    {% if c.error %}<div class="error">{{ c.error }}</div>{% endif %}</td>
+                <td>{{ c.elapsed }}s</td>
+                <td>{{ c.get('jobs', '–') }}{% if c.partial %} (partial){% endif %}</td>
+                <td>
+                    {% for name, size in c.files.items() %}
+                    <div><a href="{{ url_for('admin_trace_file', capture_id=c.id, filename=name) }}">{{ name }}</a>
+                    <span class="meta">{{ (size / 1024)|round(1) }} KB</span></div>
+                    {% endfor %}
+                </td>
+            </tr>
+            {% endfor %}
+        </table>
+        {% else %}
+        <div class="empty-state">No search profiles yet.</div>
+        {% endif %}
+    </div>
+</body>
+</html>
+"""
+
 @app.route("/")
 def index():
+    profile = current_profile()
     # Reload settings to get latest credentials
-    reload_settings()
+    profile.reload()
     
     status = request.args.get("status", "")
-    keyword = KEYWORDS[0] if KEYWORDS else ""
+    keyword = profile.keywords[0] if profile.keywords else ""
     
     # Check which platforms are configured
-    linkedin_configured = bool(LINKEDIN_EMAIL and LINKEDIN_PASSWORD)
-    naukri_configured = bool(NAUKRI_EMAIL and NAUKRI_PASSWORD)
+    linkedin_configured = profile.linkedin_configured
+    naukri_configured = profile.naukri_configured
+    
+    log.debug(f"🔍 [{profile.name}] Checking credentials - LinkedIn: {linkedin_configured}, Naukri: {naukri_configured}",
+              stage="index", profile=profile.name, linkedin=linkedin_configured, naukri=naukri_configured)
     
-    print(f"🔍 Checking credentials - LinkedIn: {linkedin_configured}, Naukri: {naukri_configured}")
+    jobs = profile.jobs
+    rank_jobs(profile, jobs)
     
     return render_template_string(
         home_template,
-        jobs=jobs_cache,
+        jobs=jobs,
         keyword=keyword,
-        location=LOCATION,
+        location=profile.location,
         status=status,
         linkedin_configured=linkedin_configured,
-        naukri_configured=naukri_configured
+        naukri_configured=naukri_configured,
+        profile=profile.name,
+        profiles=list_profiles(),
+        warming=browser_host.readiness['state'] == 'warming',
+        all_keywords=";".join(profile.keywords),
+        crawls=crawl_store.runs(profile.name, limit=5),
+        crawl_max_pages=CRAWL_MAX_PAGES,
+        deadline=DEFAULT_SEARCH_DEADLINE,
+        max_deadline=MAX_SEARCH_DEADLINE,
+        selector_alerts=selector_registry.active_alerts(),
+        stats=dashboard_stats(),
+        platform_names=PLATFORM_NAMES
     )
 
+def dashboard_stats():
+    """Last 7 days for the dashboard panel; None if the stats can't be read"""
+    try:
+        return analytics.summary(days=7)
+    except sqlite3.Error:
+        return None
+
+def search_jobs(profile, platform, keyword, location, incremental=False, deadline=None):
+    """Run one search for ``profile`` (runs on the browser thread).
+
+    Several keywords can be given separated by ``;``. Regular searches run
+    every keyword and platform in parallel tabs (see ``parallel_search``);
+    incremental ones page through each query in turn. With a ``deadline``
+    each platform gets a fair share of the remaining budget (time one leaves
+    unused carries over to the next), so a platform that hangs can't cost
+    the results of the other.
+    """
+    deadline = deadline or Deadline()
+    keywords = [k.strip() for k in keyword.split(";") if k.strip()]
+    adapters = platform_adapters(profile, platform, warn=True)
+    
+    jobs = []
+    if not incremental:
+        queries = [(adapter.key, kw, location, 0) for kw in keywords for adapter in adapters]
+        for (name, kw, _, _), (found, seen, error, cached) in zip(queries, parallel_search(profile, queries, deadline)):
+            if error:
+                log.warning(f"⚠️ {PLATFORM_NAMES[name]} '{kw}': {error}", stage="search", platform=PLATFORM_NAMES[name], query=kw,
+                            profile=profile.name)
+                deadline.mark_failed(f"{PLATFORM_NAMES[name]} '{kw}': {error}")
+            # A reused page was counted when it was first read
+            if not cached:
+                job_history.record(found)
+                analytics.record_search(name, kw, found, len(seen))
+            jobs.extend(found)
+        return jobs
+    
+    searches = [(adapter, kw) for adapter in adapters for kw in keywords]
+    for i, (adapter, kw) in enumerate(searches):
+        share = deadline.split(len(searches) - i)
+        page = ensure_logged_in(profile, adapter.key, share)
+        if page:
+            jobs.extend(incremental_search(profile, adapter, page, kw, location, share))
+        elif share.expired:
+            share.mark_partial()
+            log.warning(f"⏱️ Deadline reached before {adapter.name} could be searched", stage="search", platform=adapter.name,
+                        query=kw, profile=profile.name)
+        else:
+            share.mark_failed(f"{adapter.name} '{kw}': login failed")
+    return jobs
+
+def parse_flag(value):
+    """Form, query or JSON value as a boolean ("1", "true", "yes", "on" or true)"""
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+def search_deadline(value):
+    """Deadline for a search from a form or API value in seconds (0 means no limit)"""
+    try:
+        seconds = float(value) if value not in (None, "") else DEFAULT_SEARCH_DEADLINE
+    except (TypeError, ValueError):
+        seconds = DEFAULT_SEARCH_DEADLINE
+    return Deadline(min(seconds, MAX_SEARCH_DEADLINE)) if seconds > 0 else Deadline()
+
 @app.route("/fetch", methods=["POST"])
 def fetch():
+    profile = current_profile()
     platform = request.form.get("platform", "all").strip().lower()
     keyword = request.form.get("keyword", "").strip()
     location = request.form.get("location", "").strip()
@@ -1186,38 +6070,322 @@ def fetch():
     if not keyword or not location:
         return redirect(url_for("index", status="❌ Please provide both keyword and location"))
     
-    global jobs_cache
-    jobs_cache = []
-    
     try:
-        if platform == "all" or platform == "linkedin":
-            if LINKEDIN_EMAIL and LINKEDIN_PASSWORD:
-                page = ensure_logged_in('linkedin')
-                if page:
-                    jobs_cache.extend(fetch_linkedin_jobs(page, keyword, location))
-            else:
-                print("⚠️ LinkedIn credentials not configured")
-        
-        if platform == "all" or platform == "naukri":
-            if NAUKRI_EMAIL and NAUKRI_PASSWORD:
-                page = ensure_logged_in('naukri')
-                if page:
-                    jobs_cache.extend(fetch_naukri_jobs(page, keyword, location))
+        incremental = bool(request.form.get("incremental"))
+        deadline = search_deadline(request.form.get("deadline"))
+        with search_profiles.capture(profiling_reason(request.values), profile, platform, keyword, location) as capture:
+            jobs = None if incremental or capture else search_prefetcher.serve(profile, platform, keyword, location)
+            if jobs is None:
+                found = (capture or search_coalescer).search(profile, platform, keyword, location, incremental, deadline)
+                jobs = result_store.put(profile.name, query_key(platform, keyword, location), found)
+                search_prefetcher.record_use(profile, platform, keyword, location,
+                                             fresh=not incremental and deadline.complete)
+                track_changes(profile, query_key(platform, keyword, location), found, not deadline.complete,
+                              platform=platform, keyword=keyword, location=location)
+                status = f"✅ Found {len(jobs)} jobs!" if jobs else "❌ No jobs found"
             else:
-                print("⚠️ Naukri credentials not configured")
-        
-        status = f"✅ Found {len(jobs_cache)} jobs!" if jobs_cache else "❌ No jobs found"
+                search_prefetcher.record_use(profile, platform, keyword, location)
+                age = search_prefetcher.age(profile, platform, keyword, location) or 0
+                status = f"✅ Found {len(jobs)} jobs! (updated {int(age // 60)} min ago)"
+            if incremental:
+                new_count = sum(1 for job in jobs if job.is_new)
+                status = f"✅ {new_count} new jobs since last search ({len(jobs)} total)"
+            if jobs and request.form.get("enrich"):
+                try:
+                    browser_host.wait_for(browser_host.submit("enrichment", enrich_jobs, profile, jobs, deadline=deadline),
+                                          deadline)
+                except DeadlineExceeded:
+                    pass
+            rank_jobs(profile, jobs)
+            if deadline.partial:
+                status = f"⏱️ Time limit reached: showing the {len(jobs)} jobs found so far"
+            elif deadline.errors:
+                status += f" (⚠️ {len(deadline.errors)} of the searches failed, see the log)"
         
     except Exception as e:
         status = f"❌ Error: {str(e)}"
-        jobs_cache = []
+        result_store.put(profile.name, query_key(platform, keyword, location), [])
+    
+    return redirect(url_for("index", status=status))
+
+@app.route("/api/search", methods=["GET", "POST"])
+def api_search():
+    """Run a search within a deadline; ``partial`` is set when time ran out first, ``errors`` lists failed queries"""
+    profile = current_profile()
+    params = request.get_json(silent=True) or request.values
+    platform = str(params.get("platform", "all")).strip().lower()
+    keyword = str(params.get("keyword", "")).strip()
+    location = str(params.get("location", "") or profile.location).strip()
+    if not keyword:
+        return jsonify({"error": "keyword is required"}), 400
+    
+    deadline = search_deadline(params.get("deadline"))
+    started = time.time()
+    with search_profiles.capture(profiling_reason(params, request.args), profile, platform, keyword, location) as capture:
+        found = (capture or search_coalescer).search(profile, platform, keyword, location,
+                                                     parse_flag(params.get("incremental")), deadline)
+        jobs = result_store.put(profile.name, query_key(platform, keyword, location), found)
+        track_changes(profile, query_key(platform, keyword, location), found, not deadline.complete,
+                      platform=platform, keyword=keyword, location=location)
+        rank_jobs(profile, jobs)
+    result = {
+        "profile": profile.name,
+        "partial": deadline.partial,
+        "errors": deadline.errors,
+        "elapsed": round(time.time() - started, 2),
+        "jobs": [job.to_dict() for job in jobs]
+    }
+    if capture is not None:
+        result["trace"] = url_for("admin_traces", _anchor=capture.id)
+    return jsonify(result)
+
+@app.route("/enrich", methods=["POST"])
+def enrich():
+    """Fetch detail pages for the current results"""
+    profile = current_profile()
+    jobs = profile.jobs
+    if not jobs:
+        return redirect(url_for("index", status="❌ No jobs to enrich"))
+    try:
+        fetched = browser_host.call_as("enrichment", enrich_jobs, profile, jobs)
+        rank_jobs(profile, jobs)
+        status = f"✅ Loaded details for {len(jobs)} jobs ({fetched} fetched, the rest cached or unavailable)"
+    except Exception as e:
+        status = f"❌ Error: {str(e)}"
+    return redirect(url_for("index", status=status))
+
+@app.route("/api/jobs")
+def api_jobs():
+    """Current results as JSON, most relevant first when a resume is set"""
+    profile = current_profile()
+    jobs = profile.jobs
+    ranked = rank_jobs(profile, jobs)
+    return jsonify({"profile": profile.name, "ranked": ranked, "jobs": [job.to_dict() for job in jobs]})
+
+def parse_date(value):
+    """``YYYY-MM-DD`` to a timestamp, or None"""
+    try:
+        return time.mktime(time.strptime(value, "%Y-%m-%d")) if value else None
+    except ValueError:
+        return None
+
+def history_query_args():
+    page = max(request.args.get("page", 1, type=int), 1)
+    return dict(
+        query=request.args.get("q", "").strip(),
+        platform=request.args.get("platform", "").strip() or None,
+        since=parse_date(request.args.get("since", "")),
+        until=parse_date(request.args.get("until", "")),
+        limit=HISTORY_PAGE_SIZE,
+        offset=(page - 1) * HISTORY_PAGE_SIZE
+    ), page
+
+@app.template_filter("datetime")
+def format_timestamp(value):
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(value))
+
+@app.route("/history")
+def history():
+    """Full-text search over every job ever scraped"""
+    args, page = history_query_args()
+    result = job_history.search(**args) if args["query"] else None
+    return render_template_string(
+        history_template,
+        result=result,
+        q=args["query"],
+        platform=args["platform"] or "",
+        since=request.args.get("since", ""),
+        until=request.args.get("until", ""),
+        page=page,
+        page_size=HISTORY_PAGE_SIZE,
+        highlight=highlight_html
+    )
+
+@app.route("/api/history")
+def api_history():
+    args, page = history_query_args()
+    result = job_history.search(**args)
+    for row in result["results"]:
+        for field in ("title", "company", "snippet"):
+            row[field] = str(highlight_html(row[field]))
+    return jsonify(result)
+
+@app.route("/export/<dataset>.<fmt>")
+def export(dataset, fmt):
+    """Stream results, job history or the application log as CSV, NDJSON or columnar batches"""
+    if fmt not in EXPORT_FORMATS or dataset not in EXPORT_FILTERS:
+        abort(404)
+    unsupported = [name for name in ("since", "until", "platform", "status")
+                   if request.args.get(name, "").strip() and name not in EXPORT_FILTERS[dataset]]
+    if unsupported:
+        return jsonify({"error": f"{dataset} can't be filtered by {', '.join(unsupported)}"}), 400
+    since = parse_date(request.args.get("since", ""))
+    until = parse_date(request.args.get("until", ""))
+    platform = request.args.get("platform", "").strip() or None
+    status = request.args.get("status", "").strip() or None
     
+    if dataset == "applications":
+        columns, rows = LOG_COLUMNS, iter_application_rows(since, until, platform, status)
+    elif dataset == "history":
+        columns, rows = HISTORY_COLUMNS, iter_history_rows(since, until, platform)
+    else:
+        columns, rows = RESULT_COLUMNS, iter_result_rows(current_profile(), platform)
+    
+    extension = "csv" if fmt == "csv" else "ndjson"
+    filename = f"{dataset}-{time.strftime('%Y%m%d-%H%M%S')}.{extension}"
+    return Response(
+        stream_with_context(encode_rows(fmt, columns, rows)),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+@app.route("/apply/queue", methods=["POST"])
+def queue_applications():
+    """Queue the selected Easy Apply jobs from the current results"""
+    profile = current_profile()
+    selected = set(request.form.getlist("job_id"))
+    jobs = [job for job in profile.jobs
+            # Unknown ones are checked on the job page when their turn comes
+            if job_key(job) in selected and job.get("easy_apply") is not False and job["platform"] == "LinkedIn"]
+    if not jobs:
+        return redirect(url_for("index", status="❌ Select at least one Easy Apply job"))
+    added = apply_queue.enqueue(profile, jobs)
+    return redirect(url_for("index", status=f"✅ Queued {added} Easy Apply jobs ({len(jobs) - added} already queued)"))
+
+@app.route("/apply")
+def apply_status():
+    profile = current_profile()
+    return render_template_string(apply_template, items=apply_queue.items(profile.name),
+                                  stats=apply_queue.stats(profile.name))
+
+@app.route("/api/apply")
+def api_apply():
+    profile = current_profile()
+    return jsonify({"profile": profile.name, "stats": apply_queue.stats(profile.name),
+                    "items": apply_queue.items(profile.name)})
+
+@app.route("/apply/retry", methods=["POST"])
+def retry_application():
+    apply_queue.retry(current_profile().name, request.form.get("id", type=int))
+    return redirect(url_for("apply_status"))
+
+@app.route("/crawls", methods=["POST"])
+def start_crawl():
+    """Crawl several keywords and pages in the background"""
+    profile = current_profile()
+    keywords = [k.strip() for k in request.form.get("keywords", "").split(";") if k.strip()]
+    location = request.form.get("location", "").strip() or profile.location
+    platform = request.form.get("platform", "all").strip().lower()
+    pages = min(max(request.form.get("pages", 1, type=int), 1), CRAWL_MAX_PAGES)
+    platforms = [adapter.key for adapter in platform_adapters(profile, platform)]
+    if not keywords or not platforms:
+        return redirect(url_for("index", status="❌ Provide keywords and configure the platform to crawl"))
+    run_id = crawl_store.create(profile, platforms, keywords, location, pages)
+    crawl_store.start(run_id)
+    return redirect(url_for("index", status=f"✅ Crawl #{run_id} started: {len(keywords)} keywords, {pages} pages each"))
+
+@app.route("/crawls/<int:run_id>/resume", methods=["POST"])
+def resume_crawl(run_id):
+    run = crawl_store.get(run_id)
+    if not run or run["profile"] != current_profile().name:
+        abort(404)
+    if run["state"] != "done" and crawl_store.start(run_id):
+        status = f"✅ Crawl #{run_id} resumed"
+    else:
+        status = f"❌ Crawl #{run_id} is already running or finished"
     return redirect(url_for("index", status=status))
 
+@app.route("/crawls/<int:run_id>")
+def crawl_results(run_id):
+    """Show a crawl's results so far as the current results"""
+    profile = current_profile()
+    run = crawl_store.get(run_id)
+    if not run or run["profile"] != profile.name:
+        abort(404)
+    jobs = result_store.put(profile.name, f"crawl:{run_id}", crawl_store.results(run_id))
+    rank_jobs(profile, jobs)
+    return redirect(url_for("index", status=f"✅ Crawl #{run_id} ({run['state']}): {len(jobs)} jobs"))
+
+@app.route("/api/crawls")
+def api_crawls():
+    profile = current_profile()
+    return jsonify({"profile": profile.name, "runs": crawl_store.runs(profile.name)})
+
+@app.route("/analytics")
+def analytics_stats():
+    """Search yield and applications from the rollup tables (``?days=`` for the daily window)"""
+    return jsonify(analytics.summary(request.args.get("days", ANALYTICS_DAYS, type=int)))
+
+@app.route("/selectors")
+def selectors_health():
+    """Match rate per role and hit rate/latency per selector strategy"""
+    return jsonify({"file": SELECTORS_FILE, "alerts": selector_registry.active_alerts(),
+                    "platforms": selector_registry.health()})
+
+@app.route("/browser/stats")
+def browser_stats():
+    """Latest supervisor sample: browser RSS and handles, per-context navigations and heap"""
+    if request.args.get("refresh") and browser_host.browser is not None:
+        return jsonify(browser_host.call(browser_supervisor.sample))
+    return jsonify(browser_supervisor.metrics)
+
+@app.route("/browser/queue")
+def browser_queue():
+    """Work waiting for the browser per priority class, with queue wait times and time shares"""
+    return jsonify({**browser_host.tasks.summary(), "running": [frame[0] for frame in browser_host.running]})
+
+@app.route("/admin/traces")
+def admin_traces():
+    """Saved search profiles and Playwright traces, newest first"""
+    return render_template_string(traces_template, captures=search_profiles.list(),
+                                  keep=search_profiles.keep, max_mb=TRACE_MAX_MB, sample_rate=PROFILE_SAMPLE_RATE)
+
+@app.route("/admin/traces/<capture_id>/<filename>")
+def admin_trace_file(capture_id, filename):
+    if filename not in ("trace.zip", "profile.pstats", "profile.txt") or secure_filename(capture_id) != capture_id:
+        abort(404)
+    return send_from_directory(os.path.abspath(os.path.join(search_profiles.directory, capture_id)), filename,
+                               as_attachment=filename != "profile.txt")
+
+@app.route("/api/notifications", methods=["GET"])
+def notifications_status():
+    """Pending (``new``) and claimed-but-unacknowledged (``cur``) notifications"""
+    return jsonify(notification_spool.counts())
+
+@app.route("/api/notifications/claim", methods=["POST"])
+def notifications_claim():
+    """Claim the oldest pending notifications; acknowledge them once delivered"""
+    limit = max(1, min(request.args.get("limit", NOTIFY_BATCH, type=int), 500))
+    messages = notification_spool.claim(limit)
+    return jsonify({"messages": messages, "summary": batch_summary(messages),
+                    "ack_within_s": NOTIFY_CLAIM_TIMEOUT})
+
+@app.route("/api/notifications/ack", methods=["POST"])
+def notifications_ack():
+    ids = (request.get_json(silent=True) or {}).get("ids") or request.form.getlist("id")
+    return jsonify({"acknowledged": notification_spool.ack(ids)})
+
+@app.route("/search/stats")
+def search_stats():
+    """Crawls run, searches that joined one already in flight, and prefetching"""
+    return jsonify({**search_coalescer.summary(), "prefetch": search_prefetcher.summary()})
+
+@app.route("/logs/stats")
+def logs_stats():
+    """Per-card / per-job messages left out by log sampling"""
+    return jsonify(log.summary())
+
+@app.route("/results/stats")
+def results_stats():
+    """Memory used by stored search results"""
+    return jsonify(result_store.memory_usage())
+
 @app.route("/settings", methods=["GET", "POST"])
 def settings_page():
+    profile = current_profile()
     if request.method == "POST":
-        current_settings = load_settings()
+        current_settings = load_settings(profile.name)
+        previous = dict(current_settings)
         
         current_settings["LINKEDIN_EMAIL"] = request.form.get("LINKEDIN_EMAIL", "").strip()
         current_settings["LINKEDIN_PASSWORD"] = request.form.get("LINKEDIN_PASSWORD", "").strip()
@@ -1231,54 +6399,112 @@ def settings_page():
         current_settings["CHROME_PROFILE_PATH"] = request.form.get("CHROME_PROFILE_PATH", "").strip()
         current_settings["CHROME_PATH"] = request.form.get("CHROME_PATH", "").strip()
         current_settings["USE_REMOTE_DEBUGGING"] = request.form.get("USE_REMOTE_DEBUGGING") == "true"
+        current_settings["PREWARM_BROWSER"] = request.form.get("PREWARM_BROWSER") == "true"
+        current_settings["HTTP_FETCH"] = request.form.get("HTTP_FETCH") == "true"
+        current_settings["PREFETCH"] = request.form.get("PREFETCH") == "true"
+        try:
+            current_settings["PREFETCH_BUDGET"] = max(0, int(request.form.get("PREFETCH_BUDGET") or DEFAULT_PREFETCH_BUDGET))
+        except ValueError:
+            current_settings["PREFETCH_BUDGET"] = DEFAULT_PREFETCH_BUDGET
         
         if 'resume' in request.files:
             file = request.files['resume']
             if file and file.filename and allowed_file(file.filename):
                 filename = secure_filename(file.filename)
-                file_path = os.path.join(UPLOAD_FOLDER, filename)
+                upload_dir = UPLOAD_FOLDER if profile.name == DEFAULT_PROFILE else os.path.join(UPLOAD_FOLDER, profile.name)
+                os.makedirs(upload_dir, exist_ok=True)
+                file_path = os.path.join(upload_dir, filename)
                 file.save(file_path)
                 current_settings["RESUME_PATH"] = file_path
         
-        save_settings(current_settings)
+        save_settings(current_settings, profile.name)
         
-        # Reload all settings globally
-        reload_settings()
+        # Reload this profile's settings
+        profile.reload()
+        search_prefetcher.forget(profile)
         
-        close_browser_session()
+        # Browser options come from the default profile, so changing them
+        # restarts the shared browser; anything else only drops this profile's context
+        if profile.name == DEFAULT_PROFILE and any(previous.get(key, DEFAULT_SETTINGS[key]) != current_settings[key]
+                                               for key in BROWSER_SETTINGS):
+            browser_host.restart()
+        else:
+            close_browser_session(profile.name)
         
-        print(f"✅ Settings saved - LinkedIn: {bool(LINKEDIN_EMAIL)}, Naukri: {bool(NAUKRI_EMAIL)}")
+        log.info(f"✅ Settings saved for '{profile.name}' - LinkedIn: {bool(profile.linkedin_email)}, Naukri: {bool(profile.naukri_email)}",
+                 stage="settings", profile=profile.name)
         
         return redirect(url_for("index", status="✅ Settings saved successfully!"))
     
-    s = load_settings()
+    s = load_settings(profile.name)
     status = request.args.get("status", "")
-    return render_template_string(settings_template, s=s, status=status)
+    return render_template_string(settings_template, s=s, status=status, profile=profile.name)
+
+@app.route("/profiles", methods=["POST"])
+def switch_profile():
+    """Switch to an existing profile or create a new one"""
+    name = request.form.get("new_profile", "").strip() or request.form.get("profile", "").strip()
+    if name not in list_profiles():
+        try:
+            create_profile(name)
+        except ValueError:
+            return redirect(url_for("index", status="❌ Profile names may only use letters, numbers, '-', '_' and '.'"))
+    session["profile"] = name
+    return redirect(url_for("index", status=f"✅ Switched to profile '{name}'"))
+
+@app.route("/ready")
+def ready():
+    """Readiness probe: 200 once the browser is warm, 503 while it isn't"""
+    readiness = dict(browser_host.readiness)
+    readiness['ready'] = readiness['state'] == 'ready'
+    return jsonify(readiness), (200 if readiness['ready'] else 503)
 
 @app.route("/close-browser")
 def close_browser():
-    """Manually close the browser session"""
-    close_browser_session()
+    """Manually close this profile's browser context"""
+    close_browser_session(current_profile().name)
     return redirect(url_for("index", status="✅ Browser session closed"))
 
 # ---------------- Main ----------------
 if __name__ == "__main__":
-    print("=" * 60)
-    print("🚀 Job Search Dashboard (LinkedIn & Naukri)")
-    print("=" * 60)
-    print("🌐 Starting server at http://127.0.0.1:5000")
-    print("💡 Supported platforms: LinkedIn, Naukri")
-    print("📱 Responsive design: Works on PC and Mobile")
-    print("=" * 60)
+    setup_logging()
+    log.info("=" * 60)
+    log.info("🚀 Job Search Dashboard (LinkedIn & Naukri)")
+    log.info("=" * 60)
+    log.info("🌐 Starting server at http://127.0.0.1:5000")
+    log.info(f"💡 Supported platforms: {', '.join(PLATFORM_NAMES.values())}")
+    log.info("📱 Responsive design: Works on PC and Mobile")
+    log.info(f"👤 Profiles: {', '.join(list_profiles())}")
+    log.info("=" * 60)
     
     #webbrowser.open("http://127.0.0.1:5000", new=2)
     
+    kill_orphaned_browsers()
+    if HAR_MODE == "record":
+        log.info(f"🎞️ HAR record mode: browser sessions are saved under {HAR_DIR}/ when the app stops", stage="har")
+    elif HAR_MODE == "replay":
+        log.info(f"🎞️ HAR replay mode: pages are served from {HAR_DIR}/, no network access", stage="har")
+    if prewarm_enabled():
+        log.info("🔥 Prewarming browser in the background...", stage="prewarm")
+        browser_host.prewarm()
+    threading.Thread(target=job_history.warm, name="history-warm", daemon=True).start()
+    threading.Thread(target=analytics.backfill, name="analytics-backfill", daemon=True).start()
+    apply_queue.resume()
+    crawl_store.resume()
+    if prefetch_enabled():
+        log.info("🔮 Prefetching configured searches in the background...", stage="prefetch")
+    search_prefetcher.start()
+    
     try:
         import os
         port = int(os.environ.get("PORT", 5000))
         app.run(debug=False, host='0.0.0.0', port=port, threaded=True)
         #app.run(debug=False, port=5000, threaded=True)
     except KeyboardInterrupt:
-        print("\n👋 Shutting down...")
+        log.info("👋 Shutting down...")
+    finally:
+        log_writer.close()
         close_browser_session()
-        print("✅ Browser closed. Bye!")
\ No newline at end of file
+        kill_orphaned_browsers(include_own=True)
+        log.info("✅ Browser closed. Bye!")
+        stop_logging()
@@ -0,0 +1,128 @@
+# bench_history.py
+# ===============================================
+# Latency check for the job history search
+# ===============================================
+#
+# Seeds a throwaway jobs.db with synthetic jobs and times JobHistory.search
+# (matching, filters, platform/month facets and ranking) against a budget:
+#
+#   python bench_history.py --rows 5000 --budget-ms 50
+#
+# Exits with status 1 when the p95 of any query is over budget, so it can
+# guard the target in CI. The real jobs.db is never touched.
+
+import argparse, json, os, random, sys, tempfile, time
+
+from Newupdated import JobHistory, HISTORY_PAGE_SIZE
+
+PLATFORMS = ["LinkedIn", "Naukri"]
+TITLES = ["Data Analyst", "Business Analyst", "MIS Executive", "Power BI Developer", "Financial Analyst",
+          "Operations Executive", "Reporting Analyst", "SQL Developer", "Excel Specialist", "Account Manager"]
+COMPANIES = ["Acme Analytics", "Globex", "Initech", "Umbrella Services", "Stark Consulting", "Wayne Retail"]
+WORDS = ["excel", "sql", "power", "bi", "dashboards", "reporting", "python", "stakeholders", "forecasting",
+         "vlookup", "pivot", "tables", "automation", "kpi", "tableau", "finance", "operations", "data"]
+
+# (name, search kwargs); the query strings use the same syntax as the /history box
+QUERIES = [
+    ("word", {"query": "analyst"}),
+    ("two words", {"query": "power bi"}),
+    ("phrase", {"query": '"business analyst"'}),
+    ("prefix", {"query": "analy*"}),
+    ("broad", {"query": "excel"}),
+    ("platform filter", {"query": "analyst", "platform": "Naukri"}),
+    ("date filter", {"query": "sql", "since": "recent"}),
+    ("second page", {"query": "excel", "offset": HISTORY_PAGE_SIZE}),
+]
+
+def seed(history, rows, days, rng):
+    """Record ``rows`` jobs spread over the last ``days`` days, oldest first"""
+    now = time.time()
+    batch, batch_size = [], 200
+    for i in range(rows):
+        title = rng.choice(TITLES)
+        platform = rng.choice(PLATFORMS)
+        batch.append({
+            "platform": platform,
+            "keyword": title,
+            "title": f"{title} {i}",
+            "company": rng.choice(COMPANIES),
+            "description": " ".join(rng.choices(WORDS, k=60)),
+            "url": f"https://example.com/{platform.lower()}/jobs/{i}",
+            "job_id": f"{platform.lower()}:{i}",
+        })
+        if len(batch) == batch_size or i == rows - 1:
+            history.record(batch, seen_at=now - days * 86400 * (1 - i / rows))
+            batch = []
+    return now
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (sorted or not)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+def run(args):
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as folder:
+        history = JobHistory(os.path.join(folder, "jobs.db"))
+        started = time.perf_counter()
+        now = seed(history, args.rows, args.days, rng)
+        seeded = time.perf_counter() - started
+        history.warm()
+
+        queries = []
+        for name, kwargs in QUERIES:
+            kwargs = dict(kwargs)
+            if kwargs.get("since") == "recent":
+                kwargs["since"] = now - args.days * 86400 / 4
+            history.search(**kwargs)
+            timings, result = [], None
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                result = history.search(**kwargs)
+                timings.append((time.perf_counter() - started) * 1000)
+            p95 = percentile(timings, 95)
+            queries.append({
+                "name": name,
+                "query": kwargs["query"],
+                "total": result["total"],
+                "p50_ms": round(percentile(timings, 50), 2),
+                "p95_ms": round(p95, 2),
+                "max_ms": round(max(timings), 2),
+                "ok": p95 <= args.budget_ms
+            })
+        history.connect().close()
+    return {"rows": args.rows, "seed_s": round(seeded, 2), "repeat": args.repeat, "budget_ms": args.budget_ms,
+            "ok": all(query["ok"] for query in queries), "queries": queries}
+
+def print_report(report):
+    print("=" * 60)
+    print(f"🗂️ History search over {report['rows']} jobs (seeded in {report['seed_s']}s), "
+          f"{report['repeat']} runs per query, budget {report['budget_ms']} ms at p95")
+    for query in report["queries"]:
+        mark = "✅" if query["ok"] else "❌"
+        print(f"   {mark} {query['name']:<16} {query['total']:>6} matches  "
+              f"p50 {query['p50_ms']} ms  p95 {query['p95_ms']} ms  max {query['max_ms']} ms")
+    print("=" * 60)
+
+def main():
+    parser = argparse.ArgumentParser(description="Time job history searches and facets against a latency budget")
+    parser.add_argument("--rows", type=int, default=5000, help="Synthetic jobs to seed")
+    parser.add_argument("--days", type=int, default=365, help="Spread first-seen dates over this many days")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per query")
+    parser.add_argument("--budget-ms", type=float, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    sys.exit(0 if report["ok"] else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# loadtest.py
+# ===============================================
+# Load test for the dashboard's /fetch endpoint
+# ===============================================
+#
+# Run the dashboard against recorded sites first so no real account is touched:
+#
+#   HAR_MODE=replay python Newupdated.py
+#   python loadtest.py --concurrency 4 --requests 40 --keyword "MIS Executive"
+#
+# Only search queries that were recorded can be replayed; anything else is
+# aborted by the replaying browser and shows up as "no jobs" or an error.
+
+import argparse, json, threading, time, random
+import urllib.request, urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlparse, parse_qs
+
+class NoRedirect(urllib.request.HTTPRedirectHandler):
+    """/fetch answers with a redirect carrying the status; we want that, not the page"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+opener = urllib.request.build_opener(NoRedirect)
+
+def fetch_once(base_url, form):
+    """POST one search; returns ``(latency_seconds, status_message, ok)``"""
+    data = urlencode(form).encode()
+    started = time.perf_counter()
+    try:
+        response = opener.open(f"{base_url}/fetch", data=data, timeout=900)
+        location = response.headers.get("Location", "")
+        code = response.status
+    except urllib.error.HTTPError as e:
+        location = e.headers.get("Location", "")
+        code = e.code
+    except Exception as e:
+        return time.perf_counter() - started, f"❌ Error: {e}", False
+    latency = time.perf_counter() - started
+    status = parse_qs(urlparse(location).query).get("status", [""])[0]
+    ok = code in (301, 302, 303) and not status.startswith("❌ Error")
+    return latency, status or f"HTTP {code}", ok
+
+def browser_stats(base_url):
+    try:
+        with urllib.request.urlopen(f"{base_url}/browser/stats?refresh=1", timeout=30) as response:
+            return json.load(response)
+    except Exception:
+        return {}
+
+class ResourceSampler:
+    """Polls /browser/stats during the run and keeps the peaks"""
+
+    def __init__(self, base_url, interval):
+        self.base_url = base_url
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.peak = {"rss_mb": 0, "handles": 0, "processes": 0, "pages": 0}
+        self.samples = 0
+        self.recycled = {}
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            stats = browser_stats(self.base_url)
+            if stats:
+                self.samples += 1
+                browser = stats.get("browser", {})
+                for key in ("rss_mb", "handles", "processes"):
+                    self.peak[key] = max(self.peak[key], browser.get(key) or 0)
+                pages = sum(c.get("pages", 0) for c in stats.get("contexts", {}).values())
+                self.peak["pages"] = max(self.peak["pages"], pages)
+                self.recycled = stats.get("recycled", self.recycled)
+            self.stop_event.wait(self.interval)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join(timeout=60)
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (sorted or not)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+def run(args):
+    keywords = args.keyword or ["MIS Executive"]
+    forms = []
+    for i in range(args.requests):
+        form = {"platform": args.platform, "keyword": keywords[i % len(keywords)],
+                "location": args.location, "deadline": args.deadline}
+        if args.profile:
+            form["profile"] = args.profile
+        forms.append(form)
+    if args.shuffle:
+        random.shuffle(forms)
+
+    sampler = ResourceSampler(args.base_url, args.sample_interval)
+    sampler.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(lambda form: fetch_once(args.base_url, form), forms))
+    elapsed = time.perf_counter() - started
+    sampler.stop()
+
+    latencies = [latency for latency, _, ok in results if ok]
+    errors = [status for _, status, ok in results if not ok]
+    report = {
+        "requests": len(results),
+        "concurrency": args.concurrency,
+        "ok": len(latencies),
+        "errors": len(errors),
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(len(results) / elapsed, 3) if elapsed else 0.0,
+        "latency_s": {
+            "p50": round(percentile(latencies, 50), 3),
+            "p90": round(percentile(latencies, 90), 3),
+            "p99": round(percentile(latencies, 99), 3),
+            "max": round(max(latencies), 3) if latencies else 0.0
+        },
+        "browser_peak": sampler.peak,
+        "browser_samples": sampler.samples,
+        "contexts_recycled": sampler.recycled,
+        "error_samples": sorted(set(errors))[:5]
+    }
+    return report
+
+def print_report(report):
+    print("=" * 60)
+    print(f"📊 {report['requests']} searches, {report['concurrency']} at a time, in {report['elapsed_s']}s")
+    print(f"   Throughput: {report['throughput_rps']} searches/s  ({report['ok']} ok, {report['errors']} failed)")
+    latency = report["latency_s"]
+    print(f"   Latency: p50 {latency['p50']}s  p90 {latency['p90']}s  p99 {latency['p99']}s  max {latency['max']}s")
+    peak = report["browser_peak"]
+    if report["browser_samples"]:
+        print(f"   Browser peak: {peak['rss_mb']} MB RSS, {peak['handles']} handles, "
+              f"{peak['processes']} processes, {peak['pages']} pages")
+    else:
+        print("   Browser: no /browser/stats samples (browser not started?)")
+    for status in report["error_samples"]:
+        print(f"   ⚠️ {status}")
+    print("=" * 60)
+
+def main():
+    parser = argparse.ArgumentParser(description="Fire concurrent /fetch searches at a running dashboard")
+    parser.add_argument("--base-url", default="http://127.0.0.1:5000")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--keyword", action="append", help="Repeat for several keywords (used round-robin)")
+    parser.add_argument("--location", default="India")
+    parser.add_argument("--platform", default="all", help="all, or one platform key (linkedin, naukri, sample)")
+    parser.add_argument("--profile", default="")
+    parser.add_argument("--deadline", type=float, default=120, help="Per-search time limit in seconds")
+    parser.add_argument("--sample-interval", type=float, default=2.0, help="Seconds between browser samples")
+    parser.add_argument("--shuffle", action="store_true", help="Randomise the order of searches")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+if __name__ == "__main__":
+    main()